@@ -0,0 +1,132 @@
+# type: ignore
+from __future__ import annotations
+
+from collections import UserDict
+
+import pytest
+
+from benchmarks.cases import make_elements
+from benchmarks.cases import run
+from ext_list import ExtList
+
+
+class Row:
+    def __init__(self, value: int, name: int):
+        self.value = value
+        self.name = name
+
+
+def bench_to_dict(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.to_dict(key)
+
+    def comprehension(elements, get_value):
+        return {get_value(element): element for element in elements}
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_to_dict_list(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.to_dict_list([key])
+
+    def comprehension(elements, get_value):
+        return [{'value': get_value(element)} for element in elements]
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_to_dict_with_complex_keys(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.to_dict_with_complex_keys([key, key])
+
+    def comprehension(elements, get_value):
+        return {(get_value(element), get_value(element)): element for element in elements}
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_group_by_key(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.group_by_key(key)
+
+    def comprehension(elements, get_value):
+        groups = {}
+
+        for element in elements:
+            groups.setdefault(get_value(element), []).append(element)
+
+        return groups
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_aggregate(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.aggregate(key, {'count': ('count',), 'total': ('sum', key)})
+
+    def comprehension(elements, get_value):
+        results = {}
+
+        for element in elements:
+            value = get_value(element)
+            count, total = results.get(value, (0, 0))
+            results[value] = (count + 1, total + value)
+
+        return {value: {'count': count, 'total': total} for value, (count, total) in results.items()}
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_rename_keys(benchmark, implementation, dict_case, size):
+    def use_ext_list(elements, key):
+        return elements.rename_keys({key: 'renamed'})
+
+    def comprehension(elements, get_value):
+        key = dict_case.key
+        renamed = []
+
+        for element in elements:
+            copied = element.copy()
+            copied['renamed'] = copied[key]
+            del copied[key]
+            renamed.append(copied)
+
+        return renamed
+
+    run(benchmark, implementation, use_ext_list, comprehension, dict_case.elements(size), dict_case)
+
+
+def bench_map_for_keys(benchmark, implementation, row_case, size):
+    def use_ext_list(elements, key):
+        return elements.map_for_keys([key], str)
+
+    def comprehension(elements, get_value):
+        key = row_case.key
+        mapped = []
+
+        for element in elements:
+            copied = element.copy()
+            copied[key] = str(copied[key])
+            mapped.append(copied)
+
+        return mapped
+
+    run(benchmark, implementation, use_ext_list, comprehension, row_case.elements(size), row_case)
+
+
+def bench_dicts_to_instances(benchmark, implementation, dict_case, size):
+    def use_ext_list(elements, key):
+        return elements.dicts_to_instances(Row)
+
+    def comprehension(elements, get_value):
+        return [Row(**element) for element in elements]
+
+    run(benchmark, implementation, use_ext_list, comprehension, dict_case.elements(size), dict_case)
+
+
+@pytest.mark.parametrize('deep', [False, True])
+def bench_rename_keys_user_dict(benchmark, deep, size):
+    elements = ExtList([UserDict(element, tags=[element['value']]) for element in make_elements('dict', size)])
+
+    benchmark(elements.rename_keys, {'value': 'renamed'}, deep=deep)
@@ -0,0 +1,101 @@
+# type: ignore
+from __future__ import annotations
+
+import heapq
+
+from benchmarks.cases import DISTINCT_VALUES
+from benchmarks.cases import run
+
+K = 10
+
+
+def bench_extract(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.extract(key)
+
+    def comprehension(elements, get_value):
+        return [get_value(element) for element in elements]
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_map(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.map(case.get_value)
+
+    def comprehension(elements, get_value):
+        return [get_value(element) for element in elements]
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_extract_duplicates(benchmark, implementation, hashable_case, size):
+    elements = hashable_case.elements(size)
+    other = elements[::2]
+
+    def use_ext_list(elements, key):
+        return elements.extract_duplicates(other)
+
+    def comprehension(elements, get_value):
+        other_set = set(other)
+        return [element for element in elements if element in other_set]
+
+    run(benchmark, implementation, use_ext_list, comprehension, elements, hashable_case)
+
+
+def bench_is_duplicate(benchmark, implementation, hashable_case, size):
+    def use_ext_list(elements, key):
+        return elements.is_duplicate()
+
+    def comprehension(elements, get_value):
+        return len(set(elements)) != len(elements)
+
+    run(benchmark, implementation, use_ext_list, comprehension, hashable_case.elements(size), hashable_case)
+
+
+def bench_sorted_by(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.sorted_by(key)
+
+    def comprehension(elements, get_value):
+        return sorted(elements, key=get_value)
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_top_k(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.top_k(key, K)
+
+    def comprehension(elements, get_value):
+        return heapq.nlargest(K, elements, key=get_value)
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_nth_by(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.nth_by(key, K)
+
+    def comprehension(elements, get_value):
+        return sorted(elements, key=get_value)[K]
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_join(benchmark, implementation, row_case, size):
+    elements = row_case.elements(size)
+    other = row_case.elements(DISTINCT_VALUES)
+
+    def use_ext_list(elements, key):
+        return list(elements.join(other, key))
+
+    def comprehension(elements, get_value):
+        table = {}
+
+        for other_element in other:
+            table.setdefault(get_value(other_element), []).append(other_element)
+
+        return [(element, match) for element in elements for match in table.get(get_value(element), ())]
+
+    run(benchmark, implementation, use_ext_list, comprehension, elements, row_case)
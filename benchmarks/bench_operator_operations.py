@@ -0,0 +1,89 @@
+# type: ignore
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.cases import run
+from benchmarks.cases import TARGET
+from benchmarks.cases import TARGETS
+from ext_list import ExtList
+from ext_list.predicates import and_
+from ext_list.predicates import eq
+from ext_list.predicates import gt
+from ext_list.predicates import lt
+from ext_list.predicates import or_
+
+OPERATIONS = {
+    'equal': (
+        lambda elements, key: elements.equal(key, TARGET),
+        lambda elements, get_value: [element for element in elements if get_value(element) == TARGET],
+    ),
+    'not_equal': (
+        lambda elements, key: elements.not_equal(key, TARGET),
+        lambda elements, get_value: [element for element in elements if get_value(element) != TARGET],
+    ),
+    'greater': (
+        lambda elements, key: elements.greater(key, TARGET),
+        lambda elements, get_value: [element for element in elements if get_value(element) > TARGET],
+    ),
+    'greater_or_equal': (
+        lambda elements, key: elements.greater_or_equal(key, TARGET),
+        lambda elements, get_value: [element for element in elements if get_value(element) >= TARGET],
+    ),
+    'less': (
+        lambda elements, key: elements.less(key, TARGET),
+        lambda elements, get_value: [element for element in elements if get_value(element) < TARGET],
+    ),
+    'less_or_equal': (
+        lambda elements, key: elements.less_or_equal(key, TARGET),
+        lambda elements, get_value: [element for element in elements if get_value(element) <= TARGET],
+    ),
+    'in_': (
+        lambda elements, key: elements.in_(key, TARGETS),
+        lambda elements, get_value: [element for element in elements if get_value(element) in TARGETS],
+    ),
+    'not_in_': (
+        lambda elements, key: elements.not_in_(key, TARGETS),
+        lambda elements, get_value: [element for element in elements if get_value(element) not in TARGETS],
+    ),
+    'between': (
+        lambda elements, key: elements.between(key, TARGETS[0], TARGETS[-1]),
+        lambda elements, get_value: [element for element in elements if TARGETS[0] <= get_value(element) <= TARGETS[-1]],
+    ),
+}
+
+
+@pytest.mark.parametrize('method', OPERATIONS)
+def bench_operator(benchmark, implementation, method, case, size):
+    use_ext_list, comprehension = OPERATIONS[method]
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+@pytest.mark.parametrize('method', ['equal', 'in_'])
+def bench_operator_with_index(benchmark, implementation, method, case, size):
+    elements = ExtList(case.elements(size))
+    elements.create_index(case.key)
+    use_ext_list, comprehension = OPERATIONS[method]
+
+    run(benchmark, implementation, use_ext_list, comprehension, elements, case)
+
+
+def bench_query(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.query().greater(key, TARGETS[0]).less(key, TARGETS[-1]).collect()
+
+    def comprehension(elements, get_value):
+        return [element for element in elements if get_value(element) > TARGETS[0] and get_value(element) < TARGETS[-1]]
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
+
+
+def bench_where(benchmark, implementation, case, size):
+    def use_ext_list(elements, key):
+        return elements.where(or_(and_(gt(key, TARGETS[0]), lt(key, TARGETS[-1])), eq(key, TARGET)))
+
+    def comprehension(elements, get_value):
+        return [element for element in elements if TARGETS[0] < get_value(element) < TARGETS[-1] or get_value(element) == TARGET]
+
+    run(benchmark, implementation, use_ext_list, comprehension, case.elements(size), case)
@@ -0,0 +1,25 @@
+# type: ignore
+from __future__ import annotations
+
+from benchmarks.cases import make_elements
+from ext_list import parallel
+from ext_list.parallel import PARALLEL_THRESHOLD
+
+CHUNKS = 16
+GROUPS = 1000
+
+
+def bench_group_by_key_parallel(benchmark, size):
+    elements = make_elements('int', max(size, PARALLEL_THRESHOLD))
+
+    benchmark(elements.group_by_key, int.bit_length, workers=4)
+
+
+def bench_merge_groups(benchmark, size):
+    chunk_size = max(size // CHUNKS, 1)
+
+    def partials():
+        # merge_groups extends the partial groups in place, so each round gets its own.
+        return ([{value: list(range(start + value, min(start + chunk_size, size), GROUPS)) for value in range(GROUPS)} for start in range(0, size, chunk_size)],), {}
+
+    benchmark.pedantic(parallel.merge_groups, setup=partials, rounds=5)
@@ -0,0 +1,122 @@
+# type: ignore
+from __future__ import annotations
+
+import operator
+from functools import lru_cache
+
+from ext_list import ExtList
+
+EXT_LIST = 'ext_list'
+COMPREHENSION = 'comprehension'
+
+IMPLEMENTATIONS = (EXT_LIST, COMPREHENSION)
+
+DEFAULT_SIZES = '1000,100000'
+
+# Values repeat every DISTINCT_VALUES elements, so equal(key, TARGET) selects one element in that many.
+DISTINCT_VALUES = 700
+TARGET = 300
+TARGETS = [100, 200, 300]
+
+
+class Item:
+    def __init__(self, value: int):
+        self.__value = value
+
+    @property
+    def value(self) -> int:
+        return self.__value
+
+
+class SlottedItem:
+    __slots__ = ('value',)
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+def item_value(item: Item) -> int:
+    return item.value
+
+
+def slotted_item_value(item: SlottedItem) -> int:
+    return item.value
+
+
+def int_value(value: int) -> int:
+    return value % DISTINCT_VALUES
+
+
+ELEMENT_FACTORIES = {
+    'object': lambda value: Item(value),
+    'slots': lambda value: SlottedItem(value),
+    'dict': lambda value: {'value': value, 'name': value + 1},
+    'list': lambda value: [value, value + 1],
+    'int': lambda value: value,
+}
+
+
+class Case:
+    """
+    A kind of element with a kind of key, and the getter a hand-written comprehension would use for that key.
+
+    Keys of dicts and lists are always indexes, since ExtList looks up any key on indexable elements by index.
+    """
+
+    def __init__(self, element_kind: str, key_kind: str, key, get_value):
+        self.element_kind = element_kind
+        self.key_kind = key_kind
+        self.key = key
+        self.get_value = get_value
+
+    def elements(self, size: int) -> ExtList:
+        return make_elements(self.element_kind, size)
+
+    def __repr__(self) -> str:
+        return f'{self.element_kind}-{self.key_kind}'
+
+
+CASES = [
+    Case('object', 'str', 'value', operator.attrgetter('value')),
+    Case('object', 'property', Item.value, operator.attrgetter('value')),
+    Case('object', 'callable', item_value, item_value),
+    Case('slots', 'str', 'value', operator.attrgetter('value')),
+    Case('slots', 'property', SlottedItem.value, operator.attrgetter('value')),
+    Case('slots', 'callable', slotted_item_value, slotted_item_value),
+    Case('dict', 'index', 'value', operator.itemgetter('value')),
+    Case('list', 'index', 0, operator.itemgetter(0)),
+    Case('int', 'property', int.real, operator.attrgetter('real')),
+    Case('int', 'callable', int_value, int_value),
+]
+
+CASES_BY_NAME = {repr(case): case for case in CASES}
+
+ROW_CASES = [case for case in CASES if case.element_kind in ('dict', 'list') and case.key_kind == 'index']
+
+DICT_CASES = [case for case in ROW_CASES if case.element_kind == 'dict']
+
+HASHABLE_CASES = [case for case in CASES if case.element_kind in ('object', 'slots', 'int') and case.key_kind == 'callable']
+
+
+@lru_cache(maxsize=None)
+def make_elements(element_kind: str, size: int) -> ExtList:
+    """
+    Builds `size` elements of the kind once per run. Benchmarks must not mutate the list they get.
+    """
+    factory = ELEMENT_FACTORIES[element_kind]
+
+    return ExtList([factory(position % DISTINCT_VALUES) for position in range(size)])
+
+
+def run(benchmark, implementation: str, use_ext_list, comprehension, elements: ExtList, case: Case):
+    """
+    Benchmarks `use_ext_list(elements, case.key)` or its baseline `comprehension(elements, case.get_value)`.
+    """
+    if implementation == EXT_LIST:
+        return benchmark(use_ext_list, elements, case.key)
+
+    return benchmark(comprehension, elements, case.get_value)
+
+
+def parse_sizes(sizes: str) -> list[int]:
+    return [int(size) for size in sizes.split(',')]
@@ -0,0 +1,89 @@
+# type: ignore
+"""
+Compares two pytest-benchmark JSON files and fails when an ExtList benchmark regressed.
+
+Each ExtList benchmark is measured as a ratio to its comprehension baseline from the same run, so a baseline stored on
+one machine can be compared against a run on another. Benchmarks without a baseline are compared by their own time.
+
+Usage:
+    python -m pytest -c benchmarks/pytest.ini benchmarks --benchmark-json=baseline.json
+    python -m pytest -c benchmarks/pytest.ini benchmarks --benchmark-json=current.json
+    python benchmarks/compare.py baseline.json current.json --threshold 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+EXT_LIST = 'ext_list'
+COMPREHENSION = 'comprehension'
+
+
+def load(path: str, stat: str) -> dict:
+    """
+    Returns the ExtList benchmarks of a JSON file, keyed by name and parameters, with their time relative to the
+    comprehension baseline when it was measured.
+    """
+    with open(path, encoding='utf-8') as file:
+        benchmarks = json.load(file)['benchmarks']
+
+    times = {}
+
+    for benchmark in benchmarks:
+        params = dict(benchmark.get('params') or {})
+        implementation = params.pop('implementation', EXT_LIST)
+        identity = (benchmark['name'].split('[')[0], tuple(sorted((name, str(value)) for name, value in params.items())))
+        times[identity, implementation] = benchmark['stats'][stat]
+
+    measures = {}
+
+    for (identity, implementation), time in times.items():
+        if implementation != EXT_LIST:
+            continue
+
+        baseline = times.get((identity, COMPREHENSION))
+        measures[identity] = time / baseline if baseline else time
+
+    return measures
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[tuple[tuple, float, float]]:
+    """
+    Returns `(benchmark, baseline measure, current measure)` for every benchmark slower by more than `threshold`.
+    """
+    return [
+        (identity, baseline[identity], measure)
+        for identity, measure in sorted(current.items())
+        if identity in baseline and measure > baseline[identity] * (1 + threshold)
+    ]
+
+
+def describe(identity: tuple) -> str:
+    name, params = identity
+    return f'{name}[{"-".join(value for _, value in params)}]'
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('baseline', help='pytest-benchmark JSON file to compare against')
+    parser.add_argument('current', help='pytest-benchmark JSON file of the run to check')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown as a fraction (default: 0.1)')
+    parser.add_argument('--stat', default='min', choices=('min', 'mean', 'median'), help='statistic to compare (default: min)')
+    args = parser.parse_args(argv)
+
+    baseline = load(args.baseline, args.stat)
+    current = load(args.current, args.stat)
+    regressions = compare(baseline, current, args.threshold)
+
+    for identity, before, after in regressions:
+        print(f'{describe(identity)}: {before:.3g} -> {after:.3g} ({after / before - 1:+.1%})')
+
+    compared = len(baseline.keys() & current.keys())
+    print(f'{len(regressions)} of {compared} benchmarks regressed by more than {args.threshold:.0%}')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
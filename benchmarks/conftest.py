@@ -0,0 +1,52 @@
+# type: ignore
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.cases import CASES
+from benchmarks.cases import CASES_BY_NAME
+from benchmarks.cases import DEFAULT_SIZES
+from benchmarks.cases import DICT_CASES
+from benchmarks.cases import HASHABLE_CASES
+from benchmarks.cases import IMPLEMENTATIONS
+from benchmarks.cases import parse_sizes
+from benchmarks.cases import ROW_CASES
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--sizes', default=DEFAULT_SIZES,
+        help=f'Comma-separated list sizes to benchmark (default: {DEFAULT_SIZES}). The full range is 1000,10000,100000,1000000,10000000.',
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        metafunc.parametrize('size', parse_sizes(metafunc.config.getoption('--sizes')))
+
+    for name, cases in (('case', CASES), ('row_case', ROW_CASES), ('dict_case', DICT_CASES), ('hashable_case', HASHABLE_CASES)):
+        if name in metafunc.fixturenames:
+            metafunc.parametrize(name, [repr(case) for case in cases], indirect=True)
+
+    if 'implementation' in metafunc.fixturenames:
+        metafunc.parametrize('implementation', IMPLEMENTATIONS)
+
+
+@pytest.fixture
+def case(request):
+    return CASES_BY_NAME[request.param]
+
+
+row_case = dict_case = hashable_case = case
+
+
+@pytest.fixture(autouse=True)
+def group_with_baseline(request):
+    """
+    Puts each ExtList benchmark in one group with its comprehension baseline, so the two are reported side by side.
+    """
+    if 'benchmark' not in request.fixturenames:
+        return
+
+    params = {name: value for name, value in request.node.callspec.params.items() if name != 'implementation'}
+    request.getfixturevalue('benchmark').group = f'{request.node.originalname}[{"-".join(str(value) for value in params.values())}]'
@@ -1,22 +1,39 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
 from typing import Any
 from typing import Callable
 from typing import Hashable
+from typing import Mapping
+from typing import Pattern
 from typing import TypeVar
 
 from typing_extensions import override
 from typing_extensions import SupportsIndex  # type: ignore
 
+from ext_list import base
+from ext_list.async_operations import _AsyncOperation
+from ext_list.async_operations import DEFAULT_CONCURRENCY
+from ext_list.columnar import ColumnarExtList
 from ext_list.dict_operations import _DictOperation  # type: ignore
+from ext_list.index import extend_indexes
+from ext_list.index import invalidate_indexes
+from ext_list.index_operations import _IndexOperation
+from ext_list.keys import compile_key  # noqa: F401
+from ext_list.keys import KeySpec
 from ext_list.list_operations import _ListOperation  # type: ignore
 from ext_list.operator_operations import _OperatorOperation  # type: ignore
+from ext_list.predicates import Predicate
+from ext_list.query import Query
+from ext_list.row_plan import RowPlan
+from ext_list.stream import ExtStream
+from ext_list.views import RowView  # noqa: F401
 
 T = TypeVar('T')
 TI = TypeVar('TI', bound=type)
 
 
-class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
+class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T], _IndexOperation[T], _AsyncOperation[T]):
     """
     Note:
         The following class is used to describe each method of ExtList:
@@ -42,16 +59,40 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
             ...
             ...     def __repr__(self):
             ...         return f'Person(\'{self.name}\', {self.age})'
+
+        Every method which takes a key also accepts a :class:`KeySpec` compiled by :func:`ext_list.keys.compile_key`,
+        which skips resolving the key on each call:
+
+            >>> age = compile_key(Person.age, Person('Alice', 25))
+            >>> ExtList([Person('Alice', 25), Person('Bob', 30)]).equal(age, 30)
+            [Person('Bob', 30)]
     """
 
     def __init__(self, iterable: list[T] = []) -> None:
         super().__init__(iterable)
+        self._element_shape: str = base.UNKNOWN
+        self._indexes: dict[tuple[Any, ...], Any] = {}
 
     @staticmethod
     def __validate_ext_list(iterable: Any) -> None:
         if not isinstance(iterable, ExtList):
             raise TypeError(f'Expected <class \'ExtList\'> but got {type(iterable)}')
 
+    def __forget_shape_after_removal(self) -> None:
+        if not self or self._element_shape == base.MIXED:
+            self._element_shape = base.UNKNOWN
+
+    def __copy__(self) -> ExtList[T]:
+        result = self.__class__(self)
+        result._element_shape = self._element_shape
+
+        return result
+
+    @ override
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        # Indexes hold positions of this list's elements and may hold unpicklable keys, so copies rebuild them.
+        return self.__class__, (list(self),)
+
     @ override
     def __add__(self, other: ExtList[T]) -> ExtList[T]:  # type: ignore[override]
         self.__validate_ext_list(other)
@@ -62,7 +103,10 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
         if not other:
             return self
 
-        return ExtList(super().__add__(other))
+        result = ExtList(super().__add__(other))
+        result._element_shape = base.merge_element_shapes(self._element_shape, other._element_shape)
+
+        return result
 
     @ override
     def __iadd__(self, other: ExtList[T]) -> ExtList[T]:  # type: ignore[override]
@@ -70,13 +114,18 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         if not self:
             super().__iadd__(other)
+            self._element_shape = other._element_shape
+            extend_indexes(self, 0)
             return other
 
         if not other:
             super().__iadd__(other)
             return self
 
+        start = len(self)
         super().__iadd__(other)
+        self._element_shape = base.merge_element_shapes(self._element_shape, other._element_shape)
+        extend_indexes(self, start)
 
         return self
 
@@ -84,9 +133,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
     def append(self, element: T) -> None:
         if not self:
             super().append(element)
+            self._element_shape = base.shape_of(element)
+            invalidate_indexes(self)
             return
 
         super().append(element)
+        self._element_shape = base.merge_element_shapes(self._element_shape, base.shape_of(element))
+        extend_indexes(self, len(self) - 1)
 
     @ override
     def extend(self, other: ExtList[T]) -> None:  # type: ignore[override]
@@ -95,23 +148,84 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         if not self:
             super().extend(other)
+            self._element_shape = other._element_shape
+            invalidate_indexes(self)
             return
 
         if not other:
             return
 
+        start = len(self)
         super().extend(other)
+        self._element_shape = base.merge_element_shapes(self._element_shape, other._element_shape)
+        extend_indexes(self, start)
 
     @ override
     def insert(self, index: SupportsIndex, element: T) -> None:
         if not self:
             super().insert(index, element)
+            self._element_shape = base.shape_of(element)
+            invalidate_indexes(self)
             return
 
         super().insert(index, element)
+        self._element_shape = base.merge_element_shapes(self._element_shape, base.shape_of(element))
+        invalidate_indexes(self)
+
+    @ override
+    def __setitem__(self, index: SupportsIndex | slice, value: Any) -> None:  # type: ignore[override]
+        super().__setitem__(index, value)
+        self._element_shape = base.UNKNOWN
+        invalidate_indexes(self)
+
+    @ override
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        super().__delitem__(index)
+        self.__forget_shape_after_removal()
+        invalidate_indexes(self)
+
+    @ override
+    def __imul__(self, value: SupportsIndex) -> ExtList[T]:  # type: ignore[override]
+        super().__imul__(value)
+        self.__forget_shape_after_removal()
+        invalidate_indexes(self)
+
+        return self
+
+    @ override
+    def pop(self, index: SupportsIndex = -1) -> T:
+        element = super().pop(index)
+        self.__forget_shape_after_removal()
+        invalidate_indexes(self)
+
+        return element
+
+    @ override
+    def remove(self, element: T) -> None:
+        super().remove(element)
+        self.__forget_shape_after_removal()
+        invalidate_indexes(self)
+
+    @ override
+    def clear(self) -> None:
+        super().clear()
+        self._element_shape = base.UNKNOWN
+        invalidate_indexes(self)
 
     @ override
-    def extract(self, key: Callable[[T, Any], Any] | property | str | Hashable, *args: Any) -> ExtList[Any]:
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        invalidate_indexes(self)
+
+    @ override
+    def reverse(self) -> None:
+        super().reverse()
+        invalidate_indexes(self)
+
+    @ override
+    def extract(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, workers: int | None = None, executor: str | Executor | None = None,
+    ) -> ExtList[Any]:
         """
         Extracts and returns a list of values associated with the given key from the objects.
 
@@ -119,6 +233,10 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
             key (Callable[[T, Any], Any] | property | str | Hashable): The key to extract values for. If the key is function,
                 the callable will be executed and its result will be returned.
             *args (Any): If key is a function, the arguments will be passed to the function.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
+                Only keys which are functions or method names are evaluated in the pool.
 
         Returns:
             ExtList[Any]: A list of values associated with the given key.
@@ -146,7 +264,7 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_ListOperation.extract`.
         """
-        return super().extract(key, *args)  # type: ignore[assignment]
+        return super().extract(key, *args, workers=workers, executor=executor)  # type: ignore[assignment]
 
     @ override
     def extract_duplicates(self, other: ExtList[T]) -> ExtList[T]:  # type: ignore
@@ -241,13 +359,18 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
         return super().first()
 
     @override
-    def map(self, function: Callable[[T, Any], Any] | type, *args: Any) -> ExtList[Any]:
+    def map(
+        self, function: Callable[[T, Any], Any] | type, *args: Any, workers: int | None = None, executor: str | Executor | None = None,
+    ) -> ExtList[Any]:
         """
         Apply a function or constructor to each element.
 
         Args:
             function (Callable[[T, Any], Any] | type): The function or type to apply to each element.
             *args (Any): Additional arguments to pass to the function or type.
+            workers (int | None): The number of workers to evaluate the function with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
 
         Returns:
             ExtList[Any]: A new ExtList containing the mapped values.
@@ -261,10 +384,418 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_ListOperation.map`.
         """
-        return super().map(function, *args)  # type: ignore[assignment]
+        return super().map(function, *args, workers=workers, executor=executor)  # type: ignore[assignment]
+
+    @override
+    def filter_inplace(self, function: Callable[..., Any], *args: Any) -> ExtList[T]:
+        """
+        Removes the elements for which the function returns a falsy value, keeping the list object.
+
+        Unlike building a filtered copy, the object itself is narrowed down, so references to it see the result. The
+        order of the remaining elements is kept.
+
+        Args:
+            function (Callable[..., Any]): The function to test each element with.
+            *args (Any): Additional arguments to pass to the function.
+
+        Returns:
+            ExtList[T]: The object itself.
+
+        Examples:
+            The following example demonstrates how to use the `filter_inplace` method.
+
+            >>> ext_list_1 = ExtList([1, 2, 3, 4])
+            >>> ext_list_1.filter_inplace(lambda x: x % 2 == 0)
+            [2, 4]
+            >>> ext_list_1
+            [2, 4]
+
+        Overrides :meth:`_ListOperation.filter_inplace`.
+        """
+        return super().filter_inplace(function, *args)  # type: ignore[assignment]
+
+    @override
+    def join(
+        self, other: list[Any], left_key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec | list[Any], right_key: Any = None, how: str = 'inner',
+        left_args: Any = (), right_args: Any = (), merge: bool = False,
+    ) -> ExtStream[Any]:
+        """
+        Joins the current object with another list on equal keys, using a hash table.
+
+        Args:
+            other (list[Any]): The list to join with.
+            left_key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec | list[Any]): The key of the current
+                object. A list of keys joins on the tuple of their values, as in `to_dict_with_complex_keys`.
+            right_key (Any): The key of `other`. If None, `left_key` and `left_args` are used for both lists.
+            how (str): `'inner'` yields a pair for each match. `'left'` also yields `(left, None)` for each object without
+                a match. `'semi'` yields each object which has a match, and `'anti'` each object which has none.
+            left_args (Any): If left_key is a function, the arguments will be passed to the function. For a list of keys,
+                a list of tuples of the arguments.
+            right_args (Any): The arguments of right_key, given as for left_args.
+            merge (bool): If True, the inner and left joins yield the union of the two dictionaries of each pair instead
+                of the pair.
+
+        Returns:
+            ExtStream[Any]: A lazy stream of the joined rows. For an inner join the hash table is built on the smaller
+            list and the rows come in the order of the larger one; otherwise they come in the order of the current object.
+
+        Raises:
+            ValueError: If how is not one of `'inner'`, `'left'`, `'semi'` or `'anti'`.
+            TypeError: If merge is True and the rows are not dictionaries.
+
+        Examples:
+            The following example demonstrates how to use the `join` method.
+
+            >>> people = ExtList([{'id': 1, 'name': 'Alice'}, {'id': 2, 'name': 'Bob'}, {'id': 3, 'name': 'Charlie'}])
+            >>> orders = ExtList([{'person_id': 1, 'item': 'pen'}, {'person_id': 1, 'item': 'ink'}, {'person_id': 3, 'item': 'cup'}])
+            >>> people.join(orders, 'id', 'person_id', merge=True).collect()
+            [{'id': 1, 'name': 'Alice', 'person_id': 1, 'item': 'pen'},
+             {'id': 1, 'name': 'Alice', 'person_id': 1, 'item': 'ink'},
+             {'id': 3, 'name': 'Charlie', 'person_id': 3, 'item': 'cup'}]
+
+            >>> people.join(orders, 'id', 'person_id', how='anti').collect()
+            [{'id': 2, 'name': 'Bob'}]
+
+        Overrides :meth:`_ListOperation.join`.
+        """
+        return super().join(other, left_key, right_key, how, left_args, right_args, merge)
+
+    @override
+    def top_k(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, k: int, *args: Any) -> ExtList[T]:
+        """
+        Returns the `k` objects with the largest values of the given key, largest first, in O(n log k) time.
+
+        The result is the same as the first `k` objects of `sorted_by(key, reverse=True)`.
+
+        Args:
+            key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key to compare values for. If the key is function,
+                the callable will be executed and its result will be returned.
+            k (int): The number of objects to return.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+
+        Returns:
+            ExtList[T]: The selected objects. If k is not positive or the object is empty, an empty ExtList is returned.
+
+        Examples:
+            The following example demonstrates how to use the `top_k` method.
+
+            >>> ext_list_1 = ExtList([Person('Alice', 25), Person('Bob', 30), Person('Charlie', 35)])
+            >>> ext_list_1.top_k(Person.age, 2)
+            [Person('Charlie', 35), Person('Bob', 30)]
+
+        Overrides :meth:`_ListOperation.top_k`.
+        """
+        return super().top_k(key, k, *args)  # type: ignore[return-value]
+
+    @override
+    def bottom_k(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, k: int, *args: Any) -> ExtList[T]:
+        """
+        Returns the `k` objects with the smallest values of the given key, smallest first, in O(n log k) time.
+
+        The result is the same as the first `k` objects of `sorted_by(key)`. With a sorted index on the key, the objects
+        are read from the index.
+
+        Args:
+            key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key to compare values for. If the key is function,
+                the callable will be executed and its result will be returned.
+            k (int): The number of objects to return.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+
+        Returns:
+            ExtList[T]: The selected objects. If k is not positive or the object is empty, an empty ExtList is returned.
+
+        Examples:
+            The following example demonstrates how to use the `bottom_k` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Charlie', 'age': 35}])
+            >>> ext_list_1.bottom_k('age', 1)
+            [{'name': 'Alice', 'age': 25}]
+
+        Overrides :meth:`_ListOperation.bottom_k`.
+        """
+        return super().bottom_k(key, k, *args)  # type: ignore[return-value]
+
+    @override
+    def nth_by(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, n: int, *args: Any) -> T:
+        """
+        Returns the object at position `n` of the objects sorted by the given key, without sorting them all.
+
+        Args:
+            key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key to compare values for. If the key is function,
+                the callable will be executed and its result will be returned.
+            n (int): The zero-based position in ascending order.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+
+        Returns:
+            T: The object at position n of `sorted_by(key)`.
+
+        Raises:
+            IndexError: If n is negative or not less than the length of the object.
+
+        Examples:
+            The following example demonstrates how to use the `nth_by` method.
+
+            >>> ext_list_1 = ExtList([Person('Alice', 25), Person('Bob', 30), Person('Charlie', 35)])
+            >>> ext_list_1.nth_by(Person.age, 1)
+            Person('Bob', 30)
+
+        Overrides :meth:`_ListOperation.nth_by`.
+        """
+        return super().nth_by(key, n, *args)
+
+    @override
+    def sort_by(
+        self, keys: list[Callable[[T, Any], Any] | property | str | Hashable] | Callable[[T, Any], Any] | property | str | Hashable, reverse: bool | list[bool] = False,
+        arg_tuples: list[tuple[Any, ...]] = [], cache: bool = False,
+    ) -> None:
+        """
+        Sorts the current object in place by one or more keys. The sort is stable.
+
+        The value of each key is computed once per element. With `cache`, the computed values are kept with the object
+        and reordered along with it, so sorting again by the same keys does not compute them again until the object is
+        modified other than by appending. The cached values are not updated when an element is modified in place, so
+        only cache keys of elements which do not change. Up to :data:`ext_list.index.SORT_KEY_CACHE_SIZE` key lists are
+        cached per object, dropping the least recently used. Sorting ascending by a single key with a sorted index reads
+        the order from the index.
+
+        Args:
+            keys (List[Callable[[T, Any], Any] | property | str | Hashable] | Callable[[T, Any], Any] | property | str | Hashable):
+                The key or the list of keys to sort by, as in `to_dict_with_complex_keys`.
+            reverse (bool | List[bool]): Whether to sort in descending order, for all keys or for each key.
+            arg_tuples (List[Tuple[Any, ...]]): A list of tuples of the arguments. If key is a function, the arguments will be passed to the function.
+            cache (bool): Whether to keep the computed values of the keys for the next sort by the same keys.
+
+        Raises:
+            ValueError: If reverse is a list whose length differs from the number of keys.
+
+        Examples:
+            The following example demonstrates how to use the `sort_by` method.
+
+            >>> ext_list_1 = ExtList([Person('Bob', 30), Person('Alice', 30), Person('Charlie', 25)])
+            >>> ext_list_1.sort_by([Person.age, Person.name], reverse=[True, False])
+            >>> ext_list_1
+            [Person('Alice', 30), Person('Bob', 30), Person('Charlie', 25)]
+
+        Overrides :meth:`_ListOperation.sort_by`.
+        """
+        super().sort_by(keys, reverse, arg_tuples, cache)
+
+    @override
+    def sorted_by(
+        self, keys: list[Callable[[T, Any], Any] | property | str | Hashable] | Callable[[T, Any], Any] | property | str | Hashable, reverse: bool | list[bool] = False,
+        arg_tuples: list[tuple[Any, ...]] = [], cache: bool = False,
+    ) -> ExtList[T]:
+        """
+        Returns a new list of the objects sorted by one or more keys, as `sort_by` sorts them.
+
+        Args:
+            keys (List[Callable[[T, Any], Any] | property | str | Hashable] | Callable[[T, Any], Any] | property | str | Hashable):
+                The key or the list of keys to sort by, as in `to_dict_with_complex_keys`.
+            reverse (bool | List[bool]): Whether to sort in descending order, for all keys or for each key.
+            arg_tuples (List[Tuple[Any, ...]]): A list of tuples of the arguments. If key is a function, the arguments will be passed to the function.
+            cache (bool): Whether to keep the computed values of the keys with the current object, as in `sort_by`.
+
+        Returns:
+            ExtList[T]: The sorted objects.
+
+        Raises:
+            ValueError: If reverse is a list whose length differs from the number of keys.
+
+        Examples:
+            The following example demonstrates how to use the `sorted_by` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Bob', 'age': 30}, {'name': 'Alice', 'age': 25}])
+            >>> ext_list_1.sorted_by('age')
+            [{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}]
+
+        Overrides :meth:`_ListOperation.sorted_by`.
+        """
+        return super().sorted_by(keys, reverse, arg_tuples, cache)  # type: ignore[return-value]
+
+    @override
+    def query(self) -> Query[T]:
+        """
+        Returns a lazy query over the current object.
+
+        Filters and projections called on the query are only recorded. When a terminal method such as `collect`,
+        `to_dict` or `group_by_key` is called, consecutive filters run as one fused pass over the list instead of one
+        pass and one intermediate list per filter. The results are the same as chaining the eager methods.
+
+        Returns:
+            Query[T]: A query whose source is the current object.
+
+        Examples:
+            The following example demonstrates how to use the `query` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Charlie', 'age': 35}])
+            >>> ext_list_1.query().greater('age', 25).not_equal('name', 'Charlie').extract('name').collect()
+            ['Bob']
+
+            >>> ext_list_1.query().in_('name', ['Alice', 'Bob']).to_dict('name')
+            {'Alice': {'name': 'Alice', 'age': 25}, 'Bob': {'name': 'Bob', 'age': 30}}
+
+        Overrides :meth:`_ListOperation.query`.
+        """
+        return super().query()
+
+    @override
+    def stream(self) -> ExtStream[T]:
+        """
+        Returns a lazy stream over the current object.
+
+        The query methods of the stream yield matching elements one at a time instead of building a new ExtList, which
+        keeps peak memory flat when filtering large lists. :class:`ExtStream` can also wrap any other iterable.
+
+        Returns:
+            ExtStream[T]: A stream whose source is the current object.
+
+        Examples:
+            The following example demonstrates how to use the `stream` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Charlie', 'age': 35}])
+            >>> for name in ext_list_1.stream().greater('age', 25).extract('name'):
+            ...     print(name)
+            Bob
+            Charlie
+
+        Overrides :meth:`_ListOperation.stream`.
+        """
+        return super().stream()
+
+    @override
+    async def amap(self, function: Callable[..., Any], *args: Any, concurrency: int = DEFAULT_CONCURRENCY, timeout: float | None = None) -> ExtList[Any]:
+        """
+        Apply a coroutine function to each element, running at most `concurrency` calls at a time.
+
+        Args:
+            function (Callable[..., Any]): The function to apply to each element. Awaitable results are awaited, so both
+                coroutine functions and plain functions can be used.
+            *args (Any): Additional arguments to pass to the function.
+            concurrency (int): The maximum number of calls in flight.
+            timeout (float | None): The number of seconds after which the remaining calls are cancelled.
+
+        Returns:
+            ExtList[Any]: A new ExtList containing the results, in the order of the elements.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            asyncio.TimeoutError: If the calls do not finish within timeout.
+
+        Examples:
+            The following example demonstrates how to use the `amap` method.
+
+            >>> async def lookup_age(name):
+            ...     return {'Alice': 25, 'Bob': 30}[name]
+            >>> await ExtList(['Alice', 'Bob']).amap(lookup_age, concurrency=8)
+            [25, 30]
+
+        Overrides :meth:`_AsyncOperation.amap`.
+        """
+        return await super().amap(function, *args, concurrency=concurrency, timeout=timeout)  # type: ignore[return-value]
+
+    @override
+    async def aextract(
+        self, key: Callable[..., Any] | property | str | Hashable | KeySpec, *args: Any, concurrency: int = DEFAULT_CONCURRENCY, timeout: float | None = None,
+    ) -> ExtList[Any]:
+        """
+        Extracts the values of the given key from the objects, awaiting the values which are awaitable.
+
+        Args:
+            key (Callable[..., Any] | property | str | Hashable | KeySpec): The key to extract values for. If the key is a
+                coroutine function, its calls run at most `concurrency` at a time.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+            concurrency (int): The maximum number of calls in flight.
+            timeout (float | None): The number of seconds after which the remaining calls are cancelled.
+
+        Returns:
+            ExtList[Any]: A list of values associated with the given key.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            asyncio.TimeoutError: If the calls do not finish within timeout.
+
+        Examples:
+            The following example demonstrates how to use the `aextract` method.
+
+            >>> async def get_age(person):
+            ...     return person.age
+            >>> await ExtList([Person('Alice', 25), Person('Bob', 30)]).aextract(get_age)
+            [25, 30]
+
+        Overrides :meth:`_AsyncOperation.aextract`.
+        """
+        return await super().aextract(key, *args, concurrency=concurrency, timeout=timeout)  # type: ignore[return-value]
 
     @override
-    def equal(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: Any, *args: Any) -> ExtList[T]:
+    async def afilter(self, function: Callable[..., Any], *args: Any, concurrency: int = DEFAULT_CONCURRENCY, timeout: float | None = None) -> ExtList[T]:
+        """
+        Returns a list of objects for which the given predicate returns a truthy value, awaiting the results which are awaitable.
+
+        Args:
+            function (Callable[..., Any]): The predicate, typically a coroutine function.
+            *args (Any): Additional arguments to pass to the predicate.
+            concurrency (int): The maximum number of calls in flight.
+            timeout (float | None): The number of seconds after which the remaining calls are cancelled.
+
+        Returns:
+            ExtList[T]: A list of objects for which the predicate holds, in the order of the elements.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            asyncio.TimeoutError: If the calls do not finish within timeout.
+
+        Examples:
+            The following example demonstrates how to use the `afilter` method.
+
+            >>> async def is_over_28(person):
+            ...     return person.age > 28
+            >>> await ExtList([Person('Alice', 25), Person('Bob', 30)]).afilter(is_over_28)
+            [Person('Bob', 30)]
+
+        Overrides :meth:`_AsyncOperation.afilter`.
+        """
+        return await super().afilter(function, *args, concurrency=concurrency, timeout=timeout)  # type: ignore[return-value]
+
+    @override
+    async def aequal(
+        self, key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any,
+        concurrency: int = DEFAULT_CONCURRENCY, timeout: float | None = None,
+    ) -> ExtList[T]:
+        """
+        Returns a list of objects that have the given key set to the given value, awaiting the values which are awaitable.
+
+        Args:
+            key (Callable[..., Any] | property | str | Hashable | KeySpec): The key to compare values for. If the key is a
+                coroutine function, its calls run at most `concurrency` at a time.
+            compare_target (Any): The value to compare the objects' values to.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+            concurrency (int): The maximum number of calls in flight.
+            timeout (float | None): The number of seconds after which the remaining calls are cancelled.
+
+        Returns:
+            ExtList[T]: A list of objects that have the given key set to the given value.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            asyncio.TimeoutError: If the calls do not finish within timeout.
+
+        Examples:
+            The following example demonstrates how to use the `aequal` method.
+
+            >>> async def get_age(person):
+            ...     return person.age
+            >>> await ExtList([Person('Alice', 25), Person('Bob', 30)]).aequal(get_age, 25)
+            [Person('Alice', 25)]
+
+        Overrides :meth:`_AsyncOperation.aequal`.
+        """
+        return await super().aequal(key, compare_target, *args, concurrency=concurrency, timeout=timeout)  # type: ignore[return-value]
+
+    @override
+    def equal(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any,
+        engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None, inplace: bool = False,
+    ) -> ExtList[T]:
         """
         Returns a list of objects that have the given key set to the given value.
 
@@ -273,6 +804,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
                 the callable will be executed and its result will be returned.
             compare_target (Any): The value to compare the objects' values to.
             *args (Any): If key is a function, the arguments will be passed to the function.
+            engine (str | None): `'python'` or `'numpy'`. If None, the default engine set by :func:`ext_list.engine.set_default_engine` is used.
+                The NumPy engine compares numeric key values as an array, and falls back to Python when that could change the result.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
+                Only keys which are functions or method names are evaluated in the pool.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
 
         Returns:
             ExtList[T]: A list of objects that have the given key set to the given value. If no objects are found or the object
@@ -299,12 +837,20 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
             >>> ext_list_3.equals(Person.get_age_n_years_ago, 20, 5)
             [Person('Alice', 25)]
 
+            >>> ext_list_3.equal(Person.age, 30, inplace=True)
+            [Person('Bob', 30), Person('David', 30)]
+            >>> ext_list_3
+            [Person('Bob', 30), Person('David', 30)]
+
         Overrides :meth:`_OperatorOperation.equal`.
         """
-        return super().equal(key, compare_target, *args)  # type: ignore[assignment]
+        return super().equal(key, compare_target, *args, engine=engine, workers=workers, executor=executor, inplace=inplace)  # type: ignore[assignment]
 
     @override
-    def not_equal(self, key: Callable[[T, Any], Any] | property | Hashable, compare_target: Any, *args: Any) -> ExtList[T]:
+    def not_equal(
+        self, key: Callable[[T, Any], Any] | property | Hashable | KeySpec, compare_target: Any, *args: Any,
+        engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None, inplace: bool = False,
+    ) -> ExtList[T]:
         """
         Returns a list of objects that do not have the given key set to the given value.
 
@@ -316,6 +862,15 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
             *args (Any): If key is a function, the arguments will be passed to the function.
 
+            engine (str | None): `'python'` or `'numpy'`. If None, the default engine set by :func:`ext_list.engine.set_default_engine` is used.
+                The NumPy engine compares numeric key values as an array, and falls back to Python when that could change the result.
+
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
+                Only keys which are functions or method names are evaluated in the pool.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
+
         Returns:
             ExtList[T]: A list of objects that do not have the given key set to the given value.
             If no objects are found or the object is empty, an empty ExtList is returned.
@@ -343,10 +898,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_OperatorOperation.not_equal`.
         """
-        return super().not_equal(key, compare_target, *args)  # type: ignore[assignment]
+        return super().not_equal(key, compare_target, *args, engine=engine, workers=workers, executor=executor, inplace=inplace)  # type: ignore[assignment]
 
     @override
-    def greater(self, key: Callable[[T, Any], Any] | property | Hashable, compare_target: Any, *args: Any) -> ExtList[T]:
+    def greater(
+        self, key: Callable[[T, Any], Any] | property | Hashable | KeySpec, compare_target: Any, *args: Any,
+        engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None, inplace: bool = False,
+    ) -> ExtList[T]:
         """
         Return a list of objects that are greater than the specified compare_target, when the
         object is passed through the provided key function, property or hashable key.
@@ -356,6 +914,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
                 the callable will be executed and its result will be returned.
             compare_target (Any): The value to compare against.
             *args (Any): If key is a function, the arguments will be passed to the function.
+            engine (str | None): `'python'` or `'numpy'`. If None, the default engine set by :func:`ext_list.engine.set_default_engine` is used.
+                The NumPy engine compares numeric key values as an array, and falls back to Python when that could change the result.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
+                Only keys which are functions or method names are evaluated in the pool.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
 
         Returns:
             List[T]: A list of objects that are greater than the compare_target, when the
@@ -377,10 +942,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_OperatorOperation.greater`.
         """
-        return super().greater(key, compare_target, *args)  # type: ignore[assignment]
+        return super().greater(key, compare_target, *args, engine=engine, workers=workers, executor=executor, inplace=inplace)  # type: ignore[assignment]
 
     @override
-    def greater_or_equal(self, key: Callable[[T, Any], Any] | property | Hashable, compare_target: Any, *args: Any) -> ExtList[T]:
+    def greater_or_equal(
+        self, key: Callable[[T, Any], Any] | property | Hashable | KeySpec, compare_target: Any, *args: Any,
+        engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None, inplace: bool = False,
+    ) -> ExtList[T]:
         """
         Return a list of objects that are greater than or equal the specified compare_target, when the
         object is passed through the provided key function, property or hashable key.
@@ -390,6 +958,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
                 the callable will be executed and its result will be returned.
             compare_target (Any): The value to compare against.
             *args (Any): Additional arguments to be passed to the key function.
+            engine (str | None): `'python'` or `'numpy'`. If None, the default engine set by :func:`ext_list.engine.set_default_engine` is used.
+                The NumPy engine compares numeric key values as an array, and falls back to Python when that could change the result.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
+                Only keys which are functions or method names are evaluated in the pool.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
 
         Returns:
             List[T]: A list of objects that are greater than or equal the compare_target, when the
@@ -411,10 +986,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_OperatorOperation.greater_or_equal`.
         """
-        return super().greater_or_equal(key, compare_target, *args)  # type: ignore[assignment]
+        return super().greater_or_equal(key, compare_target, *args, engine=engine, workers=workers, executor=executor, inplace=inplace)  # type: ignore[assignment]
 
     @override
-    def less(self, key: Callable[[T, Any], Any] | property | Hashable, compare_target: Any, *args: Any) -> ExtList[T]:
+    def less(
+        self, key: Callable[[T, Any], Any] | property | Hashable | KeySpec, compare_target: Any, *args: Any,
+        engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None, inplace: bool = False,
+    ) -> ExtList[T]:
         """
         Return a list of objects that are less than the specified compare_target, when the
         object is passed through the provided key function, property or hashable key.
@@ -424,6 +1002,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
                 the callable will be executed and its result will be returned.
             compare_target (Any): The value to compare against.
             *args (Any): Additional arguments to be passed to the key function.
+            engine (str | None): `'python'` or `'numpy'`. If None, the default engine set by :func:`ext_list.engine.set_default_engine` is used.
+                The NumPy engine compares numeric key values as an array, and falls back to Python when that could change the result.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
+                Only keys which are functions or method names are evaluated in the pool.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
 
         Returns:
             List[T]: A list of objects that are less than the compare_target, when the
@@ -445,10 +1030,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_OperatorOperation.less`.
         """
-        return super().less(key, compare_target, *args)  # type: ignore[assignment]
+        return super().less(key, compare_target, *args, engine=engine, workers=workers, executor=executor, inplace=inplace)  # type: ignore[assignment]
 
     @override
-    def less_or_equal(self, key: Callable[[T, Any], Any] | property | Hashable, compare_target: Any, *args: Any) -> ExtList[T]:
+    def less_or_equal(
+        self, key: Callable[[T, Any], Any] | property | Hashable | KeySpec, compare_target: Any, *args: Any,
+        engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None, inplace: bool = False,
+    ) -> ExtList[T]:
         """
         Return a list of objects that are less than or equal the specified compare_target, when the
         object is passed through the provided key function, property or hashable key.
@@ -458,6 +1046,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
                 the callable will be executed and its result will be returned.
             compare_target (Any): The value to compare against.
             *args (Any): Additional arguments to be passed to the key function.
+            engine (str | None): `'python'` or `'numpy'`. If None, the default engine set by :func:`ext_list.engine.set_default_engine` is used.
+                The NumPy engine compares numeric key values as an array, and falls back to Python when that could change the result.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
+                Only keys which are functions or method names are evaluated in the pool.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
 
         Returns:
             List[T]: A list of objects that are less than or equal the compare_target, when the
@@ -479,10 +1074,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_OperatorOperation.less_or_equal`.
         """
-        return super().less_or_equal(key, compare_target, *args)  # type: ignore[assignment]
+        return super().less_or_equal(key, compare_target, *args, engine=engine, workers=workers, executor=executor, inplace=inplace)  # type: ignore[assignment]
 
     @override
-    def in_(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: list[Any], *args: Any) -> ExtList[T]:
+    def in_(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: list[Any], *args: Any,
+        engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None, inplace: bool = False,
+    ) -> ExtList[T]:
         """
         Returns a list of objects that have the given key set to one of the given values.
 
@@ -491,6 +1089,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
                 the callable will be executed and its result will be returned.
             compare_targets (list): A list of values to compare the objects' values to.
             *args Any: If key is a function, the arguments will be passed to the function.
+            engine (str | None): `'python'` or `'numpy'`. If None, the default engine set by :func:`ext_list.engine.set_default_engine` is used.
+                The NumPy engine compares numeric key values as an array, and falls back to Python when that could change the result.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
+                Only keys which are functions or method names are evaluated in the pool.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
 
         Returns:
             ExtList[T]: A list of objects that have the given key set to one of the given values. If no objects are found or
@@ -519,10 +1124,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_OperatorOperation.in_`.
         """
-        return super().in_(key, compare_target, *args)  # type: ignore[assignment]
+        return super().in_(key, compare_target, *args, engine=engine, workers=workers, executor=executor, inplace=inplace)  # type: ignore[assignment]
 
     @override
-    def not_in_(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: list[Any], *args: Any) -> ExtList[T]:
+    def not_in_(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: list[Any], *args: Any,
+        engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None, inplace: bool = False,
+    ) -> ExtList[T]:
         """
         Returns a list of objects that do not have the given key set to any of the given values.
 
@@ -531,6 +1139,13 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
                 the callable will be executed and its result will be returned.
             compare_targets (list): A list of values to compare the objects' values to.
             *args (Any): If key is a function, the arguments will be passed to the function.
+            engine (str | None): `'python'` or `'numpy'`. If None, the default engine set by :func:`ext_list.engine.set_default_engine` is used.
+                The NumPy engine compares numeric key values as an array, and falls back to Python when that could change the result.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, the object is split into chunks which are evaluated in a pool.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
+                Only keys which are functions or method names are evaluated in the pool.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
 
         Returns:
             ExtList[T]: A list of objects that do not have the given key set to any of the given values. If no objects are
@@ -559,10 +1174,168 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_OperatorOperation.not_in_`.
         """
-        return super().not_in_(key, compare_target, *args)  # type: ignore[assignment]
+        return super().not_in_(key, compare_target, *args, engine=engine, workers=workers, executor=executor, inplace=inplace)  # type: ignore[assignment]
+
+    @override
+    def between(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, lower: Any, upper: Any, *args: Any, inclusive: str = 'both', inplace: bool = False,
+    ) -> ExtList[T]:
+        """
+        Returns a list of objects whose value for the given key lies between `lower` and `upper`.
+
+        Args:
+            key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key to compare values for. If the key is function,
+                the callable will be executed and its result will be returned.
+            lower (Any): The lower bound.
+            upper (Any): The upper bound.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+            inclusive (str): Which bounds are included, one of `'both'`, `'neither'`, `'left'` or `'right'`.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
+
+        Returns:
+            ExtList[T]: A list of objects whose value lies between the bounds, in list order.
+
+        Raises:
+            ValueError: If `inclusive` is not one of the accepted values.
+
+        Examples:
+            The following example demonstrates how to use the `between` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Charlie', 'age': 35}])
+            >>> ext_list_1.between('age', 25, 30)
+            [{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}]
+
+            >>> ext_list_1.between('age', 25, 30, inclusive='right')
+            [{'name': 'Bob', 'age': 30}]
+
+        Overrides :meth:`_OperatorOperation.between`.
+        """
+        return super().between(key, lower, upper, *args, inclusive=inclusive, inplace=inplace)  # type: ignore[assignment]
+
+    @override
+    def startswith(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, prefix: str | tuple[str, ...], *args: Any, inplace: bool = False,
+    ) -> ExtList[T]:
+        """
+        Returns a list of objects whose value for the given key starts with `prefix`.
+
+        Args:
+            key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key to test values for. If the key is function,
+                the callable will be executed and its result will be returned.
+            prefix (str | tuple[str, ...]): The prefix, or a tuple of prefixes any of which may match.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
+
+        Returns:
+            ExtList[T]: A list of objects whose value starts with the prefix, in list order.
+
+        Examples:
+            The following example demonstrates how to use the `startswith` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Albert', 'age': 35}])
+            >>> ext_list_1.startswith('name', 'Al')
+            [{'name': 'Alice', 'age': 25}, {'name': 'Albert', 'age': 35}]
+
+        Overrides :meth:`_OperatorOperation.startswith`.
+        """
+        return super().startswith(key, prefix, *args, inplace=inplace)  # type: ignore[assignment]
+
+    @override
+    def regex(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, pattern: str | Pattern[str], *args: Any, flags: int = 0, inplace: bool = False,
+    ) -> ExtList[T]:
+        """
+        Returns a list of objects whose value for the given key contains a match of the regular expression `pattern`.
+
+        Args:
+            key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key to test values for. If the key is function,
+                the callable will be executed and its result will be returned.
+            pattern (str | Pattern[str]): The regular expression, searched for anywhere in the value as :func:`re.search` does.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+            flags (int): The flags to compile `pattern` with. They cannot be given with a compiled pattern.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
+
+        Returns:
+            ExtList[T]: A list of objects whose value matches the pattern, in list order.
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression.
+
+        Examples:
+            The following example demonstrates how to use the `regex` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Charlie', 'age': 35}])
+            >>> ext_list_1.regex('name', '^[AB]')
+            [{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}]
+
+        Overrides :meth:`_OperatorOperation.regex`.
+        """
+        return super().regex(key, pattern, *args, flags=flags, inplace=inplace)  # type: ignore[assignment]
+
+    @override
+    def is_none(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, inplace: bool = False) -> ExtList[T]:
+        """
+        Returns a list of objects whose value for the given key is None.
+
+        Args:
+            key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key to test values for. If the key is function,
+                the callable will be executed and its result will be returned.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
+
+        Returns:
+            ExtList[T]: A list of objects whose value is None, in list order.
+
+        Examples:
+            The following example demonstrates how to use the `is_none` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'graduated': None}, {'name': 'Bob', 'graduated': False}])
+            >>> ext_list_1.is_none('graduated')
+            [{'name': 'Alice', 'graduated': None}]
+
+        Overrides :meth:`_OperatorOperation.is_none`.
+        """
+        return super().is_none(key, *args, inplace=inplace)  # type: ignore[assignment]
 
     @override
-    def to_dict(self, key: Callable[[T, Any], Any] | property | str | Hashable, *args: Any) -> dict[Hashable, T]:
+    def where(self, predicate: Predicate, inplace: bool = False) -> ExtList[T]:
+        """
+        Returns a list of objects which satisfy a predicate built with :mod:`ext_list.predicates`.
+
+        The predicate is compiled into a single test, so the list is scanned once however many conditions it combines.
+        `and_` and `or_` stop at the first operand which decides the result, and operands which read their values
+        cheaply are tested first. When an operand of the outermost `and_` is served by an index of the object, only the
+        positions it holds are tested.
+
+        Args:
+            predicate (Predicate): The condition, such as `and_(eq('a', 1), or_(gt('b', 2), is_none('c')))`.
+            inplace (bool): If True, the object itself is narrowed down to the matching objects and returned, instead of a new ExtList.
+
+        Returns:
+            ExtList[T]: A list of objects which satisfy the predicate, in list order.
+
+        Raises:
+            TypeError: If `predicate` is not a Predicate.
+
+        Examples:
+            The following example demonstrates how to use the `where` method.
+
+            >>> from ext_list.predicates import and_, eq, gt, or_, lt
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Charlie', 'age': 35}])
+            >>> ext_list_1.where(or_(lt('age', 30), and_(gt('age', 30), eq('name', 'Charlie'))))
+            [{'name': 'Alice', 'age': 25}, {'name': 'Charlie', 'age': 35}]
+
+            >>> ext_list_1.where(gt('age', 25) & ~eq('name', 'Charlie'))
+            [{'name': 'Bob', 'age': 30}]
+
+        Overrides :meth:`_OperatorOperation.where`.
+        """
+        return super().where(predicate, inplace=inplace)  # type: ignore[assignment]
+
+    @override
+    def to_dict(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, workers: int | None = None, executor: str | Executor | None = None,
+    ) -> dict[Hashable, T]:
         """
         Converts the current object to a dictionary, using the given key as the dictionary key.
 
@@ -570,6 +1343,10 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
             key (Callable[[T, Any], Any] | property | str | Hashable): The key to use as the dictionary key. If the key is function,
                 the callable will be executed and its result will be returned.
             *args Any: If key is a function, the arguments will be passed to the function.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, each chunk of the object is mapped in a pool and the partial results are
+                merged in list order, so the result is the same as the serial one.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
 
         Returns:
             dict[Hashable, T]: A dictionary of objects, using the given key as the dictionary key.
@@ -594,19 +1371,23 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_DictOperation.to_dict`.
         """
-        return super().to_dict(key, *args)  # type: ignore[assignment]
+        return super().to_dict(key, *args, workers=workers, executor=executor)  # type: ignore[assignment]
 
     @override
-    def to_dict_list(self, keys: list[Callable[[T, Any], Any] | property | str | Hashable], arg_tuples: list[tuple[Any, ...]] = []) -> ExtList[dict[str | Hashable, Any]]:
+    def to_dict_list(
+        self, keys: list[Callable[[T, Any], Any] | property | str | Hashable] | RowPlan, arg_tuples: list[tuple[Any, ...]] = [], view: bool = False,
+    ) -> ExtList[dict[str | Hashable, Any]]:
         """
         Converts the objects into a list of dictionaries, where each dictionary contains the specified keys
         and their corresponding values from the object.
 
         Args:
-            keys (list[Callable[[T, Any], Any] | property | str | Hashable]): A list of keys to include in the dictionaries. Each key can
-                be a function, property, string, or hashable object.
+            keys (list[Callable[[T, Any], Any] | property | str | Hashable] | RowPlan): A list of keys to include in the dictionaries. Each key can
+                be a function, property, string, or hashable object. A :class:`RowPlan` compiled from the keys can be passed instead.
             arg_tuples (list[tuple[Any, ...]], optional): A list of argument tuples. Each tuple contains the arguments to be
                 passed to the corresponding key function or property. Defaults to an empty list.
+            view (bool): If True, each element is wrapped in a :class:`RowView` which reads the keys from it when they are
+                accessed, instead of being copied into a new dictionary.
 
         Returns:
             ExtList[dict[str | Hashable, Any]]: A list of dictionaries, where each dictionary represents an element and contains
@@ -629,15 +1410,18 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_DictOperation.to_dict_list`.
         """
-        return super().to_dict_list(keys, arg_tuples)  # type: ignore[assignment]
+        return super().to_dict_list(keys, arg_tuples, view)  # type: ignore[assignment]
 
     @override
-    def to_dict_with_complex_keys(self, keys: list[Callable[[T, Any], Any] | property | str] | list[Hashable], arg_tuples: list[tuple[Any, ...]] = []) -> dict[tuple[Any, ...], T]:
+    def to_dict_with_complex_keys(
+        self, keys: list[Callable[[T, Any], Any] | property | str] | list[Hashable] | RowPlan, arg_tuples: list[tuple[Any, ...]] = [],
+    ) -> dict[tuple[Any, ...], T]:
         """
         Returns a dictionary of the objects in the `ExtList` with complex keys.
 
         Args:
-            keys (List[Callable[[T, Any], Any] | property | str] | List[Hashable]): A list of the keys for the dictionary.
+            keys (List[Callable[[T, Any], Any] | property | str] | List[Hashable] | RowPlan): A list of the keys for the dictionary.
+                A :class:`RowPlan` compiled from the keys can be passed instead.
             arg_tuples (Tuple[Tuple[Any,...],...]): A list of tuples of the arguments. If key is a function, the arguments will be passed to the function.
 
         Returns:
@@ -663,6 +1447,42 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
         """
         return super().to_dict_with_complex_keys(keys, arg_tuples)
 
+    @override
+    def to_columnar(self, keys: list[Callable[[T, Any], Any] | property | str | Hashable] | None = None, arg_tuples: list[tuple[Any, ...]] = []) -> ColumnarExtList:
+        """
+        Returns a columnar copy of the `ExtList`, which stores the value of each key as one contiguous column.
+
+        Columns of ints or floats are stored in an `array.array` and other columns in a list, which saves memory and
+        lets the filters of :class:`ColumnarExtList` compare one column at a time.
+
+        Args:
+            keys (List[Callable[[T, Any], Any] | property | str | Hashable] | None): The keys to store as columns.
+                If None, the keys of the first dictionary are used.
+            arg_tuples (List[Tuple[Any, ...]]): A list of tuples of the arguments. If key is a function, the arguments will be passed to the function.
+
+        Returns:
+            ColumnarExtList: The columnar copy of the `ExtList`.
+
+        Raises:
+            ValueError: If keys is None and the elements are not dictionaries.
+
+        Examples:
+            The following example demonstrates how to use the `to_columnar` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Charlie', 'age': 35}])
+            >>> columnar = ext_list_1.to_columnar()
+            >>> columnar.column('age')
+            array('q', [25, 30, 35])
+            >>> columnar.greater('age', 25).extract('name')
+            ['Bob', 'Charlie']
+
+            >>> ExtList([Person('Alice', 25), Person('Bob', 30)]).to_columnar([Person.name, Person.age]).to_dict_list()
+            [{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}]
+
+        Overrides :meth:`_DictOperation.to_columnar`.
+        """
+        return super().to_columnar(keys, arg_tuples)
+
     @override
     def dicts_to_instances(self, type_: TI) -> ExtList[TI]:  # type: ignore[override]
         """
@@ -686,13 +1506,19 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
         return super().dicts_to_instances(type_)  # type: ignore[assignment]
 
     @override
-    def group_by_key(self, key: Callable[[T, Any], Any] | property | str | Hashable, *args: Any) -> dict[Hashable, ExtList[T]]:  # type: ignore[override]
+    def group_by_key(  # type: ignore[override]
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, workers: int | None = None, executor: str | Executor | None = None,
+    ) -> dict[Hashable, ExtList[T]]:
         """Groups the objects of the list by a specified key.
 
         Args:
             key (Callable[[T, Any], Any] | property | str | Hashable): The key to group the objects by. This can be
                 a function, property, string, or hashable object.
             *args (Any): Additional arguments to pass to the key function or property.
+            workers (int | None): The number of workers to evaluate the key with. If `workers` or `executor` is given and the object holds at least
+                :data:`ext_list.parallel.PARALLEL_THRESHOLD` elements, each chunk of the object is grouped in a pool and the partial results are
+                merged in list order, so the result is the same as the serial one.
+            executor (str | Executor | None): `'process'` (default), `'thread'` for functions which release the GIL, or an Executor to use.
 
         Returns:
             dict[Hashable, ExtList[T]]: A dictionary of lists, where the keys are the result of applying the
@@ -708,34 +1534,86 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_DictOperation.group_by_key`.
         """
-        return super().group_by_key(key, *args)  # type: ignore[assignment]
+        return super().group_by_key(key, *args, workers=workers, executor=executor)  # type: ignore[assignment]
+
+    @override
+    def aggregate(  # type: ignore[override]
+        self, group_key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, aggregations: Mapping[Hashable, tuple[Any, ...]], *args: Any,
+        as_list: bool = False,
+    ) -> dict[Hashable, dict[Hashable, Any]] | ExtList[dict[Hashable, Any]]:
+        """
+        Aggregates the objects of the list by a specified key in a single pass, without building the groups.
+
+        Args:
+            group_key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key to group the objects by,
+                resolved as in `group_by_key`.
+            aggregations (Mapping[Hashable, tuple[Any, ...]]): A mapping from the name of each aggregate to `(reducer, key)`,
+                or `(reducer, key, args)` if key is a function taking arguments. The reducer is one of `'count'`, `'sum'`,
+                `'min'`, `'max'`, `'mean'`, `'first'` and `'last'`, or a function `(accumulator, value) -> accumulator`
+                whose first accumulator is the first value of the group. The key of `'count'` may be None or omitted.
+            *args (Any): If group_key is a function, the arguments will be passed to the function.
+            as_list (bool): If True, returns a list of dictionaries holding the group key under its column name, as
+                `to_dict_list` names it, followed by the aggregates.
+
+        Returns:
+            dict[Hashable, dict[Hashable, Any]] | ExtList[dict[Hashable, Any]]: The aggregates of each group, in the order in
+            which the groups first appear.
+
+        Raises:
+            ValueError: If an aggregation is malformed or names an unknown reducer.
+
+        Examples:
+            The following example demonstrates how to use the `aggregate` method.
+
+            >>> ext_list_1 = ExtList([{'team': 'red', 'amount': 10}, {'team': 'blue', 'amount': 5}, {'team': 'red', 'amount': 20}])
+            >>> ext_list_1.aggregate('team', {'total': ('sum', 'amount'), 'rows': ('count',), 'average': ('mean', 'amount')})
+            {'red': {'total': 30, 'rows': 2, 'average': 15.0}, 'blue': {'total': 5, 'rows': 1, 'average': 5.0}}
+
+            >>> ext_list_1.aggregate('team', {'largest': (max, 'amount')}, as_list=True)
+            [{'team': 'red', 'largest': 20}, {'team': 'blue', 'largest': 5}]
+
+        Overrides :meth:`_DictOperation.aggregate`.
+        """
+        return super().aggregate(group_key, aggregations, *args, as_list=as_list)  # type: ignore[return-value]
 
     @override
-    def rename_keys(self, rename_keys: dict[Hashable, Hashable]) -> ExtList[T]:
+    def rename_keys(self, rename_keys: dict[Hashable, Hashable], inplace: bool = False, view: bool = False, deep: bool = False) -> ExtList[T]:
         """
         Renames the keys in the objects based on the provided mapping dictionary.
 
         Args:
             rename_keys (dict[Hashable, Hashable]): A dictionary that maps the keys to be renamed. The keys in the dictionary
                 represent the original keys, while the corresponding values represent the new keys.
+            inplace (bool): If True, the keys are renamed in the objects themselves and the object is returned, instead of
+                renaming them in copies.
+            view (bool): If True, each dictionary is wrapped in a :class:`RowView` which renames the keys when they are read
+                and copies the dictionary only when it is first written to.
+            deep (bool): If True, the objects are copied with :func:`copy.deepcopy` instead of the shallow copier registered
+                by :func:`ext_list.copiers.register_copier` for their type.
 
         Returns:
             ExtList[T]: A list of objects with the renamed keys.
 
         Raises:
-            TypeError: If the object is not indexable.
+            TypeError: If the object is not indexable, or if `view` is True and the objects are not mappings.
+            ValueError: If both `inplace` and `view` are True.
 
         Examples:
             >>> ext_list = ExtList([{'name': 'alice', 'age': 25}, {'name': 'bob', 'age': 30}])
             >>> ext_list.rename_keys({'name': 'Name', 'age': 'Age'})
             [{'Name': 'alice', 'Age': 25}, {'Name': 'bob', 'Age': 30}]
 
+            >>> ext_list.rename_keys({'name': 'Name'}, inplace=True)
+            [{'age': 25, 'Name': 'alice'}, {'age': 30, 'Name': 'bob'}]
+
         Overrides :meth:`_DictOperation.rename_keys`.
         """
-        return super().rename_keys(rename_keys)  # type: ignore[assignment]
+        return super().rename_keys(rename_keys, inplace, view, deep)  # type: ignore[assignment]
 
     @override
-    def map_for_keys(self, keys: list[Hashable], function: Callable[[Any], Any] | type, *args: Any) -> ExtList[dict[Any, Any]]:
+    def map_for_keys(
+        self, keys: list[Hashable], function: Callable[[Any], Any] | type, *args: Any, inplace: bool = False, view: bool = False, deep: bool = False,
+    ) -> ExtList[dict[Any, Any]]:
         """
         Applies a function to specific keys of each element in the dictionary.
 
@@ -744,12 +1622,19 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
             function (Callable[[Any], Any] | type): The function or type to apply to the keys.
                 It should accept the value of each key as the first argument, followed by optional args.
             *args (Any): Optional arguments to be passed to the function along with each key's value.
+            inplace (bool): If True, the values are replaced in the dictionaries themselves and the object is returned,
+                instead of replacing them in copies.
+            view (bool): If True, each dictionary is wrapped in a :class:`RowView` which applies the function whenever one of
+                the keys is read and copies the dictionary only when it is first written to.
+            deep (bool): If True, the dictionaries are copied with :func:`copy.deepcopy` instead of the shallow copier
+                registered by :func:`ext_list.copiers.register_copier` for their type.
 
         Returns:
             An instance of ExtList containing the modified dictionaries.
 
         Raises:
-            TypeError: If the dictionary is not indexable.
+            TypeError: If the dictionary is not indexable, or if `view` is True and the objects are not mappings.
+            ValueError: If both `inplace` and `view` are True.
 
         Example:
             The following example demonstrates how to use the `map_for_keys` method.
@@ -763,4 +1648,75 @@ class ExtList(_ListOperation[T], _OperatorOperation[T], _DictOperation[T]):
 
         Overrides :meth:`_DictOperation.map_for_keys`.
         """
-        return super().map_for_keys(keys, function, *args)  # type: ignore[assignment]
+        return super().map_for_keys(keys, function, *args, inplace=inplace, view=view, deep=deep)  # type: ignore[assignment]
+
+    @override
+    def create_index(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, kind: str = 'hash') -> None:
+        """
+        Builds a secondary index on the given key, which the query methods use instead of scanning the list.
+
+        A `'hash'` index serves `equal`, `not_equal`, `in_`, `not_in_` and `to_dict`. A `'sorted'` index serves
+        `greater`, `greater_or_equal`, `less`, `less_or_equal` and `between` by bisection. Results are returned in
+        list order either way.
+
+        The index is kept up to date by `append`, `extend` and `+=`. Any other mutation marks it stale, and it is
+        rebuilt the next time it is used.
+
+        Args:
+            key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key to index. If the key is function,
+                the callable will be executed and its result will be indexed.
+            *args (Any): If key is a function, the arguments will be passed to the function.
+            kind (str): The kind of index, `'hash'` or `'sorted'`.
+
+        Raises:
+            ValueError: If the kind is unknown.
+            TypeError: If the values of the key are not hashable for a `'hash'` index, or not comparable for a
+                `'sorted'` index.
+
+        Examples:
+            The following example demonstrates how to use the `create_index` method.
+
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Charlie', 'age': 25}])
+            >>> ext_list_1.create_index('age')
+            >>> ext_list_1.equal('age', 25)
+            [{'name': 'Alice', 'age': 25}, {'name': 'Charlie', 'age': 25}]
+
+            >>> ext_list_1.create_index('age', kind='sorted')
+            >>> ext_list_1.greater('age', 25)
+            [{'name': 'Bob', 'age': 30}]
+
+        Overrides :meth:`_IndexOperation.create_index`.
+        """
+        super().create_index(key, *args, kind=kind)
+
+    @override
+    def drop_index(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, kind: str = 'hash') -> None:
+        """
+        Removes an index created by `create_index`.
+
+        Args:
+            key (Callable[[T, Any], Any] | property | str | Hashable | KeySpec): The key of the index.
+            *args (Any): The arguments the index was created with.
+            kind (str): The kind of the index.
+
+        Raises:
+            KeyError: If there is no such index.
+
+        Overrides :meth:`_IndexOperation.drop_index`.
+        """
+        super().drop_index(key, *args, kind=kind)
+
+    @override
+    def has_index(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, kind: str = 'hash') -> bool:
+        """
+        Returns `True` if an index of the given kind exists for the key, `False` otherwise.
+
+        Examples:
+            >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}])
+            >>> ext_list_1.create_index('age')
+            >>> ext_list_1.has_index('age')
+            True
+
+        Overrides :meth:`_IndexOperation.has_index`.
+        """
+        return super().has_index(key, *args, kind=kind)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Mapping
+
+from ext_list.keys import resolve_key
+
+
+class Reducer:
+    """
+    A running aggregate, folded one value at a time.
+
+    `start` turns the first value of a group into the accumulator, `step` folds each further value into it and
+    `finish` turns the accumulator into the result.
+    """
+
+    __slots__ = ('start', 'step', 'finish')
+
+    def __init__(self, start: Callable[[Any], Any], step: Callable[[Any, Any], Any], finish: Callable[[Any], Any] | None = None) -> None:
+        self.start = start
+        self.step = step
+        self.finish = finish
+
+
+REDUCERS: dict[str, Reducer] = {
+    'count': Reducer(lambda value: 1, lambda count, value: count + 1),
+    'sum': Reducer(lambda value: value, lambda total, value: total + value),
+    'min': Reducer(lambda value: value, lambda minimum, value: value if value < minimum else minimum),
+    'max': Reducer(lambda value: value, lambda maximum, value: value if value > maximum else maximum),
+    'mean': Reducer(lambda value: (value, 1), lambda state, value: (state[0] + value, state[1] + 1), lambda state: state[0] / state[1]),
+    'first': Reducer(lambda value: value, lambda first, value: first),
+    'last': Reducer(lambda value: value, lambda last, value: value),
+}
+
+
+def user_reducer(function: Callable[[Any, Any], Any]) -> Reducer:
+    """
+    Wraps `function(accumulator, value) -> accumulator` as a reducer whose first accumulator is the first value, as
+    with `functools.reduce`.
+    """
+    return Reducer(lambda value: value, function)
+
+
+def compile_aggregations(elements: list[Any], aggregations: Mapping[Hashable, tuple[Any, ...]]) -> list[tuple[Hashable, Reducer, Callable[[Any], Any]]]:
+    """
+    Resolves each `(reducer, key)` or `(reducer, key, args)` of `aggregations` into a name, a reducer and an accessor.
+
+    The key of `'count'` may be omitted or None.
+    """
+    compiled: list[tuple[Hashable, Reducer, Callable[[Any], Any]]] = []
+
+    for name, aggregation in aggregations.items():
+        if not isinstance(aggregation, tuple) or not 1 <= len(aggregation) <= 3:
+            raise ValueError(f'Expected (reducer, key) or (reducer, key, args) for {name!r} but got {aggregation!r}')
+
+        reducer, key, args = aggregation + (None, ())[len(aggregation) - 1:]
+
+        if callable(reducer):
+            compiled_reducer = user_reducer(reducer)
+
+        elif reducer in REDUCERS:
+            compiled_reducer = REDUCERS[reducer]
+
+        else:
+            raise ValueError(f'Expected one of {tuple(REDUCERS)} or a function for {name!r} but got {reducer!r}')
+
+        if key is None:
+            if reducer != 'count':
+                raise ValueError(f'Expected a key for {name!r}')
+
+            get_value: Callable[[Any], Any] = _no_value
+
+        else:
+            get_value = resolve_key(elements, key, args).getter
+
+        compiled.append((name, compiled_reducer, get_value))
+
+    return compiled
+
+
+def _no_value(element: Any) -> None:
+    return None
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import TypeVar
+
+from ext_list import base
+from ext_list.keys import KeySpec
+from ext_list.keys import resolve_key
+
+T = TypeVar('T')
+
+DEFAULT_CONCURRENCY = 64
+
+
+class _AsyncOperation(List[T]):  # type: ignore
+    async def amap(self, function: Callable[..., Any], *args: Any, concurrency: int = DEFAULT_CONCURRENCY, timeout: float | None = None) -> Iterable[Any]:
+        if not self:
+            return self.__class__()
+
+        return self.__class__(await _evaluate(self, lambda element: function(element, *args), concurrency, timeout))
+
+    async def aextract(
+        self, key: Callable[..., Any] | property | str | Hashable | KeySpec, *args: Any, concurrency: int = DEFAULT_CONCURRENCY, timeout: float | None = None,
+    ) -> Iterable[Any]:
+        if not self:
+            return self.__class__()
+
+        return self.__class__(await _evaluate(self, resolve_key(self, key, args).getter, concurrency, timeout))
+
+    async def afilter(self, function: Callable[..., Any], *args: Any, concurrency: int = DEFAULT_CONCURRENCY, timeout: float | None = None) -> Iterable[T]:
+        if not self:
+            return self.__class__()
+
+        results = await _evaluate(self, lambda element: function(element, *args), concurrency, timeout)
+
+        return base.new_subset(self, [element for element, result in zip(self, results) if result])
+
+    async def aequal(
+        self, key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any,
+        concurrency: int = DEFAULT_CONCURRENCY, timeout: float | None = None,
+    ) -> Iterable[T]:
+        if not self:
+            return self.__class__()
+
+        values = await _evaluate(self, resolve_key(self, key, args).getter, concurrency, timeout)
+
+        return base.new_subset(self, [element for element, value in zip(self, values) if value == compare_target])
+
+
+async def _evaluate(elements: list[Any], call: Callable[[Any], Any], concurrency: int, timeout: float | None) -> list[Any]:
+    """
+    Returns `call(element)` for every element, awaiting the results which are awaitable.
+
+    At most `concurrency` calls are in flight: that many workers take the next position in turn and store the result
+    at it, so the results keep the order of the elements. If a call fails, the call times out or the caller is
+    cancelled, the calls still running are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError(f'Expected concurrency of at least 1 but got {concurrency!r}')
+
+    results: list[Any] = [None] * len(elements)
+    positions = iter(range(len(elements)))
+
+    async def work() -> None:
+        for position in positions:
+            result = call(elements[position])
+
+            if inspect.isawaitable(result):
+                result = await result
+
+            results[position] = result
+
+    workers = [asyncio.ensure_future(work()) for _ in range(min(concurrency, len(elements)))]
+
+    try:
+        await asyncio.wait_for(asyncio.gather(*workers), timeout)
+
+    except BaseException:
+        for worker in workers:
+            worker.cancel()
+
+        raise
+
+    return results
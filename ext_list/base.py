@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import operator
 from types import FunctionType
 from types import GetSetDescriptorType
 from types import MethodDescriptorType
 from typing import Any
 from typing import Callable
 from typing import Hashable
+from typing import Iterable
 from typing import TypeVar
 
 T = TypeVar('T')
 
+INDEXABLE = 'indexable'
+OBJECT = 'object'
+MIXED = 'mixed'
+UNKNOWN = 'unknown'
+
 
 def determine_get_value_method(elements: list[T], key: FunctionType | property | str | Hashable) -> Callable[[T, Any], Any]:
     def __get_value_by_function(element: T, func: FunctionType, *args: Any) -> Any:
@@ -42,4 +49,128 @@ def determine_get_value_method(elements: list[T], key: FunctionType | property |
 
 
 def is_indexable(elements: list[Any]) -> bool:
-    return all(hasattr(element, '__getitem__') for element in elements)
+    if not elements:
+        return True
+
+    return get_element_shape(elements) == INDEXABLE
+
+
+def determine_element_shape(elements: Iterable[Any]) -> str:
+    has_indexable = False
+    has_object = False
+
+    for element in elements:
+        if hasattr(element, '__getitem__'):
+            has_indexable = True
+
+        else:
+            has_object = True
+
+        if has_indexable and has_object:
+            return MIXED
+
+    if has_indexable:
+        return INDEXABLE
+
+    if has_object:
+        return OBJECT
+
+    return UNKNOWN
+
+
+def shape_of(element: Any) -> str:
+    return INDEXABLE if hasattr(element, '__getitem__') else OBJECT
+
+
+def merge_element_shapes(shape: str, other_shape: str) -> str:
+    if shape == UNKNOWN or other_shape == UNKNOWN:
+        return UNKNOWN
+
+    if shape == other_shape:
+        return shape
+
+    return MIXED
+
+
+def get_element_shape(elements: list[Any]) -> str:
+    """
+    Returns the element shape of `elements`, reusing the shape cached on an ExtList when it is known.
+
+    Lists which do not carry an `_element_shape` attribute are scanned on every call.
+    """
+    shape = getattr(elements, '_element_shape', None)
+
+    if shape is None:
+        return determine_element_shape(elements)
+
+    if shape == UNKNOWN:
+        shape = determine_element_shape(elements)
+        elements._element_shape = shape  # type: ignore[attr-defined]
+
+    return shape
+
+
+def new_subset(elements: list[T], selected: list[T]) -> list[T]:
+    """
+    Wraps `selected`, a subset of `elements`, in the class of `elements` and carries over a homogeneous element shape.
+    """
+    subset = elements.__class__(selected)  # type: ignore[call-arg]
+    shape = getattr(elements, '_element_shape', None)
+
+    if selected and shape in (INDEXABLE, OBJECT) and hasattr(subset, '_element_shape'):
+        subset._element_shape = shape  # type: ignore[attr-defined]
+
+    return subset
+
+
+def is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+
+    except TypeError:
+        return False
+
+    return True
+
+
+def is_hashable_collection(values: Any) -> bool:
+    return isinstance(values, (list, tuple, set, frozenset)) and all(is_hashable(value) for value in values)
+
+
+def to_probe_set(values: Any) -> set[Any] | frozenset[Any] | None:
+    """
+    Returns `values` as a set for O(1) membership tests, or None if the values are not a list, tuple or set of
+    hashable values.
+    """
+    if isinstance(values, (set, frozenset)):
+        return values
+
+    if not isinstance(values, (list, tuple)):
+        return None
+
+    try:
+        return frozenset(values)
+
+    except TypeError:
+        return None
+
+
+def membership_test(values: Any) -> Callable[[Any], bool]:
+    """
+    Returns a function testing `value in values`, which probes a set when the values allow it.
+    """
+    probe = to_probe_set(values)
+
+    if probe is None:
+        return lambda value: value in values
+
+    contains = probe.__contains__
+
+    def test(value: Any) -> bool:
+        try:
+            return contains(value)
+
+        except TypeError:
+            return operator.contains(values, value)
+
+    return test
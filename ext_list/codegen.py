@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import keyword
+from functools import lru_cache
+from typing import Any
+from typing import Callable
+
+from ext_list.index import BOTH
+from ext_list.index import LEFT
+from ext_list.index import NEITHER
+from ext_list.index import RIGHT
+
+ITEM = 'item'
+ATTRIBUTE = 'attribute'
+CALL = 'call'
+FUNCTION = 'function'
+
+ACCESSES = (ITEM, ATTRIBUTE, CALL, FUNCTION)
+
+# The generated functions kept by each of `selector`, `fused_selector` and `predicate_selector`. Their cache keys hold
+# attribute names and predicate shapes taken from the caller, so the caches are bounded.
+SELECTOR_CACHE_SIZE = 256
+
+# The nodes of a predicate structure, as compiled by `predicate_selector`.
+LEAF = 'leaf'
+AND = 'and'
+OR = 'or'
+NOT = 'not'
+
+# The test of each selection method, with `{value}` standing for the value of the key and `{target}` and `{upper}`
+# for the arguments compared against it.
+CONDITIONS: dict[str, str] = {
+    'equal': '{value} == {target}',
+    'not_equal': '{value} != {target}',
+    'greater': '{value} > {target}',
+    'greater_or_equal': '{value} >= {target}',
+    'less': '{value} < {target}',
+    'less_or_equal': '{value} <= {target}',
+    'in_': '{value} in {target}',
+    'not_in_': '{value} not in {target}',
+    'startswith': '{value}.startswith({target})',
+    'regex': '{target}.search({value}) is not None',
+    'is_none': '{value} is None',
+}
+
+# The membership tests made through a function of the value, such as the one returned by
+# :func:`ext_list.base.membership_test`, which probes a set and scans the collection only for unhashable values.
+MEMBERSHIP_TEST_CONDITIONS: dict[str, str] = {
+    'in_': '{target}({value})',
+    'not_in_': 'not {target}({value})',
+}
+
+BETWEEN_CONDITIONS: dict[str, str] = {
+    BOTH: '{target} <= {value} <= {upper}',
+    LEFT: '{target} <= {value} < {upper}',
+    RIGHT: '{target} < {value} <= {upper}',
+    NEITHER: '{target} < {value} < {upper}',
+}
+
+
+def value_expression(access: str, attribute: str | None = None, arity: int = 0, suffix: str = '') -> str:
+    """
+    Returns the expression reading the value of the key from `element`.
+
+    The value is read as `element[key]` for the `'item'` access, as `element.<attribute>` for the `'attribute'` access,
+    as `get_value(element)` for the `'call'` access and as `key(element, arg_0, ...)` for the `'function'` access, so
+    lookups which Python can inline are not made through a call and the arguments of a function are not unpacked per
+    element.
+    """
+    if access == ITEM:
+        return f'element[key{suffix}]'
+
+    if access == ATTRIBUTE:
+        if not is_attribute_name(attribute):
+            raise ValueError(f'Expected an attribute name but got {attribute!r}')
+
+        return f'element.{attribute}'
+
+    if access == FUNCTION:
+        return f'key{suffix}(' + ', '.join(['element'] + [f'arg{suffix}_{number}' for number in range(arity)]) + ')'
+
+    if access == CALL:
+        return f'get_value{suffix}(element)'
+
+    raise ValueError(f'Expected one of {ACCESSES} but got {access!r}')
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def selector(condition: str, access: str, attribute: str | None = None, arity: int = 0) -> Callable[..., list[Any]]:
+    """
+    Returns `select(elements, target, upper, key, get_value, args)`, the comprehension keeping the elements whose value
+    satisfies `condition`, compiled once per condition, access and number of arguments.
+
+    Examples:
+        >>> select = selector(CONDITIONS['equal'], ITEM)
+        >>> select([{'a': 1}, {'a': 2}], 1, None, 'a', None, ())
+        [{'a': 1}]
+    """
+    test = condition.format(value=value_expression(access, attribute, arity), target='target', upper='upper')
+    lines = ['def select(elements, target, upper, key, get_value, args):']
+
+    if access == FUNCTION and arity:
+        lines.append('    ' + ''.join(f'arg_{number}, ' for number in range(arity)) + '= args')
+
+    lines.append(f'    return [element for element in elements if {test}]')
+
+    return _compile('select', lines, f'<ext_list {access} {condition}>')
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def fused_selector(conditions: tuple[str, ...]) -> Callable[..., list[Any]]:
+    """
+    Returns `fused(elements, get_value_0, target_0, ..., get_value_1, ...)`, the comprehension keeping the elements
+    which satisfy every condition in order, each reading its value through its own getter.
+
+    A condition takes its target only if it compares against one, and its upper bound only if it has one.
+    """
+    parameters: list[str] = []
+    tests: list[str] = []
+
+    for number, condition in enumerate(conditions):
+        parameters.append(f'get_value_{number}')
+
+        if '{target}' in condition:
+            parameters.append(f'target_{number}')
+
+        if '{upper}' in condition:
+            parameters.append(f'upper_{number}')
+
+        value = value_expression(CALL, suffix=f'_{number}')
+        tests.append('(' + condition.format(value=value, target=f'target_{number}', upper=f'upper_{number}') + ')')
+
+    lines = [f'def fused(elements, {", ".join(parameters)}):', f'    return [element for element in elements if {" and ".join(tests)}]']
+
+    return _compile('fused', lines, '<ext_list fused>')
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def predicate_selector(structure: tuple[Any, ...]) -> Callable[..., list[Any]]:
+    """
+    Returns `select(elements, leaves)`, the comprehension keeping the elements which satisfy a compound predicate,
+    compiled once per structure.
+
+    The structure is a nested tuple of `('leaf', condition, access, attribute, arity)`, `('and', operands)`,
+    `('or', operands)` and `('not', operand)` nodes. Leaves are numbered in the order they appear, and `leaves[n]` holds
+    the `(key, get_value, args, target, upper)` of the n-th leaf. `and` and `or` short-circuit as in Python.
+    """
+    lines = ['def select(elements, leaves):']
+
+    def expression(node: tuple[Any, ...]) -> str:
+        if node[0] == AND:
+            return '(' + ' and '.join(expression(operand) for operand in node[1]) + ')'
+
+        if node[0] == OR:
+            return '(' + ' or '.join(expression(operand) for operand in node[1]) + ')'
+
+        if node[0] == NOT:
+            return f'(not {expression(node[1])})'
+
+        _, condition, access, attribute, arity = node
+        number = len(lines) - 1
+        lines.append(f'    key_{number}, get_value_{number}, args_{number}, target_{number}, upper_{number} = leaves[{number}]')
+
+        if access == FUNCTION and arity:
+            lines[-1] += '\n    ' + ''.join(f'arg_{number}_{position}, ' for position in range(arity)) + f'= args_{number}'
+
+        value = value_expression(access, attribute, arity, suffix=f'_{number}')
+
+        return '(' + condition.format(value=value, target=f'target_{number}', upper=f'upper_{number}') + ')'
+
+    test = expression(structure)
+    lines.append(f'    return [element for element in elements if {test}]')
+
+    return _compile('select', lines, '<ext_list predicate>')
+
+
+def is_attribute_name(name: Any) -> bool:
+    return isinstance(name, str) and name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _compile(name: str, lines: list[str], filename: str) -> Callable[..., list[Any]]:
+    namespace: dict[str, Any] = {}
+    exec(compile('\n'.join(lines) + '\n', filename, 'exec'), namespace)
+
+    return namespace[name]  # type: ignore[no-any-return]
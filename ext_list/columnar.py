@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import operator
+from array import array
+from itertools import compress
+from itertools import repeat
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterator
+from typing import Mapping
+from typing import Sequence
+
+from ext_list import base
+from ext_list.keys import column_name
+from ext_list.row_plan import RowPlan
+
+COMPARATORS: dict[str, Callable[[Any, Any], Any]] = {
+    'equal': operator.eq,
+    'not_equal': operator.ne,
+    'greater': operator.gt,
+    'greater_or_equal': operator.ge,
+    'less': operator.lt,
+    'less_or_equal': operator.le,
+}
+
+
+class ColumnarExtList:
+    """
+    A struct-of-arrays form of an ExtList whose elements all have the same keys, created by :meth:`ExtList.to_columnar`.
+
+    Each key is stored as one column: an `array.array` when every value is an int or every value is a float, and a
+    list otherwise. Filters compare a single column and select every column by mask, so rows are only materialized as
+    dicts when they are read, for example by iteration, indexing or `to_dict_list`.
+
+    Examples:
+        >>> columnar = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}]).to_columnar()
+        >>> columnar.column('age')
+        array('q', [25, 30])
+        >>> columnar.greater('age', 25).to_dict_list()
+        [{'name': 'Bob', 'age': 30}]
+    """
+
+    def __init__(self, columns: Mapping[Hashable, Sequence[Any]] = {}) -> None:
+        lengths = {len(values) for values in columns.values()}
+
+        if len(lengths) > 1:
+            raise ValueError(f'Expected columns of the same length but got lengths {sorted(lengths)}')
+
+        self.__columns = {name: _pack(values) for name, values in columns.items()}
+        self.__length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(
+        cls, rows: list[Any], keys: Sequence[Callable[..., Any] | property | str | Hashable] | None = None, arg_tuples: Sequence[tuple[Any, ...]] = (),
+    ) -> ColumnarExtList:
+        if keys is None:
+            if not rows:
+                return cls()
+
+            if not isinstance(rows[0], Mapping):
+                raise ValueError(f'Expected keys for elements of type {type(rows[0]).__name__}')
+
+            keys = list(rows[0].keys())
+
+        if not rows:
+            return cls({column_name(key): [] for key in keys})
+
+        plan = RowPlan.compile(rows, keys, arg_tuples)
+
+        return cls({name: [accessor(row) for row in rows] for name, accessor in zip(plan.columns, plan.accessors)})
+
+    @property
+    def column_names(self) -> tuple[Hashable, ...]:
+        return tuple(self.__columns)
+
+    def column(self, key: Callable[..., Any] | property | str | Hashable) -> Sequence[Any]:
+        name = column_name(key)
+
+        if name not in self.__columns:
+            raise KeyError(key)
+
+        return self.__columns[name]
+
+    def equal(self, key: Callable[..., Any] | property | str | Hashable, compare_target: Any) -> ColumnarExtList:
+        return self.__compare('equal', key, compare_target)
+
+    def not_equal(self, key: Callable[..., Any] | property | str | Hashable, compare_target: Any) -> ColumnarExtList:
+        return self.__compare('not_equal', key, compare_target)
+
+    def greater(self, key: Callable[..., Any] | property | str | Hashable, compare_target: Any) -> ColumnarExtList:
+        return self.__compare('greater', key, compare_target)
+
+    def greater_or_equal(self, key: Callable[..., Any] | property | str | Hashable, compare_target: Any) -> ColumnarExtList:
+        return self.__compare('greater_or_equal', key, compare_target)
+
+    def less(self, key: Callable[..., Any] | property | str | Hashable, compare_target: Any) -> ColumnarExtList:
+        return self.__compare('less', key, compare_target)
+
+    def less_or_equal(self, key: Callable[..., Any] | property | str | Hashable, compare_target: Any) -> ColumnarExtList:
+        return self.__compare('less_or_equal', key, compare_target)
+
+    def in_(self, key: Callable[..., Any] | property | str | Hashable, compare_target: list[Any]) -> ColumnarExtList:
+        return self.__select(_membership_mask(self.column(key), compare_target))
+
+    def not_in_(self, key: Callable[..., Any] | property | str | Hashable, compare_target: list[Any]) -> ColumnarExtList:
+        return self.__select([not selected for selected in _membership_mask(self.column(key), compare_target)])
+
+    def extract(self, key: Callable[..., Any] | property | str | Hashable) -> Any:
+        return _ext_list(list(self.column(key)))
+
+    def to_dict_list(self, keys: Sequence[Callable[..., Any] | property | str | Hashable] | None = None) -> Any:
+        names = self.column_names if keys is None else tuple(column_name(key) for key in keys)
+        columns = [self.column(name) for name in names]
+
+        return _ext_list([dict(zip(names, values)) for values in zip(*columns)])
+
+    def group_by_key(self, key: Callable[..., Any] | property | str | Hashable) -> dict[Hashable, ColumnarExtList]:
+        groups: dict[Hashable, list[int]] = {}
+
+        for position, value in enumerate(self.column(key)):
+            if value in groups:
+                groups[value].append(position)
+
+            else:
+                groups[value] = [position]
+
+        return {value: self.__take(positions) for value, positions in groups.items()}
+
+    def __compare(self, operator_name: str, key: Any, compare_target: Any) -> ColumnarExtList:
+        return self.__select(list(map(COMPARATORS[operator_name], self.column(key), repeat(compare_target))))
+
+    def __select(self, mask: list[Any]) -> ColumnarExtList:
+        result = ColumnarExtList()
+        result.__columns = {name: _compress(values, mask) for name, values in self.__columns.items()}
+        result.__length = len(next(iter(result.__columns.values()))) if result.__columns else 0
+        return result
+
+    def __take(self, positions: list[int]) -> ColumnarExtList:
+        result = ColumnarExtList()
+        result.__columns = {name: _take(values, positions) for name, values in self.__columns.items()}
+        result.__length = len(positions)
+        return result
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[dict[Hashable, Any]]:
+        names = self.column_names
+        return (dict(zip(names, values)) for values in zip(*self.__columns.values()))
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return self.__take(list(range(self.__length))[index])
+
+        return {name: values[index] for name, values in self.__columns.items()}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColumnarExtList):
+            return NotImplemented
+
+        return self.column_names == other.column_names and all(list(self.column(name)) == list(other.column(name)) for name in self.column_names)
+
+    def __repr__(self) -> str:
+        return f'ColumnarExtList(columns={self.column_names!r}, length={self.__length})'
+
+
+def _pack(values: Sequence[Any]) -> Sequence[Any]:
+    """
+    Stores `values` in an `array.array` if they are all ints or all floats, and in a list otherwise.
+
+    Bools are not packed, so that reading a column returns the same values that were stored.
+    """
+    if isinstance(values, array):
+        return values
+
+    if values and all(type(value) is int for value in values):
+        try:
+            return array('q', values)
+
+        except OverflowError:
+            return list(values)
+
+    if values and all(type(value) is float for value in values):
+        return array('d', values)
+
+    return list(values)
+
+
+def _compress(values: Sequence[Any], mask: list[Any]) -> Sequence[Any]:
+    if isinstance(values, array):
+        return array(values.typecode, compress(values, mask))
+
+    return list(compress(values, mask))
+
+
+def _take(values: Sequence[Any], positions: list[int]) -> Sequence[Any]:
+    if isinstance(values, array):
+        return array(values.typecode, map(values.__getitem__, positions))
+
+    return list(map(values.__getitem__, positions))
+
+
+def _membership_mask(values: Sequence[Any], compare_target: Any) -> list[bool]:
+    probe = base.to_probe_set(compare_target)
+
+    if probe is not None:
+        try:
+            return list(map(probe.__contains__, values))
+
+        except TypeError:
+            pass
+
+    return [value in compare_target for value in values]
+
+
+def _ext_list(elements: list[Any]) -> Any:
+    from ext_list import ExtList
+
+    return ExtList(elements)
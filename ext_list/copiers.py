@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from collections import UserDict
+from collections import UserList
+from types import MappingProxyType
+from typing import Any
+from typing import Callable
+from typing import Iterable
+
+COPIERS: dict[type, Callable[[Any], Any]] = {
+    dict: dict.copy,
+    list: list.copy,
+    OrderedDict: OrderedDict.copy,
+    UserDict: UserDict.copy,
+    UserList: UserList.copy,
+    MappingProxyType: dict,
+}
+
+
+def register_copier(type_: type, copier: Callable[[Any], Any]) -> None:
+    """
+    Registers `copier(row) -> row` as the shallow copy of rows whose type is exactly `type_`.
+
+    The copy is written to by `rename_keys` and `map_for_keys`, so it must not share its top level with the row.
+    Rows of other types are copied by :func:`copy.copy`.
+
+    Examples:
+        >>> register_copier(Record, Record.copy)
+    """
+    COPIERS[type_] = copier
+
+
+def unregister_copier(type_: type) -> None:
+    COPIERS.pop(type_, None)
+
+
+def copy_rows(rows: Iterable[Any], deep: bool = False) -> list[Any]:
+    """
+    Returns a copy of each row.
+
+    Shallow copies use the copier registered for the type of the row. Read-only rows backed by a
+    :class:`MappingProxyType` are copied into a dict. Deep copies share one memo, so objects shared between rows stay
+    shared between the copies.
+    """
+    if deep:
+        memo: dict[int, Any] = {}
+        return [copy.deepcopy(row, memo) for row in rows]
+
+    copiers = COPIERS
+    copied = []
+
+    for row in rows:
+        copier = copiers.get(type(row), copy.copy)
+        copied.append(copier(row))
+
+    return copied
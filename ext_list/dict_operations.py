@@ -1,136 +1,115 @@
 from __future__ import annotations
 
-import copy
-from types import FunctionType
-from types import GetSetDescriptorType
-from types import MethodDescriptorType
+from concurrent.futures import Executor
 from typing import Any
 from typing import Callable
 from typing import Hashable
 from typing import Iterable
 from typing import List
+from typing import Mapping
 from typing import TypeVar
 
 from ext_list import base
+from ext_list.aggregation import compile_aggregations
+from ext_list.columnar import ColumnarExtList
+from ext_list.copiers import copy_rows
+from ext_list.index import find_index
+from ext_list.index import HASH
+from ext_list.index import invalidate_indexes
+from ext_list.instrument import count_fast_path
+from ext_list.keys import column_name
+from ext_list.keys import INDEX
+from ext_list.keys import KeySpec
+from ext_list.keys import resolve_key
+from ext_list.parallel import is_parallel
+from ext_list.parallel import parallel_group
+from ext_list.parallel import parallel_to_dict
+from ext_list.row_plan import RowPlan
+from ext_list.views import ColumnLayout
+from ext_list.views import MapLayout
+from ext_list.views import RenameLayout
+from ext_list.views import row_views
 
 T = TypeVar('T')
 TI = TypeVar('TI')
 
 
 class _DictOperation(List[T]):  # type: ignore
-    def to_dict(self, key: Callable[[T, Any], Any] | property | str | Hashable, *args: Any) -> dict[Hashable, T]:
+    def to_dict(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, workers: int | None = None, executor: str | Executor | None = None,
+    ) -> dict[Hashable, T]:
         if not self:
             return {}
 
-        if base.is_indexable(self):
-            return {element[key]: element for element in self if element[key]}  # type: ignore[attr-defined]
+        spec = resolve_key(self, key, args)
+        index = find_index(self, spec, HASH)
 
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
+        if index is not None and not index.unordered:
+            count_fast_path('hash_index')
+            return {value: self[positions[-1]] for value, positions in index.positions.items() if value or spec.kind != INDEX}
 
-        if callable(key):
-            return {key(element, *args): element for element in self}
+        if is_parallel(self, workers, executor):
+            mapped = parallel_to_dict(self, spec, workers, executor)
 
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return {key.__get__(element): element for element in self}
+            if mapped is not None:
+                return mapped
 
-        raise KeyError
+        get_value = spec.getter
 
-    def to_dict_list(self, keys: list[Callable[[T, Any], Any] | property | str | Hashable], arg_tuples: list[tuple[Any, ...]] = []) -> Iterable[dict[str | Hashable, T]]:
-        def __to_dict_list_from_indexable_object(elements: list[T], keys: list[Hashable]) -> list[dict[str | Hashable, T]]:
-            return [{key: element[key] for key in keys} for element in elements]   # type: ignore[attr-defined]
+        if spec.kind == INDEX:
+            return {get_value(element): element for element in self if get_value(element)}
 
-        def __to_dict_list_from_others(
-            elements: list[T], keys: list[FunctionType | property | str | Hashable], arg_tuples: list[tuple[Any, ...]],
-        ) -> list[dict[str | Hashable, T]]:
-            if not arg_tuples:
-                arg_tuples = list(tuple() for _ in range(len(keys)))
-
-            result: list[dict[str | Hashable, T]] = []
-
-            for element in elements:
-                row: dict[str | Hashable, T] = __generate_dict_from_specified_keys(elements, keys, arg_tuples, element)
-
-                result.append(row)
-
-            return result
-
-        def __generate_dict_from_specified_keys(
-            elements: list[T], keys: list[Callable[[T, Any], Any] | property | str | Hashable], arg_tuples: list[tuple[Any, ...]], element: T,
-        ) -> dict[str | Hashable, Any]:
-            result: dict[str | Hashable, Any] = {}
-
-            for arg_tuple, key in zip(arg_tuples, keys):
-                if isinstance(key, property):
-                    dict_key: str | Hashable = key.fget.__name__  # type: ignore[attr-defined]
-
-                elif isinstance(key, FunctionType) or isinstance(key, MethodDescriptorType) or isinstance(key, GetSetDescriptorType):
-                    dict_key = key.__name__
-
-                elif isinstance(key, str):
-                    dict_key = key
-
-                else:
-                    dict_key = key
-
-                get_value_method = base.determine_get_value_method(elements, key)
-                result[dict_key] = get_value_method(element, key, *arg_tuple)  # type: ignore[assignment]
-
-            return result
+        return {get_value(element): element for element in self}
 
+    def to_dict_list(
+        self, keys: list[Callable[[T, Any], Any] | property | str | Hashable] | RowPlan, arg_tuples: list[tuple[Any, ...]] = [], view: bool = False,
+    ) -> Iterable[dict[str | Hashable, T]]:
         if not self:
             return self.__class__()
 
-        if base.is_indexable(self):
-            return self.__class__(__to_dict_list_from_indexable_object(self, keys))  # type: ignore[assignment]
-
-        return self.__class__(__to_dict_list_from_others(self, keys, arg_tuples))  # type: ignore[assignment]
+        plan = keys if isinstance(keys, RowPlan) else RowPlan.compile(self, keys, arg_tuples)
 
-    def to_dict_with_complex_keys(self, keys: list[Callable[[T, Any], Any] | property | str] | list[Hashable], arg_tuples: list[tuple[Any, ...]] = []) -> dict[tuple[Any, ...], T]:
-        def __to_dict_with_complex_keys_from_indexable_object(elements: list[T], keys: list[Hashable]) -> dict[tuple[Any, ...], T]:
-            return {tuple(element[key] for key in keys): element for element in elements}  # type: ignore[index]
+        if view:
+            return self.__class__(row_views(self, ColumnLayout(plan)))
 
-        def __to_dict_with_complex_keys_from_others(
-            elements: list[T], keys: list[Callable[[T, Any], Any] | property | str], arg_tuples: list[tuple[Any, ...]],
-        ) -> dict[tuple[Any, ...], T]:
-            result: dict[tuple[Any, ...], T] = {}
+        return self.__class__(plan.to_rows(self))  # type: ignore[arg-type]
 
-            if not arg_tuples:
-                arg_tuples = list(tuple() for _ in range(len(keys)))
+    def to_dict_with_complex_keys(
+        self, keys: list[Callable[[T, Any], Any] | property | str] | list[Hashable] | RowPlan, arg_tuples: list[tuple[Any, ...]] = [],
+    ) -> dict[tuple[Any, ...], T]:
+        if not self:
+            return {}
 
-            for element in elements:
-                tupled_key: tuple[Any, ...] = __generate_tupled_key(elements, keys, element, arg_tuples)
-                result[tupled_key] = element
+        plan = keys if isinstance(keys, RowPlan) else RowPlan.compile(self, keys, arg_tuples)
 
-            return result
+        return plan.to_keyed_dict(self)
 
-        def __generate_tupled_key(elements: list[T], keys: list[Callable[[T, Any], Any] | property | str], element: T, arg_tuples: list[tuple[Any, ...]]) -> tuple[Any, ...]:
-            tupled_key: tuple[Any, ...] = tuple()
+    def to_columnar(self, keys: list[Callable[[T, Any], Any] | property | str | Hashable] | None = None, arg_tuples: list[tuple[Any, ...]] = []) -> ColumnarExtList:
+        return ColumnarExtList.from_rows(self, keys, arg_tuples)
 
-            for key, arg_tuple in zip(keys, arg_tuples):
-                get_value_method = base.determine_get_value_method(elements, key)
-                tupled_key += (get_value_method(element, key, *arg_tuple),)
+    def dicts_to_instances(self, type_: TI) -> Iterable[TI]:
+        return self.__class__([type_(**element) for element in self])  # type: ignore[assignment]
 
-            return tupled_key
+    def group_by_key(  # type: ignore
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, workers: int | None = None, executor: str | Executor | None = None,
+    ) -> dict[Hashable, Iterable[T]]:
+        result: dict[Hashable, Iterable[T]] = {}
 
         if not self:
-            return {}
-
-        if base.is_indexable(self):
-            return __to_dict_with_complex_keys_from_indexable_object(self, keys)  # type: ignore[arg-type]
+            return result
 
-        return __to_dict_with_complex_keys_from_others(self, keys, arg_tuples)  # type: ignore[arg-type]
+        spec = resolve_key(self, key, args)
 
-    def dicts_to_instances(self, type_: TI) -> Iterable[TI]:
-        return self.__class__([type_(**element) for element in self])  # type: ignore[assignment]
+        if is_parallel(self, workers, executor):
+            groups = parallel_group(self, spec, workers, executor)
 
-    def group_by_key(self, key: Callable[[T, Any], Any] | property | str | Hashable, *args: Any) -> dict[Hashable, Iterable[T]]:  # type: ignore
-        result: dict[Hashable, Iterable[T]] = {}
+            if groups is not None:
+                return groups  # type: ignore[return-value]
 
-        get_value_method: Callable[[T, Any], Any] = base.determine_get_value_method(self, key)
+        get_value = spec.getter
 
         for element in self:
-            group_key: Hashable = get_value_method(element, key, *args)
+            group_key: Hashable = get_value(element)
 
             if group_key in result:
                 result[group_key].append(element)  # type: ignore[attr-defined]
@@ -140,17 +119,41 @@ class _DictOperation(List[T]):  # type: ignore
 
         return result
 
-    def rename_keys(self, rename_keys: dict[Hashable, Hashable]) -> Iterable[T]:
-        def __copy_object() -> Iterable[Any]:
-            if isinstance(self[0], dict):
-                return [dict(element) for element in self]  # type: ignore[assignment]
+    def aggregate(
+        self, group_key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, aggregations: Mapping[Hashable, tuple[Any, ...]], *args: Any,
+        as_list: bool = False,
+    ) -> dict[Hashable, dict[Hashable, Any]] | Iterable[dict[Hashable, Any]]:
+        if not self:
+            return self.__class__() if as_list else {}
 
-            elif isinstance(self[0], list):
-                return [list(element) for element in self]  # type: ignore[assignment]
+        get_group = resolve_key(self, group_key, args).getter
+        compiled = compile_aggregations(self, aggregations)
+        folds = [(reducer.start, reducer.step, get_value) for _, reducer, get_value in compiled]
+        states: dict[Hashable, list[Any]] = {}
 
-            else:
-                return copy.deepcopy(list(self))
+        for element in self:
+            group = get_group(element)
+            state = states.get(group)
+
+            if state is None:
+                states[group] = [start(get_value(element)) for start, _, get_value in folds]
+                continue
+
+            for position, (_, step, get_value) in enumerate(folds):
+                state[position] = step(state[position], get_value(element))
+
+        finishes = [(name, reducer.finish) for name, reducer, _ in compiled]
+        result = {
+            group: {name: finish(value) if finish else value for (name, finish), value in zip(finishes, state)} for group, state in states.items()
+        }
+
+        if as_list:
+            group_column = column_name(group_key)
+            return self.__class__([{group_column: group, **values} for group, values in result.items()])
 
+        return result
+
+    def rename_keys(self, rename_keys: dict[Hashable, Hashable], inplace: bool = False, view: bool = False, deep: bool = False) -> Iterable[T]:
         def __swap_keys(element: T, rename_keys: dict[Hashable, Hashable]):
             for from_key, to_key in rename_keys.items():
                 element[to_key] = element[from_key]  # type: ignore[attr-defined]
@@ -159,38 +162,62 @@ class _DictOperation(List[T]):  # type: ignore
             return element
 
         if not self:
-            return self.__class__()
+            return self if inplace else self.__class__()
 
         if not base.is_indexable(self):
             raise TypeError
 
-        copied_elements = __copy_object()
+        if view:
+            self.__validate_view(inplace)
+            layout = RenameLayout(rename_keys)
+            layout.validate(self)
+            return self.__class__(row_views(self, layout))
 
-        return self.__class__([__swap_keys(element, rename_keys) for element in copied_elements])
+        if inplace:
+            for element in self:
+                __swap_keys(element, rename_keys)
 
-    def map_for_keys(self, keys: list[Hashable], function: Callable[[Any], Any] | type, *args: Any) -> Iterable[dict[Any, Any]]:
-        def __copy_object() -> Iterable[Any]:
-            if isinstance(self[0], dict):
-                return [dict(element) for element in self]  # type: ignore[assignment]
+            invalidate_indexes(self)
+            return self
 
-            elif isinstance(self[0], list):
-                return [list(element) for element in self]  # type: ignore[assignment]
-
-            else:
-                return copy.deepcopy(list(self))
+        return self.__class__([__swap_keys(element, rename_keys) for element in copy_rows(self, deep)])
 
+    def map_for_keys(
+        self, keys: list[Hashable], function: Callable[[Any], Any] | type, *args: Any, inplace: bool = False, view: bool = False, deep: bool = False,
+    ) -> Iterable[dict[Any, Any]]:
         if not self:
-            return self.__class__()
+            return self if inplace else self.__class__()
 
         if not base.is_indexable(self):
             raise TypeError
 
+        if view:
+            self.__validate_view(inplace)
+            layout = MapLayout(keys, function, args)
+            layout.validate(self)
+            return self.__class__(row_views(self, layout))
+
+        if inplace:
+            for element in self:
+                for key in keys:
+                    element[key] = function(element[key], *args)  # type: ignore[index]
+
+            invalidate_indexes(self)
+            return self
+
         result: Iterable[dict[Any, Any]] = self.__class__()
 
-        for element in __copy_object():
+        for element in copy_rows(self, deep):
             for key in keys:
                 element[key] = function(element[key], *args)  # type: ignore[attr-defined]
 
             result.append(element)  # type: ignore[assignment]
 
         return result
+
+    def __validate_view(self, inplace: bool) -> None:
+        if inplace:
+            raise ValueError('Expected either inplace or view but got both')
+
+        if not all(isinstance(element, Mapping) for element in self):
+            raise TypeError('Expected mappings to view')
@@ -0,0 +1,440 @@
+from __future__ import annotations
+
+import operator
+import sys
+from concurrent.futures import Executor
+from contextvars import ContextVar
+from itertools import compress
+from itertools import repeat
+from types import BuiltinFunctionType
+from types import GetSetDescriptorType
+from types import MemberDescriptorType
+from types import MethodDescriptorType
+from types import MethodWrapperType
+from typing import Any
+from typing import Callable
+from typing import Hashable
+
+from ext_list import base
+from ext_list import instrument
+from ext_list.codegen import ATTRIBUTE
+from ext_list.codegen import BETWEEN_CONDITIONS
+from ext_list.codegen import CALL
+from ext_list.codegen import CONDITIONS
+from ext_list.codegen import FUNCTION
+from ext_list.codegen import is_attribute_name
+from ext_list.codegen import ITEM
+from ext_list.codegen import selector
+from ext_list.engine import COMPARISONS
+from ext_list.engine import NUMPY
+from ext_list.engine import resolve_engine
+from ext_list.engine import vectorized_select
+from ext_list.index import BOTH
+from ext_list.index import find_index
+from ext_list.index import HASH
+from ext_list.index import SORTED
+from ext_list.instrument import count_fast_path
+from ext_list.keys import ATTR_NAME
+from ext_list.keys import CALLABLE
+from ext_list.keys import INDEX
+from ext_list.keys import KeySpec
+from ext_list.keys import PROPERTY
+from ext_list.keys import resolve_key
+from ext_list.parallel import is_parallel
+from ext_list.parallel import parallel_select
+
+INDEXED = 'index'
+PARALLEL = 'parallel'
+VECTORIZED = 'numpy'
+INLINE = 'inline'
+COMPRESS = 'compress'
+COMPREHENSION = 'comprehension'
+
+STRATEGIES = (INDEXED, PARALLEL, VECTORIZED, INLINE, COMPRESS, COMPREHENSION)
+
+MEMBERSHIP_OPERATORS = ('in_', 'not_in_')
+
+# From 3.11 on, the interpreter specializes the calls and comparisons of a comprehension, which then runs as fast as
+# chaining C iterators. Before it, `compress` over `map` saves the per-element dispatch of the comprehension.
+SPECIALIZING_INTERPRETER = sys.version_info >= (3, 11)
+
+_C_GETTERS = (operator.itemgetter, operator.attrgetter, BuiltinFunctionType, MethodDescriptorType, MethodWrapperType)
+
+_last_decision: ContextVar[Decision | None] = ContextVar('ext_list_last_decision', default=None)
+
+
+class Decision:
+    """
+    The strategy chosen to run one call of an operator method, with the facts it was chosen from.
+
+    Attributes:
+        operator_name (str): The operator method, such as `'equal'`.
+        strategy (str): One of `'index'`, `'parallel'`, `'numpy'`, `'inline'`, `'compress'` or `'comprehension'`.
+        reason (str): Why the strategy was chosen.
+        kind (str): The kind of the key.
+        shape (str): The cached element shape of the list.
+        size (int): The length of the list.
+    """
+
+    __slots__ = ('operator_name', 'strategy', 'reason', 'kind', 'shape', 'size', 'index', 'access', 'attribute', 'arity')
+
+    def __init__(
+        self, operator_name: str, strategy: str, reason: str, spec: KeySpec, shape: str, size: int,
+        index: Any = None, access: str = CALL, attribute: str | None = None, arity: int = 0,
+    ) -> None:
+        self.operator_name = operator_name
+        self.strategy = strategy
+        self.reason = reason
+        self.kind = spec.kind
+        self.shape = shape
+        self.size = size
+        self.index = index
+        self.access = access
+        self.attribute = attribute
+        self.arity = arity
+
+    def __repr__(self) -> str:
+        return f'Decision({self.operator_name!r}, strategy={self.strategy!r}, reason={self.reason!r}, kind={self.kind!r}, size={self.size})'
+
+
+def explain(
+    elements: list[Any], operator_name: str, key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any,
+    engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None,
+) -> Decision:
+    """
+    Returns the decision an operator method would make for these arguments, without running it.
+
+    For `between`, which picks only between a sorted index and a comprehension, the target is ignored. The NumPy
+    strategy can still fall back when the values turn out not to compare exactly; :func:`last_decision`
+    reports what actually ran.
+
+    Examples:
+        >>> ext_list = ExtList([{'a': 1}, {'a': 2}])
+        >>> dispatch.explain(ext_list, 'equal', 'a', 1)
+        Decision('equal', strategy='inline', reason='the key is read by an inlined item lookup', kind='index', size=2)
+    """
+    if operator_name not in CONDITIONS and operator_name != 'between':
+        raise ValueError(f'Expected one of {tuple(CONDITIONS) + ("between",)} but got {operator_name!r}')
+
+    if not elements:
+        raise ValueError('Expected a non-empty list')
+
+    spec = resolve_key(elements, key, args)
+
+    if operator_name == 'between':
+        return decide_between(elements, spec)
+
+    return decide(elements, spec, operator_name, compare_target, engine, workers, executor)
+
+
+def last_decision() -> Decision | None:
+    """
+    Returns the decision of the last operator method run in this thread or task while instrumentation was enabled.
+
+    Decisions are recorded only under :func:`ext_list.instrument.enable`, so that calls do not build one otherwise. Use
+    :func:`explain` to see the decision for a call without enabling it.
+    """
+    return _last_decision.get()
+
+
+def decide(
+    elements: list[Any], spec: KeySpec, operator_name: str, compare_target: Any, engine: str | None, workers: int | None, executor: str | Executor | None,
+) -> Decision:
+    """
+    Picks the cheapest strategy for selecting from `elements`, from the cheapest down:
+
+    1. an index on the key, which reads only the matching positions;
+    2. a process or thread pool, when asked for and the list is long enough;
+    3. NumPy, when asked for;
+    4. a comprehension generated with the key inlined as an item or attribute lookup, or as a call of the key function
+       with its arguments passed one by one;
+    5. `compress` over `map`, when the key is read by a C function and the interpreter does not specialize comprehensions;
+    6. a comprehension calling the key.
+    """
+    shape = base.get_element_shape(elements)
+    size = len(elements)
+    index = find_usable_index(elements, spec, operator_name, compare_target)
+
+    if index is not None:
+        return Decision(operator_name, INDEXED, f'a {index.kind} index holds the key', spec, shape, size, index)
+
+    if operator_name not in COMPARISONS and operator_name not in MEMBERSHIP_OPERATORS:
+        return _decide_python(elements, spec, operator_name, shape, size)
+
+    if is_parallel(elements, workers, executor) and spec.kind in (CALLABLE, ATTR_NAME):
+        return Decision(operator_name, PARALLEL, 'a pool was asked for and the list is long enough', spec, shape, size)
+
+    if resolve_engine(engine) == NUMPY:
+        return Decision(operator_name, VECTORIZED, 'the NumPy engine was asked for', spec, shape, size)
+
+    return _decide_python(elements, spec, operator_name, shape, size)
+
+
+def select(
+    elements: list[Any], spec: KeySpec, operator_name: str, compare_target: Any,
+    engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None,
+) -> list[Any]:
+    """
+    Returns the elements whose value for the key satisfies the operator against `compare_target`, in list order.
+    """
+    if not (instrument.enabled or getattr(elements, '_indexes', None) or workers is not None or executor is not None) and resolve_engine(engine) != NUMPY:
+        # Only the Python strategies are left to pick from and there is no decision to record, so none is built.
+        if operator_name in MEMBERSHIP_OPERATORS:
+            return _select_members(elements, spec, operator_name, compare_target)
+
+        return _run(elements, spec, operator_name, compare_target)
+
+    decision = decide(elements, spec, operator_name, compare_target, engine, workers, executor)
+    _record(decision)
+
+    if decision.strategy == INDEXED:
+        return _select_by_index(elements, decision.index, operator_name, compare_target)
+
+    if decision.strategy == PARALLEL:
+        selected = parallel_select(elements, spec, operator_name, compare_target, workers, executor)
+
+        if selected is not None:
+            return selected
+
+        decision = _decide_python(elements, spec, operator_name, decision.shape, decision.size)
+        decision.reason = f'the key cannot be sent to the workers, and {decision.reason}'
+        _record(decision)
+
+    if decision.strategy == VECTORIZED:
+        # The key is called once per element, and the same values are compared in Python when NumPy declines them.
+        values = list(map(spec.getter, elements))
+        selected = vectorized_select(elements, values, operator_name, compare_target, engine)
+
+        if selected is not None:
+            return selected
+
+        _record(Decision(operator_name, COMPRESS, 'NumPy cannot compare these values exactly, so they are compared in Python', spec, decision.shape, decision.size))
+
+        if operator_name in MEMBERSHIP_OPERATORS:
+            return _select_member_values(elements, values, operator_name, compare_target)
+
+        return list(compress(elements, map(COMPARISONS[operator_name], values, repeat(compare_target))))
+
+    if operator_name in MEMBERSHIP_OPERATORS:
+        return _select_members(elements, spec, operator_name, compare_target)
+
+    return _run(elements, spec, operator_name, compare_target)
+
+
+def decide_between(elements: list[Any], spec: KeySpec) -> Decision:
+    """
+    Picks the strategy for `between`: a sorted index on the key, or else a generated comprehension.
+    """
+    shape = base.get_element_shape(elements)
+    size = len(elements)
+    index = find_usable_index(elements, spec, 'between', None)
+
+    if index is not None:
+        return Decision('between', INDEXED, f'a {index.kind} index holds the key', spec, shape, size, index)
+
+    return _decide_python(elements, spec, 'between', shape, size)
+
+
+def select_between(elements: list[Any], spec: KeySpec, lower: Any, upper: Any, inclusive: str = BOTH) -> list[Any]:
+    """
+    Returns the elements whose value for the key lies between `lower` and `upper`, in list order.
+    """
+    if instrument.enabled or getattr(elements, '_indexes', None):
+        decision = decide_between(elements, spec)
+        _record(decision)
+
+        if decision.strategy == INDEXED:
+            count_fast_path('sorted_index')
+            return [elements[position] for position in decision.index.between(lower, upper, inclusive)]
+
+    select = selector(BETWEEN_CONDITIONS[inclusive], *key_access(spec))
+
+    return select(elements, lower, upper, spec.key, spec.getter, spec.args)
+
+
+def _record(decision: Decision) -> None:
+    if instrument.enabled:
+        _last_decision.set(decision)
+
+
+def _python_strategy(spec: KeySpec, operator_name: str) -> str:
+    if key_access(spec)[0] != CALL:
+        return INLINE
+
+    if not SPECIALIZING_INTERPRETER and operator_name in COMPARISONS and is_c_getter(spec):
+        return COMPRESS
+
+    return COMPREHENSION
+
+
+def _python_plan(spec: KeySpec, operator_name: str) -> tuple[str, Callable[..., list[Any]]]:
+    """
+    Returns the Python strategy for the operator and the generated selector which runs it, kept on the KeySpec.
+    """
+    plan = spec.plans.get(operator_name)
+
+    if plan is None:
+        plan = spec.plans[operator_name] = (_python_strategy(spec, operator_name), selector(CONDITIONS[operator_name], *key_access(spec)))
+
+    return plan
+
+
+def _decide_python(elements: list[Any], spec: KeySpec, operator_name: str, shape: str, size: int) -> Decision:
+    access, attribute, arity = key_access(spec)
+
+    if access == ITEM:
+        return Decision(operator_name, INLINE, 'the key is read by an inlined item lookup', spec, shape, size, access=ITEM)
+
+    if access == ATTRIBUTE:
+        return Decision(operator_name, INLINE, 'the key is read by an inlined attribute lookup', spec, shape, size, access=ATTRIBUTE, attribute=attribute)
+
+    if access == FUNCTION:
+        return Decision(operator_name, INLINE, 'the key function is called with its arguments inlined', spec, shape, size, access=FUNCTION, arity=arity)
+
+    if _python_strategy(spec, operator_name) == COMPRESS:
+        return Decision(operator_name, COMPRESS, 'the key is read by a C function', spec, shape, size)
+
+    return Decision(operator_name, COMPREHENSION, 'the key is read by a Python function', spec, shape, size)
+
+
+def key_access(spec: KeySpec) -> tuple[str, str | None, int]:
+    """
+    Returns how a generated comprehension reads the key, as `(access, attribute, arity)` for :func:`ext_list.codegen.selector`.
+
+    The result is kept on the KeySpec, so a compiled key is inspected once.
+    """
+    if spec.access is None:
+        spec.access = _key_access(spec)
+
+    return spec.access
+
+
+def _key_access(spec: KeySpec) -> tuple[str, str | None, int]:
+    if spec.kind == INDEX:
+        return ITEM, None, 0
+
+    attribute = _descriptor_name(spec)
+
+    if attribute is not None:
+        return ATTRIBUTE, attribute, 0
+
+    if spec.kind == CALLABLE and spec.args and callable(spec.key):
+        return FUNCTION, None, len(spec.args)
+
+    return CALL, None, 0
+
+
+def is_c_getter(spec: KeySpec) -> bool:
+    return isinstance(spec.getter, _C_GETTERS)
+
+
+def _descriptor_name(spec: KeySpec) -> str | None:
+    """
+    Returns the attribute name of a slot or C-level attribute key, which reads the same through `element.<name>`.
+    """
+    if spec.kind != PROPERTY:
+        return None
+
+    descriptor = getattr(spec.getter, '__self__', None)
+
+    if not isinstance(descriptor, (MemberDescriptorType, GetSetDescriptorType)):
+        return None
+
+    name = descriptor.__name__
+
+    return name if is_attribute_name(name) else None
+
+
+def find_usable_index(elements: list[Any], spec: KeySpec, operator_name: str, compare_target: Any) -> Any:
+    """
+    Returns an index of the list which answers the operator for the key and target, or None.
+    """
+    if operator_name in ('equal', 'not_equal'):
+        return find_index(elements, spec, HASH) if base.is_hashable(compare_target) else None
+
+    if operator_name in MEMBERSHIP_OPERATORS:
+        return find_index(elements, spec, HASH) if base.is_hashable_collection(compare_target) else None
+
+    if operator_name in COMPARISONS or operator_name == 'between':
+        return find_index(elements, spec, SORTED)
+
+    return None
+
+
+def _select_by_index(elements: list[Any], index: Any, operator_name: str, compare_target: Any) -> list[Any]:
+    count_fast_path(f'{index.kind}_index')
+
+    if operator_name == 'equal':
+        return [elements[position] for position in index.lookup(compare_target)]
+
+    if operator_name == 'in_':
+        return [elements[position] for position in index.members(compare_target)]
+
+    if operator_name == 'not_equal':
+        excluded = set(index.lookup(compare_target))
+        return [element for position, element in enumerate(elements) if position not in excluded]
+
+    if operator_name == 'not_in_':
+        excluded = set(index.members(compare_target))
+        return [element for position, element in enumerate(elements) if position not in excluded]
+
+    return [elements[position] for position in getattr(index, operator_name)(compare_target)]
+
+
+def _select_members(elements: list[Any], spec: KeySpec, operator_name: str, compare_target: Any) -> list[Any]:
+    probe = base.to_probe_set(compare_target)
+
+    if probe is None:
+        count_fast_path('membership_scan')
+        return _run(elements, spec, operator_name, compare_target)
+
+    if key_access(spec)[0] in (ITEM, ATTRIBUTE):
+        # Inlined lookups call no key function, so the values are simply read again when one of them is unhashable.
+        try:
+            selected = _run(elements, spec, operator_name, probe)
+            count_fast_path('membership_set')
+            return selected
+
+        except TypeError:
+            count_fast_path('membership_scan')
+            return _run(elements, spec, operator_name, compare_target)
+
+    return _select_member_values(elements, list(map(spec.getter, elements)), operator_name, compare_target, probe)
+
+
+def _select_member_values(elements: list[Any], values: list[Any], operator_name: str, compare_target: Any, probe: Any = None) -> list[Any]:
+    """
+    Returns the elements whose value in `values` passes the membership operator, testing the values against a set, or
+    scanning the collection for them if one of them cannot be hashed.
+    """
+    if probe is None:
+        probe = base.to_probe_set(compare_target)
+
+    if probe is not None:
+        try:
+            selected = _compress_members(elements, values, operator_name, probe)
+            count_fast_path('membership_set')
+            return selected
+
+        except TypeError:
+            pass
+
+    count_fast_path('membership_scan')
+    tests = map(operator.contains, repeat(compare_target), values)
+
+    return list(compress(elements, tests if operator_name == 'in_' else map(operator.not_, tests)))
+
+
+def _compress_members(elements: list[Any], values: list[Any], operator_name: str, compare_target: Any) -> list[Any]:
+    tests = map(compare_target.__contains__, values)
+
+    return list(compress(elements, tests if operator_name == 'in_' else map(operator.not_, tests)))
+
+
+def _run(elements: list[Any], spec: KeySpec, operator_name: str, compare_target: Any) -> list[Any]:
+    strategy, select = _python_plan(spec, operator_name)
+
+    if strategy == COMPRESS:
+        return list(compress(elements, map(COMPARISONS[operator_name], map(spec.getter, elements), repeat(compare_target))))
+
+    return select(elements, compare_target, None, spec.key, spec.getter, spec.args)
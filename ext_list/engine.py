@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import math
+import operator
+from itertools import compress
+from typing import Any
+from typing import Callable
+
+from ext_list.instrument import count_fast_path
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+PYTHON = 'python'
+NUMPY = 'numpy'
+
+ENGINES = (PYTHON, NUMPY)
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+# Every int whose magnitude is at most 2 ** 53 converts to a float64 exactly.
+EXACT_FLOAT_INT = 2 ** 53
+
+COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    'equal': operator.eq,
+    'not_equal': operator.ne,
+    'greater': operator.gt,
+    'greater_or_equal': operator.ge,
+    'less': operator.lt,
+    'less_or_equal': operator.le,
+}
+
+_default_engine = PYTHON
+
+
+def set_default_engine(engine: str) -> None:
+    """
+    Sets the engine used by the operator methods when no `engine` is passed.
+
+    Args:
+        engine (str): `'python'` or `'numpy'`.
+
+    Raises:
+        ValueError: If the engine is unknown.
+        ImportError: If the engine is `'numpy'` and NumPy is not installed.
+    """
+    global _default_engine
+    _default_engine = resolve_engine(engine)
+
+
+def get_default_engine() -> str:
+    return _default_engine
+
+
+def resolve_engine(engine: str | None) -> str:
+    if engine is None:
+        return _default_engine
+
+    if engine not in ENGINES:
+        raise ValueError(f'Expected one of {ENGINES} but got {engine!r}')
+
+    if engine == NUMPY and numpy is None:
+        raise ImportError("The 'numpy' engine requires NumPy to be installed")
+
+    return engine
+
+
+def vectorized_select(elements: list[Any], values: list[Any], operator_name: str, compare_target: Any, engine: str | None) -> list[Any] | None:
+    """
+    Returns the elements selected by comparing `values`, the key column of `elements`, with NumPy, or None if the
+    values should be compared in Python instead.
+
+    The column is vectorized only when NumPy gives exactly the result of the Python comparisons: every value is an
+    int within int64 or every value is a float, and the targets convert to the same dtype without rounding.
+    """
+    if resolve_engine(engine) != NUMPY:
+        return None
+
+    column = _to_array(values)
+
+    if column is None:
+        return None
+
+    if operator_name in ('in_', 'not_in_'):
+        targets = _to_targets(column, compare_target)
+
+        if targets is None:
+            return None
+
+        mask = numpy.isin(column, targets, invert=operator_name == 'not_in_')
+
+    else:
+        if not _is_exact_target(column, compare_target):
+            return None
+
+        mask = COMPARISONS[operator_name](column, compare_target)
+
+    count_fast_path('numpy')
+
+    return list(compress(elements, mask.tolist()))
+
+
+def _to_array(values: list[Any]) -> Any:
+    if all(type(value) is int for value in values):
+        if min(values) < INT64_MIN or max(values) > INT64_MAX:
+            return None
+
+        return numpy.array(values, dtype=numpy.int64)
+
+    if all(type(value) is float for value in values):
+        return numpy.array(values, dtype=numpy.float64)
+
+    return None
+
+
+def _is_exact_target(column: Any, compare_target: Any) -> bool:
+    if type(compare_target) is int:
+        if column.dtype == numpy.int64:
+            return INT64_MIN <= compare_target <= INT64_MAX
+
+        return -EXACT_FLOAT_INT <= compare_target <= EXACT_FLOAT_INT
+
+    if type(compare_target) is float:
+        if column.dtype == numpy.float64:
+            return True
+
+        return bool(numpy.all(numpy.abs(column) <= EXACT_FLOAT_INT))
+
+    return False
+
+
+def _to_targets(column: Any, compare_target: Any) -> Any:
+    if not isinstance(compare_target, (list, tuple, set, frozenset)):
+        return None
+
+    targets = list(compare_target)
+
+    if column.dtype == numpy.int64:
+        if all(type(target) is int and INT64_MIN <= target <= INT64_MAX for target in targets):
+            return numpy.array(targets, dtype=numpy.int64)
+
+        return None
+
+    # NaN is excluded, since `in` matches a NaN held by both the column and the targets by identity.
+    if all(type(target) is float and not math.isnan(target) or type(target) is int and -EXACT_FLOAT_INT <= target <= EXACT_FLOAT_INT for target in targets):
+        return numpy.array(targets, dtype=numpy.float64)
+
+    return None
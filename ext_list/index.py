@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import bisect
+import operator
+from typing import Any
+from typing import Hashable
+
+from ext_list import base
+from ext_list.keys import KeySpec
+from ext_list.keys import resolve_key
+from ext_list.row_plan import RowPlan
+
+HASH = 'hash'
+SORTED = 'sorted'
+SORT_KEYS = 'sort_keys'
+
+BOTH = 'both'
+NEITHER = 'neither'
+LEFT = 'left'
+RIGHT = 'right'
+
+SORTED_INCREMENTAL_LIMIT = 32
+
+# The sort key caches kept per list. Each one holds a column per key and is extended on every append.
+SORT_KEY_CACHE_SIZE = 4
+
+
+class HashIndex:
+    """
+    A secondary index from the value of a key to the positions of the elements holding that value.
+
+    Positions are kept in ascending order, and values are kept in the order in which they first appear in the list.
+    Values not equal to themselves, such as NaN, would be found by identity in the dict although `==` never matches
+    them. They are kept apart in `unordered` and compared one by one on every lookup.
+    """
+
+    kind = HASH
+
+    def __init__(self, key: Any, args: tuple[Any, ...] = ()) -> None:
+        self.key = key
+        self.args = args
+        self.spec: KeySpec | None = None
+        self.positions: dict[Hashable, list[int]] = {}
+        self.unordered: list[tuple[int, Any]] = []
+        self.stale = True
+
+    def rebuild(self, elements: list[Any]) -> None:
+        if not elements:
+            self.positions = {}
+            self.unordered = []
+            self.stale = True
+            return
+
+        self.spec = resolve_key(elements, self.key, self.args)
+        self.positions = {}
+        self.unordered = []
+        self.__add(elements, 0)
+        self.stale = False
+
+    def add(self, elements: list[Any], start: int) -> None:
+        if self.stale:
+            return
+
+        try:
+            self.__add(elements, start)
+
+        except Exception:
+            self.stale = True
+
+    def lookup(self, value: Any) -> list[int]:
+        if not self.unordered:
+            return self.positions.get(value, [])
+
+        positions = self.positions.get(value, []) + [position for position, unordered in self.unordered if unordered == value]
+
+        return sorted(positions)
+
+    def members(self, values: Any) -> list[int]:
+        """
+        Returns the positions, in ascending order, of the elements whose value is in the collection `values`.
+        """
+        positions = [position for value in set(values) for position in self.positions.get(value, ())]
+        positions.extend(position for position, unordered in self.unordered if unordered in values)
+
+        return sorted(positions)
+
+    def __add(self, elements: list[Any], start: int) -> None:
+        positions = self.positions
+        get_value = self.spec.getter  # type: ignore[union-attr]
+
+        for position in range(start, len(elements)):
+            value = get_value(elements[position])
+
+            if value in positions:
+                positions[value].append(position)
+
+            elif value != value:
+                self.unordered.append((position, value))
+
+            else:
+                positions[value] = [position]
+
+
+class SortedIndex:
+    """
+    A secondary index holding the values of a key in ascending order, together with the positions of their elements.
+
+    Range queries are answered by bisection and return positions in list order. Values not equal to themselves, such as
+    NaN, have no place in the order. They are kept apart in `unordered` and compared one by one on every query.
+    """
+
+    kind = SORTED
+
+    def __init__(self, key: Any, args: tuple[Any, ...] = ()) -> None:
+        self.key = key
+        self.args = args
+        self.spec: KeySpec | None = None
+        self.values: list[Any] = []
+        self.positions: list[int] = []
+        self.unordered: list[tuple[int, Any]] = []
+        self.stale = True
+
+    def rebuild(self, elements: list[Any]) -> None:
+        if not elements:
+            self.values = []
+            self.positions = []
+            self.unordered = []
+            self.stale = True
+            return
+
+        self.spec = resolve_key(elements, self.key, self.args)
+        values = [self.spec.getter(element) for element in elements]
+        self.unordered = [(position, value) for position, value in enumerate(values) if value != value]
+        ordered = [position for position, value in enumerate(values) if value == value] if self.unordered else range(len(values))
+        self.positions = sorted(ordered, key=values.__getitem__)
+        self.values = [values[position] for position in self.positions]
+        self.stale = False
+
+    def add(self, elements: list[Any], start: int) -> None:
+        if self.stale:
+            return
+
+        if len(elements) - start > SORTED_INCREMENTAL_LIMIT:
+            self.stale = True
+            return
+
+        try:
+            for position in range(start, len(elements)):
+                value = self.spec.getter(elements[position])  # type: ignore[union-attr]
+
+                if value != value:
+                    self.unordered.append((position, value))
+                    continue
+
+                insert_at = bisect.bisect_right(self.values, value)
+                self.values.insert(insert_at, value)
+                self.positions.insert(insert_at, position)
+
+        except Exception:
+            self.stale = True
+
+    def greater(self, value: Any) -> list[int]:
+        return self.__select(bisect.bisect_right(self.values, value), len(self.values), lambda unordered: unordered > value)
+
+    def greater_or_equal(self, value: Any) -> list[int]:
+        return self.__select(bisect.bisect_left(self.values, value), len(self.values), lambda unordered: unordered >= value)
+
+    def less(self, value: Any) -> list[int]:
+        return self.__select(0, bisect.bisect_left(self.values, value), lambda unordered: unordered < value)
+
+    def less_or_equal(self, value: Any) -> list[int]:
+        return self.__select(0, bisect.bisect_right(self.values, value), lambda unordered: unordered <= value)
+
+    def between(self, lower: Any, upper: Any, inclusive: str = BOTH) -> list[int]:
+        if inclusive in (BOTH, LEFT):
+            start = bisect.bisect_left(self.values, lower)
+            above_lower = operator.le
+
+        else:
+            start = bisect.bisect_right(self.values, lower)
+            above_lower = operator.lt
+
+        if inclusive in (BOTH, RIGHT):
+            stop = bisect.bisect_right(self.values, upper)
+            below_upper = operator.le
+
+        else:
+            stop = bisect.bisect_left(self.values, upper)
+            below_upper = operator.lt
+
+        return self.__select(start, stop, lambda unordered: above_lower(lower, unordered) and below_upper(unordered, upper))
+
+    def __select(self, start: int, stop: int, test: Any) -> list[int]:
+        positions = self.positions[start:stop]
+        positions.extend(position for position, value in self.unordered if test(value))
+
+        return sorted(positions)
+
+
+class SortKeyCache:
+    """
+    The values of the keys of `sort_by`, computed once per element and kept as one column per key in list order.
+
+    The cache is registered with the indexes of the list, so that appending extends it and other mutations of the list
+    mark it stale. `sort_by` permutes the columns together with the list instead of computing them again. Like the
+    indexes, the cache does not see elements modified in place, whose cached values stay those computed before.
+    """
+
+    kind = SORT_KEYS
+
+    def __init__(self, keys: tuple[Any, ...], arg_tuples: tuple[tuple[Any, ...], ...] = ()) -> None:
+        self.keys = keys
+        self.arg_tuples = arg_tuples
+        self.plan: RowPlan | None = None
+        self.columns: list[list[Any]] = []
+        self.stale = True
+
+    def rebuild(self, elements: list[Any]) -> None:
+        self.plan = RowPlan.compile(elements, list(self.keys), list(self.arg_tuples))
+        self.columns = [[get_value(element) for element in elements] for get_value in self.plan.accessors]
+        self.stale = False
+
+    def add(self, elements: list[Any], start: int) -> None:
+        if self.stale:
+            return
+
+        try:
+            for column, get_value in zip(self.columns, self.plan.accessors):  # type: ignore[union-attr]
+                column.extend(get_value(elements[position]) for position in range(start, len(elements)))
+
+        except Exception:
+            self.stale = True
+
+    def permute(self, order: list[int]) -> None:
+        self.columns = [[column[position] for position in order] for column in self.columns]
+
+
+def remember_sort_keys(elements: list[Any], sort_keys_id: tuple[Any, ...], sort_keys: SortKeyCache) -> None:
+    """
+    Registers `sort_keys` as the most recently used sort key cache of the list, dropping the least recently used caches
+    beyond `SORT_KEY_CACHE_SIZE`.
+    """
+    indexes = elements._indexes  # type: ignore[attr-defined]
+    indexes.pop(sort_keys_id, None)
+    indexes[sort_keys_id] = sort_keys
+    cached = [identity for identity, index in indexes.items() if index.kind == SORT_KEYS]
+
+    for identity in cached[:-SORT_KEY_CACHE_SIZE]:
+        del indexes[identity]
+
+
+def index_id(key: Any, args: tuple[Any, ...], kind: str) -> tuple[Any, tuple[Any, ...], str]:
+    if isinstance(key, KeySpec):
+        return (key.key, key.args, kind)
+
+    return (key, args, kind)
+
+
+def find_index(elements: list[Any], spec: KeySpec, kind: str) -> Any:
+    """
+    Returns the up-to-date index of `kind` for `spec` registered on `elements`, or None if there is none.
+
+    A stale index is rebuilt here. An index whose key values are no longer hashable or comparable is dropped.
+    """
+    indexes = getattr(elements, '_indexes', None)
+
+    if not indexes:
+        return None
+
+    try:
+        index = indexes.get(index_id(spec, (), kind))
+
+    except TypeError:
+        return None
+
+    if index is None:
+        return None
+
+    if index.stale:
+        try:
+            index.rebuild(elements)
+
+        except TypeError:
+            del indexes[index_id(spec, (), kind)]
+            return None
+
+        if index.stale:
+            return None
+
+    if index.spec.kind != spec.kind:
+        return None
+
+    return index
+
+
+def extend_indexes(elements: list[Any], start: int) -> None:
+    for index in getattr(elements, '_indexes', {}).values():
+        index.add(elements, start)
+
+
+def invalidate_indexes(elements: list[Any]) -> None:
+    for index in getattr(elements, '_indexes', {}).values():
+        index.stale = True
+
+
+def retain(elements: list[Any], selected: list[Any]) -> list[Any]:
+    """
+    Replaces the contents of `elements` with `selected`, a subset of it in list order, and returns `elements`.
+
+    The whole slice is assigned over, so the list object is kept and no element is copied. A homogeneous element shape
+    still holds for the subset, but the positions held by indexes do not.
+    """
+    list.__setitem__(elements, slice(None), selected)
+
+    if hasattr(elements, '_element_shape') and (not elements or elements._element_shape == base.MIXED):
+        elements._element_shape = base.UNKNOWN  # type: ignore[attr-defined]
+
+    invalidate_indexes(elements)
+
+    return elements
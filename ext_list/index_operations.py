@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import List
+from typing import TypeVar
+
+from ext_list.index import HASH
+from ext_list.index import HashIndex
+from ext_list.index import index_id
+from ext_list.index import SORTED
+from ext_list.index import SortedIndex
+from ext_list.keys import KeySpec
+
+T = TypeVar('T')
+
+INDEX_TYPES: dict[str, type] = {HASH: HashIndex, SORTED: SortedIndex}
+
+
+class _IndexOperation(List[T]):  # type: ignore
+    def create_index(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, kind: str = HASH) -> None:
+        if kind not in INDEX_TYPES:
+            raise ValueError(f'Unknown index kind: {kind!r}')
+
+        index = INDEX_TYPES[kind](key, args)
+        index.rebuild(self)
+
+        self._indexes[index_id(key, args, kind)] = index  # type: ignore[attr-defined]
+
+    def drop_index(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, kind: str = HASH) -> None:
+        del self._indexes[index_id(key, args, kind)]  # type: ignore[attr-defined]
+
+    def has_index(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, kind: str = HASH) -> bool:
+        return index_id(key, args, kind) in self._indexes  # type: ignore[attr-defined]
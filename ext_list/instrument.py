@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any
+from typing import Callable
+
+# Whether calls are being recorded. Read it, but change it through `enable` and `disable`.
+enabled = False
+
+# How many times each fast path was taken while calls were being recorded.
+FAST_PATH_COUNTS: Counter[str] = Counter()
+
+# Methods which return one element rather than a collection, so the length of their result is not an output size.
+ELEMENT_METHODS = frozenset(('one', 'first', 'nth_by', 'is_duplicate', 'has_index'))
+
+_hook: Callable[[Call], None] | None = None
+_stats: dict[str, MethodStats] = {}
+_originals: dict[str, Callable[..., Any]] = {}
+_current: ContextVar[Call | None] = ContextVar('ext_list_instrument_call', default=None)
+
+
+class Call:
+    """
+    One recorded call of an ExtList method, as passed to the hook.
+
+    Attributes:
+        method (str): The name of the method.
+        input_size (int): The length of the list the method was called on.
+        output_size (int | None): The length of the returned list or dict, or None for other results.
+        time (float): The time spent in the method, in seconds.
+        key_kinds (Counter[str]): How many keys were resolved per kind: `'index'`, `'callable'`, `'property'` or `'attr_name'`.
+        fast_paths (Counter[str]): How many times each fast path was taken, such as `'hash_index'` or `'numpy'`.
+    """
+
+    __slots__ = ('method', 'input_size', 'output_size', 'time', 'key_kinds', 'fast_paths')
+
+    def __init__(self, method: str, input_size: int) -> None:
+        self.method = method
+        self.input_size = input_size
+        self.output_size: int | None = None
+        self.time = 0.0
+        self.key_kinds: Counter[str] = Counter()
+        self.fast_paths: Counter[str] = Counter()
+
+    def __repr__(self) -> str:
+        return f'Call(method={self.method!r}, input_size={self.input_size}, output_size={self.output_size}, time={self.time:.6f})'
+
+
+class MethodStats:
+    __slots__ = ('calls', 'input_size', 'output_size', 'time', 'key_kinds', 'fast_paths')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.input_size = 0
+        self.output_size = 0
+        self.time = 0.0
+        self.key_kinds: Counter[str] = Counter()
+        self.fast_paths: Counter[str] = Counter()
+
+    def add(self, call: Call) -> None:
+        self.calls += 1
+        self.input_size += call.input_size
+        self.output_size += call.output_size or 0
+        self.time += call.time
+        self.key_kinds.update(call.key_kinds)
+        self.fast_paths.update(call.fast_paths)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'input_size': self.input_size,
+            'output_size': self.output_size,
+            'time': self.time,
+            'key_kinds': dict(self.key_kinds),
+            'fast_paths': dict(self.fast_paths),
+        }
+
+
+def enable(hook: Callable[[Call], None] | None = None) -> None:
+    """
+    Starts recording every call of the ExtList methods, passing each recorded :class:`Call` to `hook` if it is given.
+
+    The methods are wrapped only while recording is enabled, so disabled instrumentation costs the methods nothing
+    beyond one branch where a key is resolved or a fast path is taken.
+
+    Examples:
+        >>> instrument.enable()
+        >>> ExtList([{'a': 1}, {'a': 2}]).equal('a', 1)
+        [{'a': 1}]
+        >>> stats = instrument.snapshot()['equal']
+        >>> stats['calls'], stats['input_size'], stats['output_size'], stats['key_kinds']
+        (1, 2, 1, {'index': 1})
+    """
+    global enabled, _hook
+
+    _hook = hook
+
+    if enabled:
+        return
+
+    from ext_list import ExtList
+
+    for name in _method_names(ExtList):
+        _originals[name] = ExtList.__dict__.get(name)
+        setattr(ExtList, name, _instrumented(name, getattr(ExtList, name)))
+
+    enabled = True
+
+
+def disable() -> None:
+    """
+    Stops recording and restores the methods. The recorded statistics are kept until :func:`reset`.
+    """
+    global enabled, _hook
+
+    if not enabled:
+        return
+
+    from ext_list import ExtList
+
+    for name, method in _originals.items():
+        if method is None:
+            delattr(ExtList, name)
+
+        else:
+            setattr(ExtList, name, method)
+
+    _originals.clear()
+    _hook = None
+    enabled = False
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """
+    Returns the statistics recorded per method: the number of calls, the total input and output sizes, the total time
+    in seconds, and how many times each kind of key and each fast path was used.
+    """
+    return {method: stats.to_dict() for method, stats in _stats.items()}
+
+
+def reset() -> None:
+    """
+    Clears the recorded statistics and the fast path counters.
+    """
+    _stats.clear()
+    FAST_PATH_COUNTS.clear()
+
+
+def count_fast_path(name: str) -> None:
+    if enabled:
+        FAST_PATH_COUNTS[name] += 1
+        call = _current.get()
+
+        if call is not None:
+            call.fast_paths[name] += 1
+
+
+def record_key_kind(kind: str) -> None:
+    call = _current.get()
+
+    if call is not None:
+        call.key_kinds[kind] += 1
+
+
+def _method_names(ext_list_type: type) -> list[str]:
+    """
+    Returns the public methods ExtList defines over its operation mixins.
+    """
+    operations = [base_type for base_type in ext_list_type.__mro__ if base_type.__name__.endswith('Operation')]
+    names = {name for operation in operations for name in vars(operation) if not name.startswith('_')}
+
+    return sorted(name for name in names if callable(getattr(ext_list_type, name)))
+
+
+def _instrumented(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def record_async(self: Any, *args: Any, **kwargs: Any) -> Any:
+            call, token = _begin(name, self)
+
+            try:
+                result = await method(self, *args, **kwargs)
+                _finish(call, result)
+                return result
+
+            finally:
+                _end(call, token)
+
+        return record_async
+
+    @functools.wraps(method)
+    def record(self: Any, *args: Any, **kwargs: Any) -> Any:
+        call, token = _begin(name, self)
+
+        try:
+            result = method(self, *args, **kwargs)
+            _finish(call, result)
+            return result
+
+        finally:
+            _end(call, token)
+
+    return record
+
+
+def _begin(name: str, elements: Any) -> tuple[Call, Any]:
+    call = Call(name, len(elements))
+    call.time = time.perf_counter()
+
+    return call, _current.set(call)
+
+
+def _finish(call: Call, result: Any) -> None:
+    if call.method not in ELEMENT_METHODS and isinstance(result, (list, dict)):
+        call.output_size = len(result)
+
+
+def _end(call: Call, token: Any) -> None:
+    call.time = time.perf_counter() - call.time
+    _current.reset(token)
+    _stats.setdefault(call.method, MethodStats()).add(call)
+
+    if _hook is not None:
+        _hook(call)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterator
+from typing import Mapping
+
+from ext_list.keys import resolve_key
+from ext_list.row_plan import RowPlan
+
+INNER = 'inner'
+LEFT = 'left'
+SEMI = 'semi'
+ANTI = 'anti'
+
+JOIN_TYPES = (INNER, LEFT, SEMI, ANTI)
+
+
+def hash_join(
+    left: list[Any], right: list[Any], left_key: Any, right_key: Any, how: str, left_args: Any = (), right_args: Any = (), merge: bool = False,
+) -> Iterator[Any]:
+    """
+    Yields the result of joining `left` with `right` on equal keys.
+
+    The inner join builds its hash table on the smaller list and probes it with the larger one, so its pairs come in
+    the order of the larger list. The other joins build the table on `right` and yield in the order of `left`.
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError(f'Expected one of {JOIN_TYPES} but got {how!r}')
+
+    return _join(left, right, _key_function(left, left_key, left_args), _key_function(right, right_key, right_args), how, merge)
+
+
+def _join(left: list[Any], right: list[Any], get_left: Any, get_right: Any, how: str, merge: bool) -> Iterator[Any]:
+    if how == INNER and len(left) < len(right):
+        table = _build_table(left, get_left)
+
+        for right_element in right:
+            for left_element in table.get(get_right(right_element), ()):
+                yield _row(left_element, right_element, merge)
+
+        return
+
+    table = _build_table(right, get_right)
+
+    for left_element in left:
+        matches = table.get(get_left(left_element))
+
+        if how == SEMI:
+            if matches:
+                yield left_element
+
+        elif how == ANTI:
+            if not matches:
+                yield left_element
+
+        elif matches:
+            for right_element in matches:
+                yield _row(left_element, right_element, merge)
+
+        elif how == LEFT:
+            yield _row(left_element, None, merge)
+
+
+def _build_table(elements: list[Any], get_key: Callable[[Any], Hashable]) -> dict[Hashable, list[Any]]:
+    table: dict[Hashable, list[Any]] = {}
+
+    for element in elements:
+        key = get_key(element)
+
+        if key in table:
+            table[key].append(element)
+
+        else:
+            table[key] = [element]
+
+    return table
+
+
+def _key_function(elements: list[Any], key: Any, args: Any) -> Callable[[Any], Hashable] | None:
+    """
+    Compiles a single key, or a list of keys into a function returning their values as a tuple, as
+    `to_dict_with_complex_keys` does. For a list of keys, `args` is the list of argument tuples.
+    """
+    if not elements:
+        return None
+
+    if isinstance(key, list):
+        return RowPlan.compile(elements, key, args).to_key
+
+    return resolve_key(elements, key, args).getter
+
+
+def _row(left_element: Any, right_element: Any, merge: bool) -> Any:
+    if not merge:
+        return (left_element, right_element)
+
+    if not isinstance(left_element, Mapping) or not (right_element is None or isinstance(right_element, Mapping)):
+        raise TypeError(f'Expected dictionaries to merge but got {type(left_element)} and {type(right_element)}')
+
+    if right_element is None:
+        return dict(left_element)
+
+    return {**left_element, **right_element}
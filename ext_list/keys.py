@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import operator
+from functools import lru_cache
+from types import FunctionType
+from types import GetSetDescriptorType
+from types import MemberDescriptorType
+from types import MethodDescriptorType
+from typing import Any
+from typing import Callable
+from typing import Hashable
+
+from ext_list import base
+from ext_list import instrument
+
+INDEX = 'index'
+CALLABLE = 'callable'
+PROPERTY = 'property'
+ATTR_NAME = 'attr_name'
+
+KEY_CACHE_SIZE = 1024
+
+_MISSING = object()
+
+
+class KeySpec:
+    """
+    A key resolved once into a fast one-argument accessor.
+
+    Every method of ExtList which takes a key also accepts a KeySpec, in which case the key is not resolved again.
+
+    Attributes:
+        key: The key which was compiled.
+        args (tuple[Any, ...]): The arguments bound to the key, if the key is a function.
+        kind (str): How the value is read. One of `'index'`, `'callable'`, `'property'` or `'attr_name'`.
+        name (Hashable): The column name of the key, as used by `to_dict_list`.
+        getter (Callable[[Any], Any]): The accessor. It takes an element and returns the value of the key.
+        portable (tuple[Any, ...] | None): A picklable form of the accessor, from which :func:`restore_getter` rebuilds
+            it in another process without resolving the key again. None if the accessor cannot be sent.
+        access (tuple[str, str | None, int] | None): How generated comprehensions read the key, worked out by
+            :func:`ext_list.dispatch.key_access` on first use.
+        plans (dict[str, tuple[str, Callable[..., list[Any]]]]): The Python strategy and generated selector per operator
+            method, filled in by :mod:`ext_list.dispatch` on first use.
+
+    Examples:
+        >>> spec = compile_key(Person.get_age_n_years_ago, Person('Alice', 25), 5)
+        >>> spec(Person('Bob', 30))
+        25
+        >>> ExtList([Person('Alice', 25), Person('Bob', 30)]).equal(spec, 25)
+        [Person('Bob', 30)]
+    """
+
+    __slots__ = ('key', 'args', 'kind', 'name', 'getter', 'portable', 'access', 'plans')
+
+    def __init__(
+        self, key: Any, kind: str, getter: Callable[[Any], Any], name: Hashable, args: tuple[Any, ...] = (),
+        portable: tuple[Any, ...] | None = None,
+    ) -> None:
+        self.key = key
+        self.args = args
+        self.kind = kind
+        self.name = name
+        self.getter = getter
+        self.portable = portable
+        self.access: tuple[str, str | None, int] | None = None
+        self.plans: dict[str, tuple[str, Callable[..., list[Any]]]] = {}
+
+    def __call__(self, element: Any) -> Any:
+        return self.getter(element)
+
+    def __repr__(self) -> str:
+        return f'KeySpec(key={self.key!r}, kind={self.kind!r}, args={self.args!r})'
+
+
+def compile_key(key: Callable[..., Any] | property | str | Hashable | KeySpec, sample_element: Any, *args: Any) -> KeySpec:
+    """
+    Compiles `key` into a :class:`KeySpec` for elements shaped like `sample_element`.
+
+    Compiled keys are kept in a bounded LRU cache keyed by the key, the type of the element and the arguments, so
+    compiling the same key again is a dictionary lookup.
+
+    Args:
+        key (Callable[..., Any] | property | str | Hashable | KeySpec): The key to compile.
+        sample_element (Any): An element of the list the key will be applied to.
+        *args (Any): If key is a function, the arguments will be passed to the function.
+
+    Returns:
+        KeySpec: The compiled key. A KeySpec passed as `key` is returned as is.
+
+    Raises:
+        KeyError: If the key cannot be applied to the element.
+    """
+    if isinstance(key, KeySpec):
+        return key
+
+    return compile_key_for_type(key, type(sample_element), hasattr(sample_element, '__getitem__'), args)
+
+
+def resolve_key(elements: list[Any], key: Callable[..., Any] | property | str | Hashable | KeySpec, args: tuple[Any, ...] = ()) -> KeySpec:
+    """
+    Compiles `key` for a non-empty list, reading the element shape cached on the list.
+    """
+    spec = key if isinstance(key, KeySpec) else compile_key_for_type(key, type(elements[0]), base.is_indexable(elements), args)
+
+    if instrument.enabled:
+        instrument.record_key_kind(spec.kind)
+
+    return spec
+
+
+def clear_key_cache() -> None:
+    _compile_cached.cache_clear()
+
+
+def column_name(key: Any) -> Hashable:
+    if isinstance(key, KeySpec):
+        return key.name
+
+    if isinstance(key, property):
+        return key.fget.__name__  # type: ignore[union-attr]
+
+    if isinstance(key, FunctionType) or isinstance(key, MethodDescriptorType) or isinstance(key, GetSetDescriptorType):
+        return key.__name__
+
+    return key
+
+
+def compile_key_for_type(key: Any, element_type: type, indexable: bool, args: tuple[Any, ...] = ()) -> KeySpec:
+    if isinstance(key, KeySpec):
+        return key
+
+    try:
+        return _compile_cached(key, element_type, indexable, args, type(key), tuple(map(type, args)))
+
+    except TypeError:
+        return _compile_uncached(key, element_type, indexable, args)
+
+
+def restore_getter(portable: tuple[Any, ...], args: tuple[Any, ...] = ()) -> Callable[[Any], Any]:
+    """
+    Rebuilds the accessor of a KeySpec from its `portable` form, as sent to a worker process.
+    """
+    kind = portable[0]
+
+    if kind == INDEX:
+        return operator.itemgetter(portable[1])
+
+    if kind == ATTR_NAME:
+        return _attr_name_getter(portable[1], args)
+
+    if kind == CALLABLE:
+        return _callable_getter(portable[1], args)
+
+    return _descriptor_getter(getattr(portable[1], portable[2]))
+
+
+def _compile_uncached(key: Any, element_type: type, indexable: bool, args: tuple[Any, ...]) -> KeySpec:
+    if indexable:
+        return KeySpec(key, INDEX, operator.itemgetter(key), key, args, (INDEX, key))
+
+    name = column_name(key)
+    resolved = key
+
+    if isinstance(key, str):
+        resolved = getattr(element_type, key, _MISSING)
+
+        if resolved is _MISSING:
+            return KeySpec(key, ATTR_NAME, _attr_name_getter(key, args), name, args, (ATTR_NAME, key))
+
+    if callable(resolved):
+        return KeySpec(key, CALLABLE, _callable_getter(resolved, args), name, args, (CALLABLE, resolved))
+
+    if isinstance(resolved, (property, GetSetDescriptorType, MemberDescriptorType)):
+        return KeySpec(key, PROPERTY, _descriptor_getter(resolved), name, args, _portable_descriptor(resolved, key, element_type))
+
+    if isinstance(key, str):
+        # A plain class attribute, such as a dataclass field default, which instances may override.
+        return KeySpec(key, ATTR_NAME, _attr_name_getter(key, args), name, args, (ATTR_NAME, key))
+
+    raise KeyError(key)
+
+
+def _descriptor_getter(descriptor: Any) -> Callable[[Any], Any]:
+    if isinstance(descriptor, property) and descriptor.fget is not None:
+        return descriptor.fget
+
+    return descriptor.__get__  # type: ignore[no-any-return]
+
+
+def _portable_descriptor(descriptor: Any, key: Any, element_type: type) -> tuple[Any, ...] | None:
+    """
+    Returns `(kind, owner, name)`, which finds a property or descriptor again as an attribute of its class, since
+    descriptors cannot be pickled. Returns None if the descriptor is not an attribute of the element type.
+    """
+    if isinstance(key, str):
+        return PROPERTY, element_type, key
+
+    for owner in element_type.__mro__:
+        for name, value in vars(owner).items():
+            if value is descriptor:
+                return PROPERTY, owner, name
+
+    return None
+
+
+def _callable_getter(function: Callable[..., Any], args: tuple[Any, ...]) -> Callable[[Any], Any]:
+    if not args:
+        return function
+
+    return lambda element: function(element, *args)
+
+
+def _attr_name_getter(attr_name: str, args: tuple[Any, ...]) -> Callable[[Any], Any]:
+    def get_value_by_attr_name(element: Any) -> Any:
+        value = getattr(element, attr_name)
+
+        if callable(value):
+            return value(*args)
+
+        return value
+
+    return get_value_by_attr_name
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _compile_cached(key: Any, element_type: type, indexable: bool, args: tuple[Any, ...], key_type: type, arg_types: tuple[type, ...]) -> KeySpec:
+    """
+    Caches `_compile_uncached`. The types of the key and the arguments are part of the cache key, since `1`, `1.0` and
+    `True` hash and compare equal but bind different values.
+    """
+    return _compile_uncached(key, element_type, indexable, args)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from types import GetSetDescriptorType
+import heapq
+from concurrent.futures import Executor
 from typing import Any
 from typing import Callable
 from typing import Hashable
@@ -9,30 +10,63 @@ from typing import List
 from typing import TypeVar
 
 from ext_list import base
+from ext_list.index import find_index
+from ext_list.index import index_id
+from ext_list.index import invalidate_indexes
+from ext_list.index import remember_sort_keys
+from ext_list.index import retain
+from ext_list.index import SORT_KEYS
+from ext_list.index import SORTED
+from ext_list.index import SortKeyCache
+from ext_list.instrument import count_fast_path
+from ext_list.join import hash_join
+from ext_list.join import INNER
+from ext_list.keys import KeySpec
+from ext_list.keys import resolve_key
+from ext_list.parallel import is_parallel
+from ext_list.parallel import parallel_extract
+from ext_list.parallel import parallel_map
+from ext_list.query import Query
+from ext_list.row_plan import RowPlan
+from ext_list.stream import ExtStream
+
 T = TypeVar('T')
 
 
 class _ListOperation(List[T]):  # type: ignore
-    def extract(self, key: Callable[[T, Any], Any] | property | str | Hashable, *args: Any) -> Iterable[Any]:
+    def extract(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, workers: int | None = None, executor: str | Executor | None = None,
+    ) -> Iterable[Any]:
         if not self:
             return self.__class__()
 
-        if base.is_indexable(self):
-            return self.__class__([element[key] for element in self])  # type: ignore[attr-defined]
+        spec = resolve_key(self, key, args)
 
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
+        if is_parallel(self, workers, executor):
+            values = parallel_extract(self, spec, workers, executor)
 
-        if callable(key):
-            return self.__class__([key(element, *args) for element in self])
+            if values is not None:
+                return self.__class__(values)
 
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return self.__class__([key.__get__(element) for element in self])
+        get_value = spec.getter
 
-        raise KeyError
+        return self.__class__([get_value(element) for element in self])
 
     def extract_duplicates(self, other: Iterable[T]) -> Iterable[T]:
-        return self.__class__([element for element in self if element in other])
+        probe = base.to_probe_set(other)
+
+        if probe is not None:
+            try:
+                selected = [element for element in self if element in probe]
+                count_fast_path('membership_set')
+                return base.new_subset(self, selected)
+
+            except TypeError:
+                pass
+
+        count_fast_path('membership_scan')
+
+        return base.new_subset(self, [element for element in self if element in other])
 
     def is_duplicate(self) -> bool:
         return (len(self) - len(set(self))) > 0
@@ -47,5 +81,140 @@ class _ListOperation(List[T]):  # type: ignore
     def first(self) -> T:
         return self[0]
 
-    def map(self, function: Callable[[T, Any], Any] | type, *args: Any) -> Iterable[Any]:
+    def map(self, function: Callable[[T, Any], Any] | type, *args: Any, workers: int | None = None, executor: str | Executor | None = None) -> Iterable[Any]:
+        if is_parallel(self, workers, executor):
+            return self.__class__(parallel_map(self, function, args, workers, executor))
+
         return self.__class__([function(element, *args) for element in self])
+
+    def filter_inplace(self, function: Callable[..., Any], *args: Any) -> Iterable[T]:
+        if not self:
+            return self
+
+        return retain(self, [element for element in self if function(element, *args)])
+
+    def join(
+        self, other: list[Any], left_key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec | list[Any], right_key: Any = None, how: str = INNER,
+        left_args: Any = (), right_args: Any = (), merge: bool = False,
+    ) -> ExtStream[Any]:
+        if right_key is None:
+            right_key, right_args = left_key, left_args
+
+        return ExtStream(hash_join(self, other, left_key, right_key, how, left_args, right_args, merge))
+
+    def top_k(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, k: int, *args: Any) -> Iterable[T]:
+        if not self or k <= 0:
+            return self.__class__()
+
+        return base.new_subset(self, heapq.nlargest(k, self, key=resolve_key(self, key, args).getter))
+
+    def bottom_k(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, k: int, *args: Any) -> Iterable[T]:
+        if not self or k <= 0:
+            return self.__class__()
+
+        spec = resolve_key(self, key, args)
+        index = find_index(self, spec, SORTED)
+
+        if index is not None and not index.unordered:
+            count_fast_path('sorted_index')
+            return base.new_subset(self, [self[position] for position in index.positions[:k]])
+
+        return base.new_subset(self, heapq.nsmallest(k, self, key=spec.getter))
+
+    def nth_by(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, n: int, *args: Any) -> T:
+        if not 0 <= n < len(self):
+            raise IndexError(f'Expected n in range({len(self)}) but got {n!r}')
+
+        spec = resolve_key(self, key, args)
+        index = find_index(self, spec, SORTED)
+
+        if index is not None and not index.unordered:
+            count_fast_path('sorted_index')
+            return self[index.positions[n]]  # type: ignore[no-any-return]
+
+        return heapq.nsmallest(n + 1, self, key=spec.getter)[-1]
+
+    def sort_by(
+        self, keys: list[Callable[[T, Any], Any] | property | str | Hashable] | Callable[[T, Any], Any] | property | str | Hashable, reverse: bool | list[bool] = False,
+        arg_tuples: list[tuple[Any, ...]] = [], cache: bool = False,
+    ) -> None:
+        if not self:
+            return
+
+        order, sort_keys = self.__sort_order(keys, reverse, arg_tuples, cache)
+        list.__setitem__(self, slice(None), [self[position] for position in order])
+        invalidate_indexes(self)
+
+        if sort_keys is not None:
+            sort_keys.permute(order)
+            sort_keys.stale = False
+
+    def sorted_by(
+        self, keys: list[Callable[[T, Any], Any] | property | str | Hashable] | Callable[[T, Any], Any] | property | str | Hashable, reverse: bool | list[bool] = False,
+        arg_tuples: list[tuple[Any, ...]] = [], cache: bool = False,
+    ) -> Iterable[T]:
+        if not self:
+            return self.__class__()
+
+        order, _ = self.__sort_order(keys, reverse, arg_tuples, cache)
+
+        return base.new_subset(self, [self[position] for position in order])
+
+    def __sort_order(self, keys: Any, reverse: bool | list[bool], arg_tuples: list[tuple[Any, ...]], cache: bool) -> tuple[list[int], SortKeyCache | None]:
+        keys = keys if isinstance(keys, list) else [keys]
+        directions = reverse if isinstance(reverse, list) else [reverse] * len(keys)
+
+        if len(directions) != len(keys):
+            raise ValueError(f'Expected {len(keys)} directions but got {len(directions)}')
+
+        if len(keys) == 1 and not directions[0]:
+            index = find_index(self, resolve_key(self, keys[0], tuple(arg_tuples[0]) if arg_tuples else ()), SORTED)
+
+            if index is not None and not index.unordered:
+                count_fast_path('sorted_index')
+                return list(index.positions), None
+
+        columns, sort_keys = self.__sort_columns(keys, arg_tuples, cache)
+        positions = list(range(len(self)))
+
+        if len(set(directions)) == 1:
+            decorated = columns[0] if len(columns) == 1 else list(zip(*columns))
+            positions.sort(key=decorated.__getitem__, reverse=directions[0])
+            return positions, sort_keys
+
+        for column, descending in reversed(list(zip(columns, directions))):
+            positions.sort(key=column.__getitem__, reverse=descending)
+
+        return positions, sort_keys
+
+    def __sort_columns(self, keys: list[Any], arg_tuples: list[tuple[Any, ...]], cache: bool) -> tuple[list[list[Any]], SortKeyCache | None]:
+        if cache:
+            cache_id = index_id(tuple(keys), tuple(tuple(arg_tuple) for arg_tuple in arg_tuples), SORT_KEYS)
+
+            try:
+                sort_keys = self._indexes.get(cache_id)  # type: ignore[attr-defined]
+
+            except TypeError:
+                sort_keys = None
+                cache = False
+
+            if cache:
+                if sort_keys is None:
+                    sort_keys = SortKeyCache(cache_id[0], cache_id[1])
+
+                remember_sort_keys(self, cache_id, sort_keys)
+
+                if sort_keys.stale:
+                    sort_keys.rebuild(self)
+
+                return sort_keys.columns, sort_keys
+
+        plan = RowPlan.compile(self, keys, arg_tuples)
+
+        return [[get_value(element) for element in self] for get_value in plan.accessors], None
+
+    def query(self) -> Query[T]:
+        return Query(self)
+
+    def stream(self) -> ExtStream[T]:
+        return ExtStream(self)
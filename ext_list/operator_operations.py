@@ -1,158 +1,114 @@
 from __future__ import annotations
 
-from types import GetSetDescriptorType
+import re
+from concurrent.futures import Executor
 from typing import Any
 from typing import Callable
 from typing import Hashable
 from typing import Iterable
 from typing import List
+from typing import Pattern
 from typing import TypeVar
 
 from ext_list import base
-T = TypeVar('T')
-
-
-class _OperatorOperation(List[T]):  # type: ignore
-    def equal(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: Any, *args: Any) -> Iterable[T]:
-        if not self:
-            return self.__class__()
-
-        if base.is_indexable(self):
-            return self.__class__([element for element in self if element[key] == compare_target])  # type: ignore[attr-defined]
-
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
+from ext_list.codegen import BETWEEN_CONDITIONS
+from ext_list.dispatch import select
+from ext_list.dispatch import select_between
+from ext_list.index import BOTH
+from ext_list.index import retain
+from ext_list.keys import KeySpec
+from ext_list.keys import resolve_key
+from ext_list.predicates import Predicate
+from ext_list.predicates import select_where
 
-        if callable(key):
-            return self.__class__([element for element in self if key(element, *args) == compare_target])
+T = TypeVar('T')
 
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return self.__class__([element for element in self if key.__get__(element) == compare_target])
 
-        raise KeyError
+def _selection(operator_name: str) -> Callable[..., Iterable[Any]]:
+    """
+    Returns the selection method of the operator, as the operator methods are the same but for their condition.
+    """
 
-    def not_equal(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: Any, *args: Any) -> Iterable[T]:
+    def select_by(
+        self: Any, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any,
+        engine: str | None = None, workers: int | None = None, executor: str | Executor | None = None, inplace: bool = False,
+    ) -> Iterable[T]:
         if not self:
-            return self.__class__()
-
-        if base.is_indexable(self):
-            return self.__class__([element for element in self if element[key] != compare_target])  # type: ignore[attr-defined]
-
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
-
-        if callable(key):
-            return self.__class__([element for element in self if key(element, *args) != compare_target])
-
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return self.__class__([element for element in self if key.__get__(element) != compare_target])
-
-        raise KeyError
+            return self if inplace else self.__class__()  # type: ignore[no-any-return]
 
-    def greater(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: Any, *args: Any) -> Iterable[T]:
-        if not self:
-            return self.__class__()
+        spec = resolve_key(self, key, args)
 
-        if base.is_indexable(self):
-            return self.__class__([element for element in self if element[key] > compare_target])  # type: ignore[attr-defined]
+        return _subset(self, select(self, spec, operator_name, compare_target, engine, workers, executor), inplace)
 
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
+    select_by.__name__ = operator_name
+    select_by.__qualname__ = f'_OperatorOperation.{operator_name}'
 
-        if callable(key):
-            return self.__class__([element for element in self if key(element, *args) > compare_target])
+    return select_by
 
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return self.__class__([element for element in self if key.__get__(element) > compare_target])
 
-        raise KeyError
+class _OperatorOperation(List[T]):  # type: ignore
+    equal = _selection('equal')
+    not_equal = _selection('not_equal')
+    greater = _selection('greater')
+    greater_or_equal = _selection('greater_or_equal')
+    less = _selection('less')
+    less_or_equal = _selection('less_or_equal')
+    in_ = _selection('in_')
+    not_in_ = _selection('not_in_')
+
+    def between(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, lower: Any, upper: Any, *args: Any, inclusive: str = BOTH, inplace: bool = False,
+    ) -> Iterable[T]:
+        if inclusive not in BETWEEN_CONDITIONS:
+            raise ValueError(f'Expected one of {tuple(BETWEEN_CONDITIONS)} but got {inclusive!r}')
 
-    def greater_or_equal(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: Any, *args: Any) -> Iterable[T]:
         if not self:
-            return self.__class__()
-
-        if base.is_indexable(self):
-            return self.__class__([element for element in self if element[key] >= compare_target])  # type: ignore[attr-defined]
-
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
+            return self if inplace else self.__class__()
 
-        if callable(key):
-            return self.__class__([element for element in self if key(element, *args) >= compare_target])
+        spec = resolve_key(self, key, args)
 
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return self.__class__([element for element in self if key.__get__(element) >= compare_target])
+        return _subset(self, select_between(self, spec, lower, upper, inclusive), inplace)
 
-        raise KeyError
-
-    def less(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: Any, *args: Any) -> Iterable[T]:
+    def startswith(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, prefix: str | tuple[str, ...], *args: Any, inplace: bool = False) -> Iterable[T]:
         if not self:
-            return self.__class__()
-
-        if base.is_indexable(self):
-            return self.__class__([element for element in self if element[key] < compare_target])  # type: ignore[attr-defined]
-
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
+            return self if inplace else self.__class__()
 
-        if callable(key):
-            return self.__class__([element for element in self if key(element, *args) < compare_target])
+        spec = resolve_key(self, key, args)
 
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return self.__class__([element for element in self if key.__get__(element) < compare_target])
+        return _subset(self, select(self, spec, 'startswith', prefix), inplace)
 
-        raise KeyError
+    def regex(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, pattern: str | Pattern[str], *args: Any, flags: int = 0, inplace: bool = False,
+    ) -> Iterable[T]:
+        compiled = re.compile(pattern, flags)
 
-    def less_or_equal(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: Any, *args: Any) -> Iterable[T]:
         if not self:
-            return self.__class__()
+            return self if inplace else self.__class__()
 
-        if base.is_indexable(self):
-            return self.__class__([element for element in self if element[key] <= compare_target])  # type: ignore[attr-defined]
+        spec = resolve_key(self, key, args)
 
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
+        return _subset(self, select(self, spec, 'regex', compiled), inplace)
 
-        if callable(key):
-            return self.__class__([element for element in self if key(element, *args) <= compare_target])
-
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return self.__class__([element for element in self if key.__get__(element) <= compare_target])
-
-        raise KeyError
-
-    def in_(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: Any, *args: Any) -> Iterable[T]:
+    def is_none(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any, inplace: bool = False) -> Iterable[T]:
         if not self:
-            return self.__class__()
+            return self if inplace else self.__class__()
 
-        if base.is_indexable(self):
-            return self.__class__([element for element in self if element[key] in compare_target])  # type: ignore[attr-defined]
+        spec = resolve_key(self, key, args)
 
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
+        return _subset(self, select(self, spec, 'is_none', None), inplace)
 
-        if callable(key):
-            return self.__class__([element for element in self if key(element, *args) in compare_target])
+    def where(self, predicate: Predicate, inplace: bool = False) -> Iterable[T]:
+        if not isinstance(predicate, Predicate):
+            raise TypeError(f'Expected a Predicate but got {predicate!r}')
 
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return self.__class__([element for element in self if key.__get__(element) in compare_target])
-
-        raise KeyError
-
-    def not_in_(self, key: Callable[[T, Any], Any] | property | str | Hashable, compare_target: Any, *args: Any) -> Iterable[T]:
         if not self:
-            return self.__class__()
-
-        if base.is_indexable(self):
-            return self.__class__([element for element in self if element[key] not in compare_target])  # type: ignore[attr-defined]
+            return self if inplace else self.__class__()
 
-        if isinstance(key, str):
-            key = getattr(type(self[0]), key)
+        return _subset(self, select_where(self, predicate), inplace)
 
-        if callable(key):
-            return self.__class__([element for element in self if key(element, *args) not in compare_target])
 
-        if isinstance(key, property) or isinstance(key, GetSetDescriptorType):
-            return self.__class__([element for element in self if key.__get__(element) not in compare_target])
+def _subset(elements: list[Any], selected: list[Any], inplace: bool) -> Iterable[Any]:
+    if inplace:
+        return retain(elements, selected)
 
-        raise KeyError
+    return base.new_subset(elements, selected)
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+
+from ext_list import base
+from ext_list.engine import COMPARISONS
+from ext_list.instrument import count_fast_path
+from ext_list.keys import ATTR_NAME
+from ext_list.keys import CALLABLE
+from ext_list.keys import INDEX
+from ext_list.keys import KeySpec
+from ext_list.keys import restore_getter
+
+PROCESS = 'process'
+THREAD = 'thread'
+
+EXECUTORS = (PROCESS, THREAD)
+
+# Lists shorter than this are processed serially, since starting a pool costs more than it saves.
+PARALLEL_THRESHOLD = 10_000
+
+CHUNKS_PER_WORKER = 4
+
+
+def is_parallel(elements: list[Any], workers: int | None, executor: str | Executor | None) -> bool:
+    """
+    Validates the parallel options and returns whether `elements` should be processed in a pool.
+    """
+    if workers is None and executor is None:
+        return False
+
+    if workers is not None and workers < 1:
+        raise ValueError(f'Expected workers of at least 1 but got {workers!r}')
+
+    if executor is not None and not isinstance(executor, Executor) and executor not in EXECUTORS:
+        raise ValueError(f'Expected one of {EXECUTORS} or an Executor but got {executor!r}')
+
+    return len(elements) >= PARALLEL_THRESHOLD
+
+
+def parallel_map(elements: list[Any], function: Callable[..., Any], args: tuple[Any, ...], workers: int | None, executor: str | Executor | None) -> list[Any]:
+    """
+    Returns `[function(element, *args) for element in elements]`, computed in chunks by a pool.
+
+    With a process pool, the function, its arguments and the elements are pickled to the workers.
+    """
+    return _run_chunks(_map_chunk, function, args, elements, workers, executor)
+
+
+def parallel_extract(elements: list[Any], spec: KeySpec, workers: int | None, executor: str | Executor | None) -> list[Any] | None:
+    """
+    Returns the values of a callable key for `elements`, computed in chunks by a pool, or None for other kinds of keys.
+
+    Only callable keys are worth a pool. The key is resolved once, against the list, and workers rebuild its accessor
+    from `spec.portable`, since the accessor may be a closure which cannot be pickled.
+    """
+    if spec.kind not in (CALLABLE, ATTR_NAME) or spec.portable is None:
+        return None
+
+    return _run_chunks(_extract_chunk, spec.portable, spec.args, elements, workers, executor)
+
+
+def parallel_select(
+    elements: list[Any], spec: KeySpec, operator_name: str, compare_target: Any, workers: int | None, executor: str | Executor | None,
+) -> list[Any] | None:
+    values = parallel_extract(elements, spec, workers, executor)
+
+    if values is None:
+        return None
+
+    count_fast_path('parallel')
+
+    if operator_name in ('in_', 'not_in_'):
+        contains = base.membership_test(compare_target)
+        expected = operator_name == 'in_'
+        return [element for element, value in zip(elements, values) if contains(value) == expected]
+
+    comparison = COMPARISONS[operator_name]
+
+    return [element for element, value in zip(elements, values) if comparison(value, compare_target)]
+
+
+def parallel_group(elements: list[Any], spec: KeySpec, workers: int | None, executor: str | Executor | None) -> dict[Hashable, list[Any]] | None:
+    """
+    Groups `elements` by the key as `group_by_key` does, grouping each chunk in a pool and merging the partial groups.
+    Returns None if the accessor of the key cannot be sent to the workers.
+    """
+    if spec.portable is None:
+        return None
+
+    partials = _run_chunks(_group_chunk, spec.portable, spec.args, elements, workers, executor, with_start=True)
+    count_fast_path('parallel')
+
+    return {value: [elements[position] for position in positions] for value, positions in merge_groups(partials).items()}
+
+
+def parallel_to_dict(elements: list[Any], spec: KeySpec, workers: int | None, executor: str | Executor | None) -> dict[Hashable, Any] | None:
+    """
+    Maps the key to the last element holding it as `to_dict` does, mapping each chunk in a pool and merging the partial
+    dictionaries. Returns None if the accessor of the key cannot be sent to the workers.
+    """
+    if spec.portable is None:
+        return None
+
+    partials = _run_chunks(_last_position_chunk, spec.portable, spec.args, elements, workers, executor, with_start=True)
+    count_fast_path('parallel')
+    merged = merge_last_positions(partials)
+
+    if spec.kind == INDEX:
+        return {value: elements[position] for value, position in merged.items() if value}
+
+    return {value: elements[position] for value, position in merged.items()}
+
+
+def merge_groups(partials: Iterable[dict[Hashable, list[int]]]) -> dict[Hashable, list[int]]:
+    """
+    Merges the position groups of consecutive chunks, given in list order.
+
+    A key is inserted when its first chunk is merged, so keys keep the order in which they first appear in the list, and
+    positions are appended chunk by chunk, so each group stays in list order. The position lists of the partial groups
+    are extended in place.
+    """
+    merged: dict[Hashable, list[int]] = {}
+
+    for partial in partials:
+        for value, positions in partial.items():
+            group = merged.get(value)
+
+            if group is None:
+                merged[value] = positions
+
+            else:
+                group.extend(positions)
+
+    return merged
+
+
+def merge_last_positions(partials: Iterable[dict[Hashable, int]]) -> dict[Hashable, int]:
+    """
+    Merges the last positions of each key over consecutive chunks, given in list order. Updating an existing key keeps
+    its place, as assigning it again in a dict comprehension does.
+    """
+    merged: dict[Hashable, int] = {}
+
+    for partial in partials:
+        merged.update(partial)
+
+    return merged
+
+
+def _run_chunks(
+    work: Callable[..., Any], function: Any, args: tuple[Any, ...], elements: list[Any], workers: int | None, executor: str | Executor | None,
+    with_start: bool = False,
+) -> list[Any]:
+    """
+    Runs `work` over consecutive chunks of `elements` in a pool and returns its results in chunk order.
+
+    Results which are lists are concatenated. With `with_start`, `work` also receives the position of its chunk. The
+    chunks are sized for `workers`, or else for the number of CPUs, also when an Executor is passed.
+    """
+    worker_count = workers or os.cpu_count() or 1
+    size = math.ceil(len(elements) / (worker_count * CHUNKS_PER_WORKER))
+    starts = list(range(0, len(elements), size))
+    chunks = [elements[start:start + size] for start in starts]
+    count = len(chunks)
+    arguments = [[function] * count, [args] * count] + ([starts] if with_start else []) + [chunks]
+
+    if isinstance(executor, Executor):
+        results = list(executor.map(work, *arguments))
+
+    else:
+        pool_type = ThreadPoolExecutor if executor == THREAD else ProcessPoolExecutor
+
+        with pool_type(max_workers=worker_count) as pool:
+            results = list(pool.map(work, *arguments))
+
+    if with_start:
+        return results
+
+    return list(chain.from_iterable(results))
+
+
+def _map_chunk(function: Callable[..., Any], args: tuple[Any, ...], chunk: list[Any]) -> list[Any]:
+    return [function(element, *args) for element in chunk]
+
+
+def _extract_chunk(portable: tuple[Any, ...], args: tuple[Any, ...], chunk: list[Any]) -> list[Any]:
+    get_value = restore_getter(portable, args)
+    return [get_value(element) for element in chunk]
+
+
+def _group_chunk(portable: tuple[Any, ...], args: tuple[Any, ...], start: int, chunk: list[Any]) -> dict[Hashable, list[int]]:
+    get_value = restore_getter(portable, args)
+    groups: dict[Hashable, list[int]] = {}
+
+    for position, element in enumerate(chunk, start):
+        value = get_value(element)
+
+        if value in groups:
+            groups[value].append(position)
+
+        else:
+            groups[value] = [position]
+
+    return groups
+
+
+def _last_position_chunk(portable: tuple[Any, ...], args: tuple[Any, ...], start: int, chunk: list[Any]) -> dict[Hashable, int]:
+    get_value = restore_getter(portable, args)
+    return {get_value(element): position for position, element in enumerate(chunk, start)}
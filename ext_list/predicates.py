@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Pattern
+
+from ext_list import base
+from ext_list.codegen import AND
+from ext_list.codegen import ATTRIBUTE
+from ext_list.codegen import BETWEEN_CONDITIONS
+from ext_list.codegen import CONDITIONS
+from ext_list.codegen import ITEM
+from ext_list.codegen import LEAF
+from ext_list.codegen import MEMBERSHIP_TEST_CONDITIONS
+from ext_list.codegen import NOT
+from ext_list.codegen import OR
+from ext_list.codegen import predicate_selector
+from ext_list.dispatch import find_usable_index
+from ext_list.dispatch import is_c_getter
+from ext_list.dispatch import key_access
+from ext_list.index import BOTH
+from ext_list.instrument import count_fast_path
+from ext_list.keys import KeySpec
+from ext_list.keys import resolve_key
+
+# The relative cost of reading a value: inlined lookups, C accessors, and calls of Python functions.
+INLINE_COST = 1
+C_CALL_COST = 2
+PYTHON_CALL_COST = 4
+
+# Operators whose index narrows a conjunction down to the positions it holds.
+INDEXED_OPERATORS = ('equal', 'in_', 'greater', 'greater_or_equal', 'less', 'less_or_equal', 'between')
+
+# The functions of this module named differently from the ExtList methods they mirror.
+FUNCTION_NAMES = {
+    'equal': 'eq',
+    'not_equal': 'ne',
+    'greater': 'gt',
+    'greater_or_equal': 'ge',
+    'less': 'lt',
+    'less_or_equal': 'le',
+}
+
+
+class Predicate:
+    """
+    A condition on the elements of an ExtList, built with the functions of this module and evaluated by
+    :meth:`ExtList.where`.
+
+    Predicates combine with `&`, `|` and `~` as with :func:`and_`, :func:`or_` and :func:`not_`.
+    """
+
+    __slots__ = ()
+
+    def __and__(self, other: Predicate) -> Predicate:
+        return and_(self, other)
+
+    def __or__(self, other: Predicate) -> Predicate:
+        return or_(self, other)
+
+    def __invert__(self) -> Predicate:
+        return not_(self)
+
+
+class Comparison(Predicate):
+    __slots__ = ('operator_name', 'key', 'targets', 'args', 'inclusive')
+
+    def __init__(
+        self, operator_name: str, key: Callable[..., Any] | property | str | Hashable | KeySpec, targets: tuple[Any, ...], args: tuple[Any, ...],
+        inclusive: str = BOTH,
+    ) -> None:
+        self.operator_name = operator_name
+        self.key = key
+        self.targets = targets
+        self.args = args
+        self.inclusive = inclusive
+
+    def condition(self) -> tuple[str, tuple[Any, ...]]:
+        """
+        Returns the condition of the comparison and the targets it compares against. Membership in a list, tuple or set
+        of hashable values is tested through a set, so a value which cannot be hashed is looked up by a scan instead.
+        """
+        if self.operator_name == 'between':
+            return BETWEEN_CONDITIONS[self.inclusive], self.targets
+
+        if self.operator_name in MEMBERSHIP_TEST_CONDITIONS and base.to_probe_set(self.targets[0]) is not None:
+            return MEMBERSHIP_TEST_CONDITIONS[self.operator_name], (base.membership_test(self.targets[0]),)
+
+        return CONDITIONS[self.operator_name], self.targets
+
+    def __repr__(self) -> str:
+        arguments = ', '.join(repr(argument) for argument in (self.key,) + self.targets + self.args)
+
+        if self.operator_name == 'between' and self.inclusive != BOTH:
+            arguments += f', inclusive={self.inclusive!r}'
+
+        return f'{FUNCTION_NAMES.get(self.operator_name, self.operator_name)}({arguments})'
+
+
+class And(Predicate):
+    __slots__ = ('operands',)
+
+    def __init__(self, operands: tuple[Predicate, ...]) -> None:
+        self.operands = operands
+
+    def __repr__(self) -> str:
+        return f'and_({", ".join(repr(operand) for operand in self.operands)})'
+
+
+class Or(Predicate):
+    __slots__ = ('operands',)
+
+    def __init__(self, operands: tuple[Predicate, ...]) -> None:
+        self.operands = operands
+
+    def __repr__(self) -> str:
+        return f'or_({", ".join(repr(operand) for operand in self.operands)})'
+
+
+class Not(Predicate):
+    __slots__ = ('operand',)
+
+    def __init__(self, operand: Predicate) -> None:
+        self.operand = operand
+
+    def __repr__(self) -> str:
+        return f'not_({self.operand!r})'
+
+
+def eq(key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Predicate:
+    """
+    Holds for the elements whose value for the key equals `compare_target`, as in :meth:`ExtList.equal`.
+
+    Examples:
+        >>> ExtList([{'a': 1, 'b': 2}, {'a': 1, 'b': 3}]).where(and_(eq('a', 1), gt('b', 2)))
+        [{'a': 1, 'b': 3}]
+    """
+    return Comparison('equal', key, (compare_target,), args)
+
+
+def ne(key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Predicate:
+    return Comparison('not_equal', key, (compare_target,), args)
+
+
+def gt(key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Predicate:
+    return Comparison('greater', key, (compare_target,), args)
+
+
+def ge(key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Predicate:
+    return Comparison('greater_or_equal', key, (compare_target,), args)
+
+
+def lt(key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Predicate:
+    return Comparison('less', key, (compare_target,), args)
+
+
+def le(key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Predicate:
+    return Comparison('less_or_equal', key, (compare_target,), args)
+
+
+def in_(key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Predicate:
+    return Comparison('in_', key, (compare_target,), args)
+
+
+def not_in_(key: Callable[..., Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Predicate:
+    return Comparison('not_in_', key, (compare_target,), args)
+
+
+def between(key: Callable[..., Any] | property | str | Hashable | KeySpec, lower: Any, upper: Any, *args: Any, inclusive: str = BOTH) -> Predicate:
+    if inclusive not in BETWEEN_CONDITIONS:
+        raise ValueError(f'Expected one of {tuple(BETWEEN_CONDITIONS)} but got {inclusive!r}')
+
+    return Comparison('between', key, (lower, upper), args, inclusive)
+
+
+def startswith(key: Callable[..., Any] | property | str | Hashable | KeySpec, prefix: str | tuple[str, ...], *args: Any) -> Predicate:
+    return Comparison('startswith', key, (prefix,), args)
+
+
+def regex(key: Callable[..., Any] | property | str | Hashable | KeySpec, pattern: str | Pattern[str], *args: Any, flags: int = 0) -> Predicate:
+    return Comparison('regex', key, (re.compile(pattern, flags),), args)
+
+
+def is_none(key: Callable[..., Any] | property | str | Hashable | KeySpec, *args: Any) -> Predicate:
+    return Comparison('is_none', key, (), args)
+
+
+def and_(*operands: Predicate) -> Predicate:
+    """
+    Holds for the elements every operand holds for. Operands may be evaluated in any order, and the rest are skipped
+    once one fails.
+    """
+    return And(_flatten(And, operands))
+
+
+def or_(*operands: Predicate) -> Predicate:
+    """
+    Holds for the elements any operand holds for. Operands may be evaluated in any order, and the rest are skipped once
+    one holds.
+    """
+    return Or(_flatten(Or, operands))
+
+
+def not_(operand: Predicate) -> Predicate:
+    if not isinstance(operand, Predicate):
+        raise TypeError(f'Expected a Predicate but got {operand!r}')
+
+    return Not(operand)
+
+
+def select_where(elements: list[Any], predicate: Predicate) -> list[Any]:
+    """
+    Returns the elements of a non-empty list which satisfy `predicate`, in list order, testing each element in one pass.
+
+    Keys are resolved against the list once. When the predicate is a comparison served by an index of the list, or a
+    conjunction with such an operand, only the positions the index holds are tested against the other operands.
+    Operands which read their values cheaply are tested before those which call Python functions.
+    """
+    if not isinstance(predicate, Predicate):
+        raise TypeError(f'Expected a Predicate but got {predicate!r}')
+
+    operands = list(predicate.operands) if isinstance(predicate, And) else [predicate]
+    candidates = elements
+
+    for number, operand in enumerate(operands):
+        positions = _index_positions(elements, operand)
+
+        if positions is not None:
+            candidates = [elements[position] for position in positions]
+            del operands[number]
+            break
+
+    if not operands or not candidates:
+        return candidates
+
+    leaves: list[tuple[Any, ...]] = []
+    structure, _ = _plan(elements, operands[0] if len(operands) == 1 else And(tuple(operands)), leaves)
+
+    return predicate_selector(structure)(candidates, leaves)
+
+
+def _flatten(node_type: type, operands: tuple[Predicate, ...]) -> tuple[Predicate, ...]:
+    if not operands:
+        raise ValueError(f'Expected at least one operand for {node_type.__name__.lower()}_')
+
+    flattened: list[Predicate] = []
+
+    for operand in operands:
+        if not isinstance(operand, Predicate):
+            raise TypeError(f'Expected a Predicate but got {operand!r}')
+
+        if isinstance(operand, node_type):
+            flattened.extend(operand.operands)  # type: ignore[attr-defined]
+
+        else:
+            flattened.append(operand)
+
+    return tuple(flattened)
+
+
+def _index_positions(elements: list[Any], predicate: Predicate) -> list[int] | None:
+    if not isinstance(predicate, Comparison) or predicate.operator_name not in INDEXED_OPERATORS:
+        return None
+
+    spec = resolve_key(elements, predicate.key, predicate.args)
+    index = find_usable_index(elements, spec, predicate.operator_name, predicate.targets[0])
+
+    if index is None:
+        return None
+
+    count_fast_path(f'{index.kind}_index')
+
+    if predicate.operator_name == 'equal':
+        return index.lookup(predicate.targets[0])  # type: ignore[no-any-return]
+
+    if predicate.operator_name == 'in_':
+        return index.members(predicate.targets[0])  # type: ignore[no-any-return]
+
+    if predicate.operator_name == 'between':
+        return index.between(*predicate.targets, predicate.inclusive)  # type: ignore[no-any-return]
+
+    return getattr(index, predicate.operator_name)(predicate.targets[0])  # type: ignore[no-any-return]
+
+
+def _plan(elements: list[Any], predicate: Predicate, leaves: list[tuple[Any, ...]]) -> tuple[tuple[Any, ...], int]:
+    """
+    Returns the structure to compile for `predicate` and its cost, appending `(key, get_value, args, target, upper)` for
+    each of its leaves to `leaves` in the order they are compiled. Cheaper operands of a conjunction or disjunction are
+    moved first.
+    """
+    if isinstance(predicate, Not):
+        structure, cost = _plan(elements, predicate.operand, leaves)
+        return (NOT, structure), cost
+
+    if isinstance(predicate, (And, Or)):
+        planned = []
+
+        for operand in predicate.operands:
+            operand_leaves: list[tuple[Any, ...]] = []
+            structure, cost = _plan(elements, operand, operand_leaves)
+            planned.append((cost, structure, operand_leaves))
+
+        planned.sort(key=lambda plan: plan[0])
+
+        for _, _, operand_leaves in planned:
+            leaves.extend(operand_leaves)
+
+        return (AND if isinstance(predicate, And) else OR, tuple(plan[1] for plan in planned)), sum(plan[0] for plan in planned)
+
+    comparison: Comparison = predicate  # type: ignore[assignment]
+    spec = resolve_key(elements, comparison.key, comparison.args)
+    access, attribute, arity = key_access(spec)
+    condition, targets = comparison.condition()
+    targets += (None, None)
+    leaves.append((spec.key, spec.getter, spec.args, targets[0], targets[1]))
+
+    return (LEAF, condition, access, attribute, arity), _cost(spec, access)
+
+
+def _cost(spec: KeySpec, access: str) -> int:
+    if access in (ITEM, ATTRIBUTE):
+        return INLINE_COST
+
+    if is_c_getter(spec):
+        return C_CALL_COST
+
+    return PYTHON_CALL_COST
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import Hashable
+from typing import Pattern
+from typing import TypeVar
+
+from ext_list import base
+from ext_list.codegen import BETWEEN_CONDITIONS
+from ext_list.codegen import CONDITIONS
+from ext_list.codegen import fused_selector
+from ext_list.codegen import MEMBERSHIP_TEST_CONDITIONS
+from ext_list.index import BOTH
+from ext_list.index import find_index
+from ext_list.index import HASH
+from ext_list.index import SORTED
+from ext_list.keys import compile_key_for_type
+from ext_list.keys import KeySpec
+
+T = TypeVar('T')
+
+INDEX_KINDS = {
+    'equal': HASH,
+    'not_equal': HASH,
+    'in_': HASH,
+    'not_in_': HASH,
+    'greater': SORTED,
+    'greater_or_equal': SORTED,
+    'less': SORTED,
+    'less_or_equal': SORTED,
+    'between': SORTED,
+}
+
+
+class _Filter:
+    def __init__(self, operator: str, key: Any, targets: tuple[Any, ...], args: tuple[Any, ...], inclusive: str = BOTH) -> None:
+        self.operator = operator
+        self.key = key
+        self.targets = targets
+        self.args = args
+        self.inclusive = inclusive
+
+    def apply(self, elements: Any) -> Any:
+        if self.operator == 'between':
+            return elements.between(self.key, *self.targets, *self.args, inclusive=self.inclusive)
+
+        return getattr(elements, self.operator)(self.key, *self.targets, *self.args)
+
+    def condition(self) -> tuple[str, tuple[Any, ...]]:
+        """
+        Returns the condition of the filter and the targets it compares against. Membership in a list, tuple or set of
+        hashable values is tested through a set, so a value which cannot be hashed is looked up by a scan instead.
+        """
+        if self.operator == 'between':
+            return BETWEEN_CONDITIONS[self.inclusive], self.targets
+
+        if self.operator in MEMBERSHIP_TEST_CONDITIONS and base.to_probe_set(self.targets[0]) is not None:
+            return MEMBERSHIP_TEST_CONDITIONS[self.operator], (base.membership_test(self.targets[0]),)
+
+        return CONDITIONS[self.operator], self.targets
+
+
+class _Projection:
+    def __init__(self, method: str, function: Any, args: tuple[Any, ...]) -> None:
+        self.method = method
+        self.function = function
+        self.args = args
+
+    def apply(self, elements: Any) -> Any:
+        return getattr(elements, self.method)(self.function, *self.args)
+
+
+class Query(Generic[T]):
+    """
+    A lazy plan of filters and projections over an ExtList, created by :meth:`ExtList.query`.
+
+    Nothing is evaluated until a terminal method such as `collect`, `to_dict` or `group_by_key` is called. Consecutive
+    filters are then fused into a single pass over the list, without building the intermediate lists that chaining the
+    eager methods would. The results are the same as those of the equivalent chain of eager methods.
+
+    Examples:
+        >>> ext_list_1 = ExtList([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}, {'name': 'Charlie', 'age': 35}])
+        >>> ext_list_1.query().greater('age', 25).not_equal('name', 'Charlie').extract('name').collect()
+        ['Bob']
+    """
+
+    def __init__(self, source: Any, steps: tuple[_Filter | _Projection, ...] = ()) -> None:
+        self.__source = source
+        self.__steps = steps
+
+    def __then(self, step: _Filter | _Projection) -> Query[Any]:
+        return Query(self.__source, self.__steps + (step,))
+
+    def equal(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Query[T]:
+        return self.__then(_Filter('equal', key, (compare_target,), args))
+
+    def not_equal(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Query[T]:
+        return self.__then(_Filter('not_equal', key, (compare_target,), args))
+
+    def greater(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Query[T]:
+        return self.__then(_Filter('greater', key, (compare_target,), args))
+
+    def greater_or_equal(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Query[T]:
+        return self.__then(_Filter('greater_or_equal', key, (compare_target,), args))
+
+    def less(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Query[T]:
+        return self.__then(_Filter('less', key, (compare_target,), args))
+
+    def less_or_equal(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Query[T]:
+        return self.__then(_Filter('less_or_equal', key, (compare_target,), args))
+
+    def in_(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Query[T]:
+        return self.__then(_Filter('in_', key, (compare_target,), args))
+
+    def not_in_(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> Query[T]:
+        return self.__then(_Filter('not_in_', key, (compare_target,), args))
+
+    def between(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, lower: Any, upper: Any, *args: Any, inclusive: str = BOTH) -> Query[T]:
+        if inclusive not in BETWEEN_CONDITIONS:
+            raise ValueError(f'Expected one of {tuple(BETWEEN_CONDITIONS)} but got {inclusive!r}')
+
+        return self.__then(_Filter('between', key, (lower, upper), args, inclusive))
+
+    def startswith(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, prefix: str | tuple[str, ...], *args: Any) -> Query[T]:
+        return self.__then(_Filter('startswith', key, (prefix,), args))
+
+    def regex(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, pattern: str | Pattern[str], *args: Any, flags: int = 0) -> Query[T]:
+        return self.__then(_Filter('regex', key, (re.compile(pattern, flags),), args))
+
+    def is_none(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any) -> Query[T]:
+        return self.__then(_Filter('is_none', key, (), args))
+
+    def extract(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any) -> Query[Any]:
+        return self.__then(_Projection('extract', key, args))
+
+    def map(self, function: Callable[[T, Any], Any] | type, *args: Any) -> Query[Any]:
+        return self.__then(_Projection('map', function, args))
+
+    def collect(self) -> Any:
+        elements = self.__source
+        filters: list[_Filter] = []
+
+        for step in self.__steps:
+            if isinstance(step, _Filter):
+                filters.append(step)
+                continue
+
+            elements = step.apply(_run_filters(elements, filters))
+            filters = []
+
+        elements = _run_filters(elements, filters)
+
+        if elements is self.__source:
+            return base.new_subset(elements, list(elements))
+
+        return elements
+
+    def to_dict(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any) -> dict[Hashable, T]:
+        return self.collect().to_dict(key, *args)  # type: ignore[no-any-return]
+
+    def to_dict_list(self, keys: list[Callable[[T, Any], Any] | property | str | Hashable], arg_tuples: list[tuple[Any, ...]] = []) -> Any:
+        return self.collect().to_dict_list(keys, arg_tuples)
+
+    def to_dict_with_complex_keys(self, keys: list[Callable[[T, Any], Any] | property | str] | list[Hashable], arg_tuples: list[tuple[Any, ...]] = []) -> dict[tuple[Any, ...], T]:
+        return self.collect().to_dict_with_complex_keys(keys, arg_tuples)  # type: ignore[no-any-return]
+
+    def group_by_key(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any) -> dict[Hashable, Any]:
+        return self.collect().group_by_key(key, *args)  # type: ignore[no-any-return]
+
+    def __repr__(self) -> str:
+        return f'Query(steps={len(self.__steps)})'
+
+
+def _run_filters(elements: Any, filters: list[_Filter]) -> Any:
+    """
+    Applies consecutive filters in one pass.
+
+    Each key is resolved against the first element that reaches its filter, as the eager methods resolve it against
+    the first element of the intermediate list. A leading filter served by an index of the list runs eagerly.
+    """
+    if not filters or not elements:
+        return elements
+
+    shape = base.get_element_shape(elements)
+
+    if shape == base.MIXED:
+        for step in filters:
+            elements = step.apply(elements)
+
+        return elements
+
+    first = filters[0]
+
+    if first.operator in INDEX_KINDS and getattr(elements, '_indexes', None):
+        spec = compile_key_for_type(first.key, type(elements[0]), shape == base.INDEXABLE, first.args)
+
+        if find_index(elements, spec, INDEX_KINDS[first.operator]) is not None:
+            return _run_filters(first.apply(elements), filters[1:])
+
+    indexable = shape == base.INDEXABLE
+    conditions = [step.condition() for step in filters]
+    getters: list[Callable[[Any], Any] | None] = [None] * len(filters)
+    selected: list[Any] = []
+    position = 0
+
+    while position < len(elements) and None in getters:
+        element = elements[position]
+        position += 1
+
+        for number, step in enumerate(filters):
+            if getters[number] is None:
+                getters[number] = compile_key_for_type(step.key, type(element), indexable, step.args).getter
+
+            condition, targets = conditions[number]
+
+            if not fused_selector((condition,))([element], getters[number], *targets):
+                break
+
+        else:
+            selected.append(element)
+
+    if position < len(elements):
+        fused = fused_selector(tuple(condition for condition, _ in conditions))
+        selected.extend(fused(elements[position:], *_fused_arguments(conditions, getters)))
+
+    return base.new_subset(elements, selected)
+
+
+def _fused_arguments(conditions: list[tuple[str, tuple[Any, ...]]], getters: list[Any]) -> list[Any]:
+    arguments: list[Any] = []
+
+    for (_, targets), get_value in zip(conditions, getters):
+        arguments.append(get_value)
+        arguments.extend(targets)
+
+    return arguments
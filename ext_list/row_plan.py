@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import Sequence
+
+from ext_list import base
+from ext_list.keys import compile_key_for_type
+
+
+class RowPlan:
+    """
+    A list of keys compiled once into `(column name, accessor)` pairs, so that converting rows does not resolve the
+    keys again for every element.
+
+    Plans are cached per key list, so passing the same keys to `to_dict_list` or `to_dict_with_complex_keys` reuses
+    the compiled plan. A plan can also be passed to those methods in place of the key list.
+
+    Examples:
+        >>> plan = RowPlan.compile(ExtList([{'name': 'Alice', 'age': 25}]), ['name', 'age'])
+        >>> plan.columns
+        ('name', 'age')
+        >>> plan.to_row({'name': 'Bob', 'age': 30})
+        {'name': 'Bob', 'age': 30}
+    """
+
+    def __init__(self, columns: Sequence[Hashable], accessors: Sequence[Callable[[Any], Any]]) -> None:
+        self.columns: tuple[Hashable, ...] = tuple(columns)
+        self.accessors: tuple[Callable[[Any], Any], ...] = tuple(accessors)
+        self.__pairs = tuple(zip(self.columns, self.accessors))
+
+    @classmethod
+    def compile(cls, elements: list[Any], keys: Sequence[Callable[..., Any] | property | str | Hashable], arg_tuples: Sequence[tuple[Any, ...]] = ()) -> RowPlan:
+        element_type = type(elements[0])
+        indexable = base.is_indexable(elements)
+
+        keys = tuple(keys)
+        arg_tuples = tuple(arg_tuples)
+
+        try:
+            return _compile_cached(element_type, indexable, keys, arg_tuples, _types(keys), tuple(_types(arg_tuple) for arg_tuple in arg_tuples))
+
+        except TypeError:
+            return _compile(element_type, indexable, keys, arg_tuples)
+
+    def to_row(self, element: Any) -> dict[Hashable, Any]:
+        return {column: accessor(element) for column, accessor in self.__pairs}
+
+    def to_key(self, element: Any) -> tuple[Any, ...]:
+        return tuple(accessor(element) for accessor in self.accessors)
+
+    def to_rows(self, elements: Iterable[Any]) -> list[dict[Hashable, Any]]:
+        pairs = self.__pairs
+        return [{column: accessor(element) for column, accessor in pairs} for element in elements]
+
+    def to_keyed_dict(self, elements: Iterable[Any]) -> dict[tuple[Any, ...], Any]:
+        accessors = self.accessors
+        return {tuple(accessor(element) for accessor in accessors): element for element in elements}
+
+    def __repr__(self) -> str:
+        return f'RowPlan(columns={self.columns!r})'
+
+
+def _compile(element_type: type, indexable: bool, keys: tuple[Any, ...], arg_tuples: tuple[tuple[Any, ...], ...]) -> RowPlan:
+    if indexable or not arg_tuples:
+        arg_tuples = tuple(tuple() for _ in range(len(keys)))
+
+    specs = [compile_key_for_type(key, element_type, indexable, arg_tuple) for key, arg_tuple in zip(keys, arg_tuples)]
+
+    return RowPlan([spec.name for spec in specs], [spec.getter for spec in specs])
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(
+    element_type: type, indexable: bool, keys: tuple[Any, ...], arg_tuples: tuple[tuple[Any, ...], ...], key_types: tuple[type, ...], arg_types: tuple[tuple[type, ...], ...],
+) -> RowPlan:
+    """
+    Caches `_compile`, keyed also by the types of the keys and arguments, as the compiled keys are.
+    """
+    return _compile(element_type, indexable, keys, arg_tuples)
+
+
+def _types(values: Iterable[Any]) -> tuple[type, ...]:
+    return tuple(map(type, values))
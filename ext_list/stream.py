@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import heapq
+from itertools import chain
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import TypeVar
+
+from ext_list import base
+from ext_list.index import BOTH
+from ext_list.index import LEFT
+from ext_list.index import NEITHER
+from ext_list.index import RIGHT
+from ext_list.keys import compile_key
+from ext_list.keys import INDEX
+from ext_list.keys import KeySpec
+
+T = TypeVar('T')
+
+
+class ExtStream(Generic[T]):
+    """
+    A lazy counterpart of ExtList over any iterable, such as a generator, a file or a database cursor.
+
+    The query methods return a new ExtStream which yields the matching elements one at a time, so no intermediate list
+    is built and the first result is available before the source is exhausted. Keys are resolved against the first
+    element of the stream. A stream can be iterated only as often as its source.
+
+    Examples:
+        >>> rows = ({'name': name, 'age': age} for name, age in [('Alice', 25), ('Bob', 30), ('Charlie', 35)])
+        >>> stream = ExtStream(rows).greater('age', 25).extract('name')
+        >>> next(iter(stream))
+        'Bob'
+        >>> stream.collect()
+        ['Charlie']
+    """
+
+    def __init__(self, iterable: Iterable[T]) -> None:
+        self.__iterable = iterable
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__iterable)
+
+    def equal(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> ExtStream[T]:
+        return ExtStream(_select(self, key, args, lambda value: value == compare_target))
+
+    def not_equal(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> ExtStream[T]:
+        return ExtStream(_select(self, key, args, lambda value: value != compare_target))
+
+    def greater(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> ExtStream[T]:
+        return ExtStream(_select(self, key, args, lambda value: value > compare_target))
+
+    def greater_or_equal(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> ExtStream[T]:
+        return ExtStream(_select(self, key, args, lambda value: value >= compare_target))
+
+    def less(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> ExtStream[T]:
+        return ExtStream(_select(self, key, args, lambda value: value < compare_target))
+
+    def less_or_equal(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> ExtStream[T]:
+        return ExtStream(_select(self, key, args, lambda value: value <= compare_target))
+
+    def in_(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> ExtStream[T]:
+        return ExtStream(_select(self, key, args, base.membership_test(compare_target)))
+
+    def not_in_(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, compare_target: Any, *args: Any) -> ExtStream[T]:
+        contains = base.membership_test(compare_target)
+        return ExtStream(_select(self, key, args, lambda value: not contains(value)))
+
+    def between(
+        self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, lower: Any, upper: Any, *args: Any, inclusive: str = BOTH,
+    ) -> ExtStream[T]:
+        if inclusive == BOTH:
+            return ExtStream(_select(self, key, args, lambda value: lower <= value <= upper))
+
+        if inclusive == LEFT:
+            return ExtStream(_select(self, key, args, lambda value: lower <= value < upper))
+
+        if inclusive == RIGHT:
+            return ExtStream(_select(self, key, args, lambda value: lower < value <= upper))
+
+        if inclusive == NEITHER:
+            return ExtStream(_select(self, key, args, lambda value: lower < value < upper))
+
+        raise ValueError(f'Expected one of {(BOTH, NEITHER, LEFT, RIGHT)} but got {inclusive!r}')
+
+    def extract(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any) -> ExtStream[Any]:
+        return ExtStream(_extract(self, key, args))
+
+    def map(self, function: Callable[[T, Any], Any] | type, *args: Any) -> ExtStream[Any]:
+        return ExtStream(function(element, *args) for element in self)
+
+    def collect(self) -> Any:
+        from ext_list import ExtList
+
+        return ExtList(list(self))
+
+    def to_dict(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any) -> dict[Hashable, T]:
+        result: dict[Hashable, T] = {}
+        spec: KeySpec | None = None
+
+        for element in self:
+            if spec is None:
+                spec = compile_key(key, element, *args)
+
+            value = spec.getter(element)
+
+            if value or spec.kind != INDEX:
+                result[value] = element
+
+        return result
+
+    def group_by_key(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, *args: Any) -> dict[Hashable, list[T]]:
+        result: dict[Hashable, list[T]] = {}
+        get_value: Callable[[T], Any] | None = None
+
+        for element in self:
+            if get_value is None:
+                get_value = compile_key(key, element, *args).getter
+
+            group_key = get_value(element)
+
+            if group_key in result:
+                result[group_key].append(element)
+
+            else:
+                result[group_key] = [element]
+
+        return result
+
+    def top_k(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, k: int, *args: Any) -> Any:
+        return _select_k(heapq.nlargest, self, key, k, args)
+
+    def bottom_k(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, k: int, *args: Any) -> Any:
+        return _select_k(heapq.nsmallest, self, key, k, args)
+
+    def nth_by(self, key: Callable[[T, Any], Any] | property | str | Hashable | KeySpec, n: int, *args: Any) -> T:
+        if n < 0:
+            raise IndexError(f'Expected n of at least 0 but got {n!r}')
+
+        selected = _select_k(heapq.nsmallest, self, key, n + 1, args)
+
+        if len(selected) <= n:
+            raise IndexError(f'Expected n in range({len(selected)}) but got {n!r}')
+
+        return selected[-1]  # type: ignore[no-any-return]
+
+    def __repr__(self) -> str:
+        return f'ExtStream({self.__iterable!r})'
+
+
+def _select(iterable: Iterable[T], key: Any, args: tuple[Any, ...], test: Callable[[Any], bool]) -> Iterator[T]:
+    iterator = iter(iterable)
+
+    for element in iterator:
+        get_value = compile_key(key, element, *args).getter
+
+        if test(get_value(element)):
+            yield element
+
+        yield from (element for element in iterator if test(get_value(element)))
+        return
+
+
+def _select_k(select: Callable[..., list[Any]], iterable: Iterable[Any], key: Any, k: int, args: tuple[Any, ...]) -> Any:
+    """
+    Selects `k` elements with `heapq.nlargest` or `heapq.nsmallest`, keeping no more than `k` elements in memory.
+    """
+    from ext_list import ExtList
+
+    iterator = iter(iterable)
+
+    for element in iterator:
+        if k <= 0:
+            break
+
+        get_value = compile_key(key, element, *args).getter
+
+        return ExtList(select(k, chain((element,), iterator), key=get_value))
+
+    return ExtList()
+
+
+def _extract(iterable: Iterable[Any], key: Any, args: tuple[Any, ...]) -> Iterator[Any]:
+    iterator = iter(iterable)
+
+    for element in iterator:
+        get_value = compile_key(key, element, *args).getter
+
+        yield get_value(element)
+        yield from map(get_value, iterator)
+        return
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterator
+from typing import Mapping
+from typing import MutableMapping
+
+from ext_list.row_plan import RowPlan
+
+_DELETED = object()
+
+
+class RowView(MutableMapping[Hashable, Any]):
+    """
+    A mapping which reads through a layout into a row it does not copy.
+
+    The layout is shared by every view of one call, so a view costs two slots whatever the width of the row. Reading a
+    key goes through the layout each time. The first write copies what the view shows into a dict of its own, after which
+    the view reads and writes that dict; the underlying row is never modified.
+
+    Examples:
+        >>> row = {'name': 'Alice', 'age': 25}
+        >>> view = ExtList([row]).rename_keys({'name': 'Name'}, view=True)[0]
+        >>> view['Name']
+        'Alice'
+        >>> view['age'] = 26
+        >>> view, row
+        ({'age': 26, 'Name': 'Alice'}, {'name': 'Alice', 'age': 25})
+    """
+
+    __slots__ = ('_row', '_layout')
+
+    def __init__(self, row: Any, layout: Any) -> None:
+        self._row = row
+        self._layout = layout
+
+    def __getitem__(self, key: Hashable) -> Any:
+        layout = self._layout
+
+        if layout is None:
+            return self._row[key]
+
+        return layout.get(self._row, key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        if self._layout is None:
+            return iter(self._row)
+
+        return self._layout.keys(self._row)
+
+    def __len__(self) -> int:
+        if self._layout is None:
+            return len(self._row)
+
+        return sum(1 for _ in self._layout.keys(self._row))
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.materialize()[key] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self.materialize()[key]
+
+    def materialize(self) -> dict[Hashable, Any]:
+        """
+        Copies what the view shows into a dict owned by the view, if it has not done so yet, and returns that dict.
+        """
+        if self._layout is not None:
+            self._row = {key: self._layout.get(self._row, key) for key in self._layout.keys(self._row)}
+            self._layout = None
+
+        return self._row  # type: ignore[no-any-return]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class RenameLayout:
+    """
+    Shows the keys of a row renamed as `rename_keys` renames them: each `from_key` is moved to its `to_key` in turn,
+    overwriting the value held there, so the keys come in the order `rename_keys` leaves them in.
+    """
+
+    __slots__ = ('renames', 'sources', 'required')
+
+    def __init__(self, rename_keys: Mapping[Hashable, Hashable]) -> None:
+        self.renames = tuple(rename_keys.items())
+        self.sources: dict[Hashable, Any] = {}
+        self.required: list[Hashable] = []
+
+        for from_key, to_key in self.renames:
+            source = self.sources.get(from_key, from_key)
+
+            if from_key not in self.sources:
+                self.required.append(from_key)
+
+            self.sources.pop(to_key, None)
+            self.sources[to_key] = source
+            self.sources[from_key] = _DELETED
+
+    def validate(self, rows: list[Mapping[Hashable, Any]]) -> None:
+        """
+        Raises KeyError for the first key to rename which a row does not hold, as `rename_keys` does.
+        """
+        for row in rows:
+            for key in self.required:
+                if key not in row:
+                    raise KeyError(key)
+
+    def get(self, row: Mapping[Hashable, Any], key: Hashable) -> Any:
+        source = self.sources.get(key, key)
+
+        if source is _DELETED:
+            raise KeyError(key)
+
+        return row[source]
+
+    def keys(self, row: Mapping[Hashable, Any]) -> Iterator[Hashable]:
+        keys = dict.fromkeys(row)
+
+        for from_key, to_key in self.renames:
+            keys[to_key] = None
+            del keys[from_key]
+
+        return iter(keys)
+
+
+class MapLayout:
+    """
+    Shows the values of `keys` passed through `function(value, *args)`, which is called on every read.
+    """
+
+    __slots__ = ('mapped_keys', 'function', 'args', 'required')
+
+    def __init__(self, keys: list[Hashable], function: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        self.mapped_keys = frozenset(keys)
+        self.function = function
+        self.args = args
+        self.required = tuple(keys)
+
+    def validate(self, rows: list[Mapping[Hashable, Any]]) -> None:
+        """
+        Raises KeyError for the first key to map which a row does not hold, as `map_for_keys` does.
+        """
+        for row in rows:
+            for key in self.required:
+                if key not in row:
+                    raise KeyError(key)
+
+    def get(self, row: Mapping[Hashable, Any], key: Hashable) -> Any:
+        if key in self.mapped_keys:
+            return self.function(row[key], *self.args)
+
+        return row[key]
+
+    def keys(self, row: Mapping[Hashable, Any]) -> Iterator[Hashable]:
+        return iter(row)
+
+
+class ColumnLayout:
+    """
+    Shows the columns of a :class:`RowPlan`, read from any element through the accessors of the plan.
+    """
+
+    __slots__ = ('accessors',)
+
+    def __init__(self, plan: RowPlan) -> None:
+        self.accessors: dict[Hashable, Callable[[Any], Any]] = dict(zip(plan.columns, plan.accessors))
+
+    def get(self, element: Any, key: Hashable) -> Any:
+        return self.accessors[key](element)
+
+    def keys(self, element: Any) -> Iterator[Hashable]:
+        return iter(self.accessors)
+
+
+def row_views(rows: list[Any], layout: Any) -> list[RowView]:
+    return [RowView(row, layout) for row in rows]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import copy
+import pickle
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    ext_list = ExtList([{'a': 1}, {'a': 2}])
+    ext_list.create_index('a')
+
+    copied = copy.copy(ext_list)
+    copied.append({'a': 9})
+
+    assert copied == [{'a': 1}, {'a': 2}, {'a': 9}]
+    assert copied._indexes is not ext_list._indexes
+    assert ext_list.equal('a', 1) == [{'a': 1}]
+    assert copied.equal('a', 9) == [{'a': 9}]
+    assert copied[0] is ext_list[0]
+
+
+def test_keep_element_shape():
+    ext_list = ExtList([Person('Alice', 25)])
+    copied = copy.copy(ext_list)
+
+    assert isinstance(copied, ExtList)
+    assert copied._element_shape == ext_list._element_shape
+
+
+def test_deepcopy():
+    ext_list = ExtList([{'a': 1}, {'a': 2}])
+    ext_list.create_index('a')
+
+    copied = copy.deepcopy(ext_list)
+    copied.append({'a': 9})
+
+    assert isinstance(copied, ExtList)
+    assert copied[0] is not ext_list[0]
+    assert ext_list.equal('a', 9) == []
+    assert copied.equal('a', 9) == [{'a': 9}]
+
+
+def test_pickle():
+    ext_list = ExtList([{'a': 1}, {'a': 2}])
+    ext_list.create_index('a')
+
+    unpickled = pickle.loads(pickle.dumps(ext_list))
+    unpickled.append({'a': 1})
+
+    assert isinstance(unpickled, ExtList)
+    assert unpickled == [{'a': 1}, {'a': 2}, {'a': 1}]
+    assert unpickled.equal('a', 1) == [{'a': 1}, {'a': 1}]
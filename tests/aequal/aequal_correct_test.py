@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import asyncio
+
+from ext_list import ExtList
+from tests.conftest import FakeService
+from tests.conftest import Person
+
+
+class Account:
+    service = FakeService({'alice': 'red', 'bob': 'blue'})
+
+    def __init__(self, name: str):
+        self.name = name
+
+    async def team(self) -> str:
+        return await self.service.get(self.name)
+
+    def __repr__(self) -> str:
+        return f"Account('{self.name}')"
+
+
+def test():
+    alice = Account('alice')
+    bob = Account('bob')
+    ext_list_1 = ExtList([alice, bob])
+
+    assert asyncio.run(ext_list_1.aequal(Account.team, 'red')) == [alice]
+    assert asyncio.run(ext_list_1.aequal('team', 'blue', concurrency=1)) == [bob]
+    assert asyncio.run(ExtList([{'a': 1}, {'a': 2}]).aequal('a', 2)) == [{'a': 2}]
+    assert asyncio.run(ExtList([Person(name='alice', age=25)]).aequal(Person.age, 30)) == []
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import asyncio
+
+from ext_list import ExtList
+from tests.conftest import FakeService
+from tests.conftest import Person
+
+
+def test():
+    service = FakeService({'alice': 0.5, 'bob': 0.75})
+    ext_list_1 = ExtList([Person(name='alice', age=25), Person(name='bob', age=30)])
+
+    async def fetch_score(person, weight):
+        return await service.get(person.name) * weight
+
+    assert asyncio.run(ext_list_1.aextract(fetch_score, 2)) == [1.0, 1.5]
+    assert asyncio.run(ext_list_1.aextract(Person.get_age_n_years_ago, 5)) == [20, 25]
+    assert asyncio.run(ext_list_1.aextract('name')) == ['alice', 'bob']
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import asyncio
+
+from ext_list import ExtList
+from tests.conftest import FakeService
+from tests.conftest import Person
+
+
+def test():
+    service = FakeService({'alice': False, 'bob': True, 'charlie': True})
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    charlie = Person(name='charlie', age=35)
+
+    async def is_active(person):
+        return await service.get(person.name)
+
+    assert asyncio.run(ExtList([alice, bob, charlie]).afilter(is_active, concurrency=2)) == [bob, charlie]
+    assert asyncio.run(ExtList([1, 2, 3]).afilter(lambda value, n: value > n, 1)) == [2, 3]
+    assert asyncio.run(ExtList().afilter(is_active)) == []
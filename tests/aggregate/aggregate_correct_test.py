@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list import keys
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([
+        {'team': 'red', 'amount': 10, 'name': 'a'},
+        {'team': 'blue', 'amount': 5, 'name': 'b'},
+        {'team': 'red', 'amount': 20, 'name': 'c'},
+        {'team': 'red', 'amount': 15, 'name': 'd'},
+    ])
+
+    assert ext_list_1.aggregate(
+        'team', {
+            'rows': ('count',),
+            'total': ('sum', 'amount'),
+            'smallest': ('min', 'amount'),
+            'largest': ('max', 'amount'),
+            'average': ('mean', 'amount'),
+            'first': ('first', 'name'),
+            'last': ('last', 'name'),
+            'names': (lambda names, name: names + name, 'name'),
+        },
+    ) == {
+        'red': {'rows': 3, 'total': 45, 'smallest': 10, 'largest': 20, 'average': 15.0, 'first': 'a', 'last': 'd', 'names': 'acd'},
+        'blue': {'rows': 1, 'total': 5, 'smallest': 5, 'largest': 5, 'average': 5.0, 'first': 'b', 'last': 'b', 'names': 'b'},
+    }
+
+    assert ext_list_1.aggregate('team', {'rows': ('count', None)}, as_list=True) == [{'team': 'red', 'rows': 3}, {'team': 'blue', 'rows': 1}]
+    assert ExtList().aggregate('team', {'rows': ('count',)}) == {}
+    assert ExtList().aggregate('team', {'rows': ('count',)}, as_list=True) == []
+
+
+def test_aggregate_with_functions():
+    ext_list_1 = ExtList([Person(name='alice', age=25), Person(name='bob', age=30), Person(name='charlie', age=35)])
+
+    assert ext_list_1.aggregate(Person.get_age_n_years_ago, {'rows': ('count',)}, 25) == {0: {'rows': 1}, 5: {'rows': 1}, 10: {'rows': 1}}
+    assert ext_list_1.aggregate(lambda person: person.age > 26, {'ages': ('sum', Person.get_age_n_years_ago, (5,))}) == {False: {'ages': 20}, True: {'ages': 55}}
+    assert ext_list_1.aggregate(Person.introduce, {'name': ('first', Person.name)}, as_list=True)[0] == {'introduce': 'alice is 25 years old.', 'name': 'alice'}
+
+
+def test_matches_group_by_key():
+    ext_list_1 = ExtList(list(range(100)))
+    groups = ext_list_1.group_by_key(int.bit_length)
+
+    assert ext_list_1.aggregate(int.bit_length, {'total': ('sum', lambda value: value)}) == {key: {'total': sum(group)} for key, group in groups.items()}
+
+
+def test_cache_value_keys():
+    ext_list_1 = ExtList([{'g': 'a', 'v': 1}, {'g': 'b', 'v': 2}, {'g': 'a', 'v': 3}])
+    keys.clear_key_cache()
+
+    for _ in range(3):
+        assert ext_list_1.aggregate('g', {'s': ('sum', 'v')}) == {'a': {'s': 4}, 'b': {'s': 2}}
+
+    assert keys._compile_cached.cache_info().currsize == 2
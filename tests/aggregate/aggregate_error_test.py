@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+
+
+def test_raise_value_error_by_specific_invalid_reducer():
+    with pytest.raises(ValueError):
+        ExtList([{'a': 1}]).aggregate('a', {'median': ('median', 'a')})
+
+
+def test_raise_value_error_by_specific_invalid_aggregation():
+    with pytest.raises(ValueError):
+        ExtList([{'a': 1}]).aggregate('a', {'total': 'sum'})
+
+    with pytest.raises(ValueError):
+        ExtList([{'a': 1}]).aggregate('a', {'total': ('sum',)})
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    with pytest.raises(KeyError):
+        ExtList([{'a': 1}]).aggregate('a', {'total': ('sum', 'b')})
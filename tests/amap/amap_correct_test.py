@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import asyncio
+
+from ext_list import ExtList
+from tests.conftest import FakeService
+
+
+def test():
+    service = FakeService({i: i * 10 for i in range(50)})
+    ext_list_1 = ExtList(list(range(50)))
+
+    assert asyncio.run(ext_list_1.amap(service.get, concurrency=8)) == [i * 10 for i in range(50)]
+    assert service.max_in_flight == 8
+
+    assert asyncio.run(ExtList([1, 2]).amap(lambda value, n: value * n, 3)) == [3, 6]
+    assert asyncio.run(ExtList().amap(service.get)) == []
+    assert isinstance(asyncio.run(ext_list_1.amap(service.get)), ExtList)
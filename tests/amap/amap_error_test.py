@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ext_list import ExtList
+from tests.conftest import FakeService
+
+
+def test_raise_value_error_by_specific_invalid_concurrency():
+    with pytest.raises(ValueError):
+        asyncio.run(ExtList([1]).amap(str, concurrency=0))
+
+
+def test_raise_timeout_error_by_slow_function():
+    service = FakeService({1: 1, 2: 2, 3: 3}, delay=1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(ExtList([1, 2, 3]).amap(service.get, concurrency=2, timeout=0.01))
+
+    assert service.cancelled == 2
+    assert service.in_flight == 0
+
+
+def test_raise_key_error_by_failing_function():
+    service = FakeService({1: 1, 3: 3}, delay=0)
+    slow = FakeService({1: 1, 2: 2, 3: 3}, delay=1)
+
+    async def lookup(value):
+        if value == 2:
+            return await service.get(value)
+
+        return await slow.get(value)
+
+    with pytest.raises(KeyError):
+        asyncio.run(ExtList([1, 2, 3]).amap(lookup, concurrency=3))
+
+    assert slow.cancelled == 2
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': 3}, {'a': 1}, {'a': 2}, {'a': 4}])
+    assert ext_list_1.between('a', 2, 3) == [{'a': 3}, {'a': 2}]
+    assert ext_list_1.between('a', 2, 3, inclusive='left') == [{'a': 2}]
+    assert ext_list_1.between('a', 2, 3, inclusive='right') == [{'a': 3}]
+    assert ext_list_1.between('a', 2, 3, inclusive='neither') == []
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    charlie = Person(name='charlie', age=35)
+    ext_list_2 = ExtList([alice, bob, charlie])
+    assert ext_list_2.between(Person.age, 26, 40) == [bob, charlie]
+    assert ext_list_2.between(Person.get_age_n_years_ago, 20, 25, 5) == [alice, bob]
+
+
+def test_use_sorted_index():
+    ext_list_1 = ExtList([{'a': 3}, {'a': 1}, {'a': 2}, {'a': 4}, {'a': 2}])
+    ext_list_1.create_index('a', kind='sorted')
+
+    assert ext_list_1.between('a', 2, 3) == [{'a': 3}, {'a': 2}, {'a': 2}]
+    assert ext_list_1.between('a', 2, 3, inclusive='left') == [{'a': 2}, {'a': 2}]
+    assert ext_list_1.between('a', 2, 3, inclusive='right') == [{'a': 3}]
+    assert ext_list_1.between('a', 2, 3, inclusive='neither') == []
+    assert ext_list_1.between('a', 3, 2) == []
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+
+
+def test_raise_value_error_by_specific_invalid_inclusive():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+
+    with pytest.raises(ValueError):
+        ext_list_1.between('a', 1, 2, inclusive='all')
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+
+    with pytest.raises(KeyError):
+        ext_list_1.between('b', 1, 2)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list import ExtStream
+from ext_list import instrument
+from tests.conftest import Person
+
+
+def test():
+    rows = [{'a': i % 7, 'b': i} for i in range(50)]
+    ext_list_1 = ExtList(rows)
+
+    assert ext_list_1.bottom_k('a', 5) == sorted(rows, key=lambda row: row['a'])[:5]
+    assert ext_list_1.bottom_k('a', -1) == []
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    assert ExtList([bob, alice]).bottom_k(Person.age, 1) == [alice]
+
+
+def test_bottom_k_with_sorted_index(instrumented):
+    rows = [{'a': i % 7, 'b': i} for i in range(50)]
+    ext_list_1 = ExtList(rows)
+    ext_list_1.create_index('a', kind='sorted')
+
+    assert ext_list_1.bottom_k('a', 9) == sorted(rows, key=lambda row: row['a'])[:9]
+    assert instrument.FAST_PATH_COUNTS['sorted_index'] == 1
+
+
+def test_stream():
+    assert ExtStream({'a': 10 - i} for i in range(10)).bottom_k('a', 2) == [{'a': 1}, {'a': 2}]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from ext_list import codegen
+
+
+def test():
+    select = codegen.selector(codegen.CONDITIONS['greater'], codegen.ITEM)
+    assert select([{'a': 1}, {'a': 2}], 1, None, 'a', None, ()) == [{'a': 2}]
+    assert codegen.selector(codegen.CONDITIONS['greater'], codegen.ITEM) is select
+
+    select = codegen.selector(codegen.CONDITIONS['equal'], codegen.ATTRIBUTE, 'real')
+    assert select([1, 2, 1], 1, None, None, None, ()) == [1, 1]
+
+    select = codegen.selector(codegen.BETWEEN_CONDITIONS['left'], codegen.FUNCTION, arity=2)
+    assert select([1, 2, 3], 4, 6, lambda value, a, b: value * a + b, None, (2, 1)) == [2]
+
+    select = codegen.selector(codegen.CONDITIONS['is_none'], codegen.CALL)
+    assert select([None, 0], None, None, None, lambda value: value, ()) == [None]
+
+
+def test_fused_selector():
+    fused = codegen.fused_selector((codegen.CONDITIONS['greater'], codegen.CONDITIONS['is_none'], codegen.BETWEEN_CONDITIONS['both']))
+    rows = [{'a': 1, 'b': None}, {'a': 2, 'b': None}, {'a': 3, 'b': 0}]
+
+    def get_a(row):
+        return row['a']
+
+    def get_b(row):
+        return row['b']
+
+    assert fused(rows, get_a, 1, get_b, get_a, 0, 5) == [{'a': 2, 'b': None}]
+
+
+def test_bound_caches():
+    for function in (codegen.selector, codegen.fused_selector, codegen.predicate_selector):
+        assert function.cache_info().maxsize == codegen.SELECTOR_CACHE_SIZE
+
+    for number in range(codegen.SELECTOR_CACHE_SIZE + 10):
+        codegen.selector(codegen.CONDITIONS['equal'], codegen.ATTRIBUTE, f'attribute_{number}')
+
+    assert codegen.selector.cache_info().currsize == codegen.SELECTOR_CACHE_SIZE
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import codegen
+
+
+def test_raise_value_error_by_invalid_attribute():
+    with pytest.raises(ValueError):
+        codegen.selector(codegen.CONDITIONS['equal'], codegen.ATTRIBUTE, 'a.b')
+
+    with pytest.raises(ValueError):
+        codegen.selector(codegen.CONDITIONS['equal'], codegen.ATTRIBUTE, 'class')
+
+
+def test_raise_value_error_by_invalid_access():
+    with pytest.raises(ValueError):
+        codegen.selector(codegen.CONDITIONS['equal'], 'slot')
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import operator
+import pickle
+
+from ext_list import ExtList
+from ext_list import keys
+from ext_list.keys import compile_key
+from tests.conftest import Person
+
+
+class Point:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+
+def test():
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+
+    spec_1 = compile_key('a', {'a': 1})
+    assert spec_1.kind == keys.INDEX
+    assert isinstance(spec_1.getter, operator.itemgetter)
+    assert spec_1({'a': 2}) == 2
+
+    spec_2 = compile_key(Person.age, alice)
+    assert spec_2.kind == keys.PROPERTY
+    assert spec_2.name == 'age'
+    assert spec_2(bob) == 30
+
+    spec_3 = compile_key('name', alice)
+    assert spec_3.kind == keys.PROPERTY
+    assert spec_3(bob) == 'bob'
+
+    spec_4 = compile_key(Person.get_age_n_years_ago, alice, 5)
+    assert spec_4.kind == keys.CALLABLE
+    assert spec_4(bob) == 25
+
+    spec_5 = compile_key('x', Point(1, 2))
+    assert spec_5.kind == keys.PROPERTY
+    assert spec_5(Point(3, 4)) == 3
+
+
+def test_cache_compiled_keys():
+    alice = Person(name='alice', age=25)
+
+    assert compile_key(Person.get_age_n_years_ago, alice, 5) is compile_key(Person.get_age_n_years_ago, alice, 5)
+    assert compile_key(Person.get_age_n_years_ago, alice, 5) is not compile_key(Person.get_age_n_years_ago, alice, 6)
+    assert compile_key('name', alice) is not compile_key('name', {'name': 'alice'})
+
+
+def test_cache_arguments_by_type():
+    class Labelled:
+        def __init__(self, name: str):
+            self.name = name
+
+        def label(self, suffix: object) -> str:
+            return f'{self.name}-{suffix}'
+
+    ext_list_1 = ExtList([Labelled('a'), Labelled('b')])
+
+    assert ext_list_1.extract(Labelled.label, 1) == ['a-1', 'b-1']
+    assert ext_list_1.extract(Labelled.label, True) == ['a-True', 'b-True']
+    assert ext_list_1.extract(Labelled.label, 1.0) == ['a-1.0', 'b-1.0']
+    assert ext_list_1.equal(Labelled.label, 'a-True', True) == [ext_list_1[0]]
+
+
+def test_accept_key_spec_in_methods():
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    ext_list_1 = ExtList([alice, bob])
+    age = compile_key(Person.age, alice)
+
+    assert ext_list_1.equal(age, 30) == [bob]
+    assert ext_list_1.extract(age) == [25, 30]
+    assert ext_list_1.to_dict(age) == {25: alice, 30: bob}
+    assert ext_list_1.group_by_key(age) == {25: [alice], 30: [bob]}
+    assert ext_list_1.to_dict_list([age, 'name']) == [{'age': 25, 'name': 'alice'}, {'age': 30, 'name': 'bob'}]
+
+
+def test_restore_getter_from_portable_form():
+    alice = Person('alice', 25)
+
+    for key, element, args in [
+        ('a', {'a': 1}, ()), (Person.age, alice, ()), ('age', alice, ()), (Person.get_age_n_years_ago, alice, (5,)),
+        ('introduce', alice, ()), (Point.x, Point(1, 2), ()), (int.real, 3, ()),
+    ]:
+        spec = compile_key(key, element, *args)
+        get_value = keys.restore_getter(pickle.loads(pickle.dumps(spec.portable)), args)
+
+        assert get_value(element) == spec(element)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list.keys import compile_key
+from tests.conftest import Person
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    alice = Person(name='alice', age=25)
+
+    with pytest.raises(KeyError):
+        compile_key(1, alice)
+
+
+def test_raise_attribute_error_by_specific_invalid_attribute():
+    alice = Person(name='alice', age=25)
+    spec = compile_key('hello', alice)
+
+    with pytest.raises(AttributeError):
+        spec(alice)
@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from ext_list import instrument
+
 
 class Person:
     def __init__(self, name: str, age: int):
@@ -22,3 +29,54 @@ class Person:
 
     def __repr__(self) -> str:
         return f"Person('{self.name}', {self.age})"
+
+
+@dataclass
+class Member:
+    """
+    A dataclass whose fields with defaults are plain class attributes, overridden per instance.
+    """
+
+    name: str
+    team: str = 't1'
+    score: int = 0
+
+
+class FakeService:
+    """
+    A local stand-in for a lookup service, which records how many lookups are in flight at once.
+    """
+
+    def __init__(self, values: dict, delay: float = 0.001):
+        self.values = values
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def get(self, name):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(self.delay)
+            return self.values[name]
+
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def instrumented():
+    """
+    Records calls for the duration of a test, so that fast paths are counted.
+    """
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.disable()
+    instrument.reset()
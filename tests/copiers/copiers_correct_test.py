@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections import UserDict
+from types import MappingProxyType
+
+from ext_list import ExtList
+from ext_list.copiers import copy_rows
+from ext_list.copiers import register_copier
+from ext_list.copiers import unregister_copier
+
+
+class Record(dict):
+    pass
+
+
+def test():
+    nested = [1, 2]
+    rows = [{'a': nested}, [nested], OrderedDict(a=nested), UserDict(a=nested)]
+
+    copied = copy_rows(rows)
+
+    assert copied == rows
+    assert [type(row) for row in copied] == [dict, list, OrderedDict, UserDict]
+    assert all(row is not copied_row for row, copied_row in zip(rows, copied))
+    assert copied[0]['a'] is nested
+
+
+def test_mapping_proxy():
+    copied = copy_rows([MappingProxyType({'a': 1})])
+
+    assert copied == [{'a': 1}]
+    assert type(copied[0]) is dict
+
+
+def test_deep():
+    nested = [1, 2]
+    copied = copy_rows([{'a': nested}, {'a': nested}], deep=True)
+
+    assert copied[0]['a'] == nested
+    assert copied[0]['a'] is not nested
+    assert copied[0]['a'] is copied[1]['a']
+
+
+def test_register_copier():
+    calls = []
+
+    def copy_record(record):
+        calls.append(record)
+        return Record(record)
+
+    register_copier(Record, copy_record)
+
+    try:
+        copied = ExtList([Record(a=1)]).rename_keys({'a': 'b'})
+
+    finally:
+        unregister_copier(Record)
+
+    assert copied == [{'b': 1}]
+    assert type(copied[0]) is Record
+    assert calls == [{'a': 1}]
+
+
+def test_fallback_copy_keeps_type():
+    copied = copy_rows([Record(a=1)])
+
+    assert copied == [{'a': 1}]
+    assert type(copied[0]) is Record
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list.predicates import eq
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}, {'a': 1, 'b': 6}, {'a': 0, 'b': 8}])
+    ext_list_1.create_index('a')
+
+    assert ext_list_1.has_index('a')
+    assert ext_list_1.equal('a', 1) == [{'a': 1, 'b': 2}, {'a': 1, 'b': 6}]
+    assert ext_list_1.equal('a', 2) == []
+    assert ext_list_1.not_equal('a', 1) == [{'a': 3, 'b': 4}, {'a': 0, 'b': 8}]
+    assert ext_list_1.in_('a', [3, 1]) == [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}, {'a': 1, 'b': 6}]
+    assert ext_list_1.not_in_('a', [3, 1]) == [{'a': 0, 'b': 8}]
+    assert ext_list_1.to_dict('a') == {1: {'a': 1, 'b': 6}, 3: {'a': 3, 'b': 4}}
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    charlie = Person(name='charlie', age=25)
+    ext_list_2 = ExtList([alice, bob, charlie])
+    ext_list_2.create_index(Person.get_age_n_years_ago, 5)
+
+    assert ext_list_2.equal(Person.get_age_n_years_ago, 20, 5) == [alice, charlie]
+    assert ext_list_2.to_dict(Person.get_age_n_years_ago, 5) == {20: charlie, 25: bob}
+
+
+def test_keep_index_up_to_date():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+    ext_list_1.create_index('a')
+
+    ext_list_1.append({'a': 1, 'b': 1})
+    ext_list_1.extend(ExtList([{'a': 2, 'b': 2}]))
+    ext_list_1 += ExtList([{'a': 1, 'b': 3}])
+    assert ext_list_1.equal('a', 1) == [{'a': 1}, {'a': 1, 'b': 1}, {'a': 1, 'b': 3}]
+
+    ext_list_1.insert(0, {'a': 1, 'b': 0})
+    assert ext_list_1.equal('a', 1) == [{'a': 1, 'b': 0}, {'a': 1}, {'a': 1, 'b': 1}, {'a': 1, 'b': 3}]
+
+    ext_list_1.pop(0)
+    del ext_list_1[0]
+    ext_list_1[0] = {'a': 2, 'b': 9}
+    assert ext_list_1.equal('a', 2) == [{'a': 2, 'b': 9}, {'a': 2, 'b': 2}]
+
+    ext_list_1.reverse()
+    assert ext_list_1.equal('a', 2) == [{'a': 2, 'b': 2}, {'a': 2, 'b': 9}]
+
+    ext_list_1.clear()
+    assert ext_list_1.equal('a', 2) == []
+
+    ext_list_1.append({'a': 2})
+    assert ext_list_1.equal('a', 2) == [{'a': 2}]
+
+
+def test_fall_back_to_scan_for_unhashable_targets():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+    ext_list_1.create_index('a')
+
+    assert ext_list_1.in_('a', range(2)) == [{'a': 1}]
+    assert ext_list_1.equal('a', [1]) == []
+
+
+def test_hash_index_with_values_not_equal_to_themselves():
+    nan = float('nan')
+    elements = [{'a': nan, 'b': 1}, {'a': 1.0}, {'a': nan, 'b': 2}]
+    ext_list_1 = ExtList(elements)
+    ext_list_1.create_index('a')
+    ext_list_2 = ExtList(elements)
+
+    assert ext_list_1.equal('a', nan) == ext_list_2.equal('a', nan) == []
+    assert ext_list_1.not_equal('a', nan) == ext_list_2.not_equal('a', nan) == elements
+    assert ext_list_1.in_('a', [nan, 1.0]) == ext_list_2.in_('a', [nan, 1.0]) == elements
+    assert ext_list_1.not_in_('a', [1.0]) == ext_list_2.not_in_('a', [1.0]) == [{'a': nan, 'b': 1}, {'a': nan, 'b': 2}]
+    assert ext_list_1.where(eq('a', nan)) == []
+    assert ext_list_1.to_dict('a') == ext_list_2.to_dict('a') == {nan: {'a': nan, 'b': 2}, 1.0: {'a': 1.0}}
+
+    ext_list_1.append({'a': nan, 'b': 3})
+    assert ext_list_1.equal('a', nan) == []
+    assert ext_list_1.equal('a', 1.0) == [{'a': 1.0}]
+
+
+def test_drop_index():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+    ext_list_1.create_index('a')
+    ext_list_1.drop_index('a')
+
+    assert not ext_list_1.has_index('a')
+    assert ext_list_1.equal('a', 1) == [{'a': 1}]
+
+
+def test_drop_index_when_values_become_unhashable():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+    ext_list_1.create_index('a')
+    ext_list_1[0] = {'a': [1]}
+
+    assert ext_list_1.equal('a', [1]) == [{'a': [1]}]
+    assert ext_list_1.equal('a', 2) == [{'a': 2}]
+    assert not ext_list_1.has_index('a')
+
+
+def test_sorted_index():
+    ext_list_1 = ExtList([{'a': 3}, {'a': 1}, {'a': 2}, {'a': 4}, {'a': 2}])
+    ext_list_1.create_index('a', kind='sorted')
+
+    assert ext_list_1.has_index('a', kind='sorted')
+    assert not ext_list_1.has_index('a')
+    assert ext_list_1.greater('a', 2) == [{'a': 3}, {'a': 4}]
+    assert ext_list_1.greater_or_equal('a', 2) == [{'a': 3}, {'a': 2}, {'a': 4}, {'a': 2}]
+    assert ext_list_1.less('a', 3) == [{'a': 1}, {'a': 2}, {'a': 2}]
+    assert ext_list_1.less_or_equal('a', 3) == [{'a': 3}, {'a': 1}, {'a': 2}, {'a': 2}]
+
+    ext_list_1.append({'a': 0})
+    ext_list_1.extend(ExtList([{'a': 5}, {'a': 2}]))
+    assert ext_list_1.less('a', 2) == [{'a': 1}, {'a': 0}]
+    assert ext_list_1.greater('a', 3) == [{'a': 4}, {'a': 5}]
+
+    ext_list_1.sort(key=lambda element: -element['a'])
+    assert ext_list_1.less_or_equal('a', 1) == [{'a': 1}, {'a': 0}]
+
+
+def test_sorted_index_with_values_not_equal_to_themselves():
+    nan = float('nan')
+    elements = [{'a': 3.0}, {'a': nan}, {'a': 1.0}, {'a': 2.0}]
+    ext_list_1 = ExtList(elements)
+    ext_list_1.create_index('a', kind='sorted')
+    ext_list_2 = ExtList(elements)
+
+    assert ext_list_1.greater('a', 0.5) == ext_list_2.greater('a', 0.5) == [{'a': 3.0}, {'a': 1.0}, {'a': 2.0}]
+    assert ext_list_1.less_or_equal('a', 2.0) == ext_list_2.less_or_equal('a', 2.0) == [{'a': 1.0}, {'a': 2.0}]
+    assert ext_list_1.between('a', 1.0, 2.0) == ext_list_2.between('a', 1.0, 2.0) == [{'a': 1.0}, {'a': 2.0}]
+    assert ext_list_1.bottom_k('a', 2) == ext_list_2.bottom_k('a', 2)
+    assert ext_list_1.sorted_by('a') == ext_list_2.sorted_by('a')
+
+    ext_list_1.append({'a': nan})
+    ext_list_1.append({'a': 0.0})
+    assert ext_list_1.less('a', 1.5) == [{'a': 1.0}, {'a': 0.0}]
+    assert len(ext_list_1.sorted_by('a')) == 6
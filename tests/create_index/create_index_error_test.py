@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+
+
+def test_raise_value_error_by_specific_unknown_kind():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+
+    with pytest.raises(ValueError):
+        ext_list_1.create_index('a', kind='bitmap')
+
+
+def test_raise_type_error_by_unhashable_values():
+    ext_list_1 = ExtList([{'a': [1]}, {'a': [2]}])
+
+    with pytest.raises(TypeError):
+        ext_list_1.create_index('a')
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+
+    with pytest.raises(KeyError):
+        ext_list_1.create_index('b')
+
+
+def test_raise_key_error_by_dropping_missing_index():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+
+    with pytest.raises(KeyError):
+        ext_list_1.drop_index('a')
+
+
+def test_raise_type_error_by_incomparable_values_for_sorted_index():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 'b'}])
+
+    with pytest.raises(TypeError):
+        ext_list_1.create_index('a', kind='sorted')
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import dispatch
+from ext_list import ExtList
+from ext_list import instrument
+from ext_list.keys import compile_key
+from tests.conftest import Person
+
+
+class Slotted:
+    __slots__ = ('value',)
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f'Slotted({self.value})'
+
+
+@pytest.fixture(autouse=True)
+def enable_instrument():
+    instrument.enable()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}, {'a': 1}])
+    assert ext_list_1.equal('a', 1) == [{'a': 1}, {'a': 1}]
+
+    decision = dispatch.last_decision()
+    assert decision.strategy == 'inline'
+    assert decision.kind == 'index'
+    assert decision.shape == 'indexable'
+    assert decision.size == 3
+
+    assert dispatch.explain(ext_list_1, 'greater', 'a', 1).strategy == 'inline'
+
+    ext_list_1.create_index('a')
+    assert dispatch.explain(ext_list_1, 'equal', 'a', 1).strategy == 'index'
+    assert dispatch.explain(ext_list_1, 'equal', 'a', [1]).strategy == 'inline'
+    assert dispatch.explain(ext_list_1, 'in_', 'a', [1]).strategy == 'index'
+    assert dispatch.explain(ext_list_1, 'greater', 'a', 1).strategy == 'inline'
+
+
+def test_slots():
+    ext_list_1 = ExtList([Slotted(1), Slotted(2), Slotted(3)])
+
+    for operator_name, compare_target, expected in [
+        ('equal', 2, [2]), ('not_equal', 2, [1, 3]), ('greater', 2, [3]), ('greater_or_equal', 2, [2, 3]),
+        ('less', 2, [1]), ('less_or_equal', 2, [1, 2]), ('in_', [1, 3], [1, 3]), ('not_in_', {1, 3}, [2]),
+    ]:
+        selected = getattr(ext_list_1, operator_name)(Slotted.value, compare_target)
+        assert [element.value for element in selected] == expected
+        assert dispatch.last_decision().strategy == 'inline'
+
+    assert ExtList([1, 2, 3]).greater(int.real, 1) == [2, 3]
+    assert dispatch.last_decision().strategy == 'inline'
+
+
+def test_callable():
+    alice = Person('alice', 25)
+    bob = Person('bob', 30)
+    ext_list_1 = ExtList([alice, bob])
+
+    assert ext_list_1.greater(Person.get_age_n_years_ago, 21, 5) == [bob]
+    assert dispatch.last_decision().strategy == 'inline'
+    assert dispatch.last_decision().access == 'function'
+
+    assert ext_list_1.between('get_age_n_years_ago', 21, 25, 5) == [bob]
+    assert dispatch.last_decision().access == 'call'
+
+    assert ext_list_1.less(Person.age, 30) == [alice]
+    assert dispatch.last_decision().strategy == 'comprehension'
+
+
+def test_numpy():
+    pytest.importorskip('numpy')
+
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+    assert ext_list_1.equal('a', 1, engine='numpy') == [{'a': 1}]
+    assert dispatch.last_decision().strategy == 'numpy'
+
+    assert ext_list_1.equal('a', 'x', engine='numpy') == []
+    assert dispatch.last_decision().strategy == 'compress'
+
+
+def test_record_only_while_instrumented():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+    ext_list_1.equal('a', 1)
+    decision = dispatch.last_decision()
+
+    instrument.disable()
+    assert ext_list_1.greater('a', 1) == [{'a': 2}]
+    assert ext_list_1.between('a', 1, 2) == [{'a': 1}, {'a': 2}]
+    assert dispatch.last_decision() is decision
+
+
+def test_cache_key_access():
+    ext_list_1 = ExtList([Slotted(1), Slotted(2)])
+    spec = compile_key(Slotted.value, ext_list_1[0])
+    assert ext_list_1.equal(spec, 2) == [ext_list_1[1]]
+    assert spec.access == ('attribute', 'value', 0)
+    assert dispatch.key_access(spec) is spec.access
+    assert spec.plans['equal'][0] == 'inline'
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import dispatch
+from ext_list import ExtList
+
+
+def test():
+    with pytest.raises(ValueError):
+        dispatch.explain(ExtList([{'a': 1}]), 'like', 'a', 1)
+
+    with pytest.raises(ValueError):
+        dispatch.explain(ExtList(), 'equal', 'a', 1)
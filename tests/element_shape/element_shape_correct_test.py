@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from ext_list import base
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+    assert base.get_element_shape(ext_list_1) == base.INDEXABLE
+
+    ext_list_2 = ExtList([Person('alice', 25), Person('bob', 30)])
+    assert base.get_element_shape(ext_list_2) == base.OBJECT
+
+    ext_list_3 = ExtList([{'a': 1}, Person('alice', 25)])
+    assert base.get_element_shape(ext_list_3) == base.MIXED
+
+
+def test_track_append_and_insert():
+    ext_list_1 = ExtList()
+    ext_list_1.append({'a': 1})
+    assert ext_list_1._element_shape == base.INDEXABLE
+
+    ext_list_1.insert(0, {'a': 0})
+    assert ext_list_1._element_shape == base.INDEXABLE
+
+    ext_list_1.append(Person('alice', 25))
+    assert ext_list_1._element_shape == base.MIXED
+
+
+def test_track_extend_and_add():
+    ext_list_1 = ExtList([{'a': 1}])
+    ext_list_2 = ExtList([{'a': 2}])
+    base.get_element_shape(ext_list_1)
+    base.get_element_shape(ext_list_2)
+
+    assert (ext_list_1 + ext_list_2)._element_shape == base.INDEXABLE
+
+    ext_list_1 += ext_list_2
+    assert ext_list_1._element_shape == base.INDEXABLE
+
+    ext_list_1.extend(ExtList([Person('alice', 25)]))
+    assert base.get_element_shape(ext_list_1) == base.MIXED
+
+
+def test_forget_shape_after_untracked_mutation():
+    ext_list_1 = ExtList([{'a': 1}, Person('alice', 25)])
+    assert base.get_element_shape(ext_list_1) == base.MIXED
+
+    ext_list_1.pop()
+    assert base.get_element_shape(ext_list_1) == base.INDEXABLE
+
+    ext_list_1[0] = Person('bob', 30)
+    assert base.get_element_shape(ext_list_1) == base.OBJECT
+
+
+def test_inherit_shape_in_filtered_result():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}, {'a': 1}])
+    base.get_element_shape(ext_list_1)
+
+    assert ext_list_1.equal('a', 1)._element_shape == base.INDEXABLE
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test_raise_attribute_error_after_appending_object_to_indexable_list():
+    ext_list_1 = ExtList([{'name': 'alice'}, {'name': 'bob'}])
+    assert ext_list_1.equal('name', 'alice') == [{'name': 'alice'}]
+
+    ext_list_1.append(Person('charlie', 35))
+
+    with pytest.raises(AttributeError):
+        ext_list_1.equal('name', 'alice')
+
+
+def test_raise_key_error_after_replacing_objects_with_indexable_elements():
+    ext_list_1 = ExtList([Person('alice', 25)])
+    assert ext_list_1.equal('name', 'alice') == [ext_list_1[0]]
+
+    ext_list_1[0] = {'age': 25}
+
+    with pytest.raises(KeyError):
+        ext_list_1.equal('name', 'alice')
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import engine
+from ext_list import ExtList
+from ext_list import instrument
+from tests.conftest import Person
+
+
+def test():
+    pytest.importorskip('numpy')
+
+    ext_list_1 = ExtList([{'a': i % 7, 'b': i * 0.25, 'c': str(i)} for i in range(50)])
+
+    for operator_name, compare_target in [
+        ('equal', 3), ('not_equal', 3), ('greater', 3), ('greater_or_equal', 3.0), ('less', 2.5), ('less_or_equal', 3),
+    ]:
+        for key in ['a', 'b']:
+            expected = getattr(ext_list_1, operator_name)(key, compare_target)
+            assert getattr(ext_list_1, operator_name)(key, compare_target, engine='numpy') == expected
+
+    assert ext_list_1.in_('a', [1, 5], engine='numpy') == ext_list_1.in_('a', [1, 5])
+    assert ext_list_1.not_in_('b', (0.5, 1), engine='numpy') == ext_list_1.not_in_('b', (0.5, 1))
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    assert ExtList([alice, bob]).greater(Person.get_age_n_years_ago, 21, 5, engine='numpy') == [bob]
+
+
+def test_counts_numpy_path(instrumented):
+    pytest.importorskip('numpy')
+
+    ExtList([{'a': 1}, {'a': 2}]).equal('a', 2, engine='numpy')
+
+    assert instrument.FAST_PATH_COUNTS['numpy'] == 1
+
+
+def test_falls_back_when_not_exact(instrumented):
+    pytest.importorskip('numpy')
+
+    big = 2 ** 53 + 1
+    ext_list_1 = ExtList([{'a': big}, {'a': big - 1}, {'a': True}, {'a': 'x'}])
+
+    assert ExtList([{'a': big}, {'a': big - 1}]).equal('a', float(big - 1), engine='numpy') == [{'a': big - 1}]
+    assert ExtList([{'a': 2 ** 64}]).equal('a', 2 ** 64, engine='numpy') == [{'a': 2 ** 64}]
+    assert ExtList([{'a': True}, {'a': 1}]).equal('a', 1, engine='numpy') == [{'a': True}, {'a': 1}]
+    assert ext_list_1.not_equal('a', 'x', engine='numpy') == ext_list_1[:3]
+
+    nan = float('nan')
+    assert ExtList([{'a': nan}, {'a': 1.0}]).in_('a', [nan], engine='numpy') == [{'a': nan}]
+    assert instrument.FAST_PATH_COUNTS['numpy'] == 0
+
+
+def test_call_key_once_per_element_when_falling_back(instrumented):
+    pytest.importorskip('numpy')
+
+    calls = []
+
+    def value(number):
+        calls.append(number)
+        return number if number < 3 else str(number)
+
+    assert ExtList([1, 2, 3]).not_equal(value, 2, engine='numpy') == [1, 3]
+    assert calls == [1, 2, 3]
+
+    calls.clear()
+    assert ExtList([1, 2, 3]).in_(value, [1, '3'], engine='numpy') == [1, 3]
+    assert calls == [1, 2, 3]
+    assert instrument.FAST_PATH_COUNTS['numpy'] == 0
+
+
+def test_default_engine():
+    assert engine.get_default_engine() == 'python'
+
+    engine.set_default_engine('python')
+    assert ExtList([{'a': 1}, {'a': 2}]).equal('a', 2) == [{'a': 2}]
+    assert ExtList([{'a': 1}, {'a': 2}]).equal('a', 2, engine='python') == [{'a': 2}]
+
+
+def test_set_default_engine_to_numpy(instrumented):
+    pytest.importorskip('numpy')
+
+    try:
+        engine.set_default_engine('numpy')
+        assert ExtList([{'a': 1}, {'a': 2}]).less('a', 2) == [{'a': 1}]
+        assert instrument.FAST_PATH_COUNTS['numpy'] == 1
+
+    finally:
+        engine.set_default_engine('python')
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import engine
+from ext_list import ExtList
+
+
+def test_raise_value_error_by_specific_invalid_engine():
+    with pytest.raises(ValueError):
+        ExtList([{'a': 1}]).equal('a', 1, engine='fortran')
+
+    with pytest.raises(ValueError):
+        engine.set_default_engine('fortran')
+
+
+@pytest.mark.skipif(engine.numpy is not None, reason='NumPy is installed')
+def test_raise_import_error_by_numpy_engine_without_numpy():
+    with pytest.raises(ImportError):
+        ExtList([{'a': 1}]).equal('a', 1, engine='numpy')
+
+    with pytest.raises(ImportError):
+        engine.set_default_engine('numpy')
+
+    assert engine.get_default_engine() == 'python'
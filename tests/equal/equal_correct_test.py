@@ -34,3 +34,24 @@ def test_reference_method_descriptor():
     ext_list_1 = ExtList([1, 2, 3])
 
     assert ext_list_1.equal(int.bit_length, 2) == [2, 3]
+
+
+def test_inplace():
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    ext_list_1 = ExtList([alice, bob, Person(name='charlie', age=30)])
+
+    assert ext_list_1.equal('age', 30, inplace=True) is ext_list_1
+    assert ext_list_1.equal('name', 'bob', inplace=True) == [bob]
+    assert ext_list_1 == [bob]
+
+
+def test_inplace_with_index():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}, {'a': 1}])
+    ext_list_1.create_index('a')
+
+    ext_list_1.equal('a', 1, inplace=True)
+
+    assert ext_list_1 == [{'a': 1}, {'a': 1}]
+    assert ext_list_1.equal('a', 2) == []
+    assert ext_list_1.equal('a', 1) == [{'a': 1}, {'a': 1}]
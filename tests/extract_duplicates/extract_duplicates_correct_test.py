@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ext_list import ExtList
+from ext_list import instrument
 from tests.conftest import Person
 
 
@@ -25,3 +26,10 @@ def test():
 
     ext_list_7 = ExtList([alice, bob, charlie])
     assert ext_list_5.extract_duplicates(ext_list_7) == [alice, bob, charlie]
+
+
+def test_use_set_for_hashable_elements(instrumented):
+    ext_list_1 = ExtList([1, 2, 3, 4])
+
+    assert ext_list_1.extract_duplicates(ExtList([4, 2, 6])) == [2, 4]
+    assert instrument.FAST_PATH_COUNTS['membership_set'] == 1
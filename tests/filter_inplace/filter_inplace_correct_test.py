@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([1, 2, 3, 4, 5])
+
+    assert ext_list_1.filter_inplace(lambda x: x % 2) is ext_list_1
+    assert ext_list_1 == [1, 3, 5]
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    ext_list_2 = ExtList([alice, bob])
+
+    assert ext_list_2.filter_inplace(lambda person, limit: person.age > limit, 26) == [bob]
+    assert ext_list_2.filter_inplace(lambda person: False) == []
+
+
+def test_empty():
+    ext_list_1 = ExtList()
+
+    assert ext_list_1.filter_inplace(bool) is ext_list_1
+
+
+def test_invalidates_index():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}, {'a': 3}])
+    ext_list_1.create_index('a', kind='sorted')
+
+    ext_list_1.filter_inplace(lambda row: row['a'] != 2)
+
+    assert ext_list_1.greater('a', 1) == [{'a': 3}]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ext_list import ExtList
+from tests.conftest import Member
 from tests.conftest import Person
 
 
@@ -31,3 +32,12 @@ def test_reference_getset_descriptor():
 def test_reference_method_descriptor():
     ext_list_4 = ExtList([1, 2, 4])
     assert ext_list_4.group_by_key(int.bit_length) == {1: [1], 2: [2], 3: [4]}
+
+
+def test_reference_dataclass_field_with_default():
+    alice = Member('alice')
+    bob = Member('bob', team='t2')
+    charlie = Member('charlie', score=3)
+    ext_list_1 = ExtList([alice, bob, charlie])
+
+    assert ext_list_1.group_by_key('team') == {'t1': [alice, charlie], 't2': [bob]}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ext_list import ExtList
+from ext_list import instrument
 from tests.conftest import Person
 
 
@@ -34,3 +35,36 @@ def test_reference_method_descriptor():
     ext_list_1 = ExtList([1, 2, 3])
 
     assert ext_list_1.in_(int.bit_length, [2]) == [2, 3]
+
+
+def test_use_set_for_hashable_values(instrumented):
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}, {'a': 3}])
+
+    assert ext_list_1.in_('a', [1, 3]) == [{'a': 1}, {'a': 3}]
+    assert instrument.FAST_PATH_COUNTS['membership_set'] == 1
+
+
+def test_fall_back_to_scan_for_unhashable_values(instrumented):
+    ext_list_1 = ExtList([{'a': [1]}, {'a': [2]}, {'a': 3}])
+
+    assert ext_list_1.in_('a', [[1], 3]) == [{'a': [1]}, {'a': 3}]
+    assert ext_list_1.in_('a', [3]) == [{'a': 3}]
+    assert instrument.FAST_PATH_COUNTS['membership_set'] == 0
+    assert instrument.FAST_PATH_COUNTS['membership_scan'] == 2
+
+
+def test_call_key_once_per_element(instrumented):
+    calls = []
+
+    def value(number):
+        calls.append(number)
+        return [number] if number % 2 else number
+
+    assert ExtList([1, 2, 3]).in_(value, [[1], 2]) == [1, 2]
+    assert calls == [1, 2, 3]
+    assert instrument.FAST_PATH_COUNTS['membership_scan'] == 1
+
+    calls.clear()
+    assert ExtList([2, 4]).in_(value, [4]) == [4]
+    assert calls == [2, 4]
+    assert instrument.FAST_PATH_COUNTS['membership_set'] == 1
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ext_list import ExtList
+from ext_list import instrument
+from tests.conftest import Person
+
+
+@pytest.fixture(autouse=True)
+def clean_instrument():
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test():
+    equal = ExtList.equal
+    instrument.enable()
+
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}, {'a': 1}])
+    assert ext_list_1.equal('a', 1) == [{'a': 1}, {'a': 1}]
+    assert ExtList([Person('alice', 25)]).extract(Person.age) == [25]
+
+    snapshot = instrument.snapshot()
+    assert snapshot['equal']['calls'] == 1
+    assert snapshot['equal']['input_size'] == 3
+    assert snapshot['equal']['output_size'] == 2
+    assert snapshot['equal']['time'] > 0
+    assert snapshot['equal']['key_kinds'] == {'index': 1}
+    assert snapshot['extract']['key_kinds'] == {'property': 1}
+
+    instrument.disable()
+
+    assert ExtList.equal is equal
+    ext_list_1.equal('a', 1)
+    assert instrument.snapshot()['equal']['calls'] == 1
+
+
+def test_fast_paths():
+    instrument.enable()
+
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+    ext_list_1.create_index('a')
+    ext_list_1.equal('a', 2)
+    ext_list_1.in_('a', [1])
+
+    snapshot = instrument.snapshot()
+    assert snapshot['equal']['fast_paths'] == {'hash_index': 1}
+    assert snapshot['in_']['fast_paths'] == {'hash_index': 1}
+    assert snapshot['create_index']['fast_paths'] == {}
+    assert instrument.FAST_PATH_COUNTS['hash_index'] == 2
+
+    instrument.disable()
+    ext_list_1.equal('a', 2)
+    assert instrument.FAST_PATH_COUNTS['hash_index'] == 2
+
+
+def test_hook():
+    calls = []
+    instrument.enable(calls.append)
+
+    ExtList([1, 2, 3]).one()
+    ExtList([1, 2, 3]).map(str)
+
+    assert [call.method for call in calls] == ['one', 'map']
+    assert calls[0].input_size == 3
+    assert calls[0].output_size is None
+    assert calls[1].output_size == 3
+
+
+def test_async_method():
+    instrument.enable()
+
+    async def double(value):
+        return value * 2
+
+    assert asyncio.run(ExtList([1, 2]).amap(double)) == [2, 4]
+    assert instrument.snapshot()['amap']['output_size'] == 2
+
+
+def test_records_failed_call():
+    instrument.enable()
+
+    with pytest.raises(IndexError):
+        ExtList([1]).nth_by(int.real, 5)
+
+    assert instrument.snapshot()['nth_by']['calls'] == 1
+
+
+def test_reset():
+    instrument.enable()
+    ExtList([1]).map(str)
+
+    instrument.reset()
+
+    assert instrument.snapshot() == {}
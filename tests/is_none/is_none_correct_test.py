@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': None}, {'a': 0}, {'a': False}, {'a': None}])
+    assert ext_list_1.is_none('a') == [{'a': None}, {'a': None}]
+
+    alice = Person(name='alice', age=25)
+    assert ExtList([alice]).is_none(Person.age) == []
+    assert ExtList([alice]).is_none(lambda person, n: None if person.age > n else 1, 20) == [alice]
+    assert ExtList().is_none('a') == []
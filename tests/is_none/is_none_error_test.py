@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    ext_list_1 = ExtList([{'a': None}])
+
+    with pytest.raises(KeyError):
+        ext_list_1.is_none('b')
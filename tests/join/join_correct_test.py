@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list import ExtStream
+from tests.conftest import Person
+
+
+def test():
+    people = ExtList([{'id': 1, 'name': 'alice'}, {'id': 2, 'name': 'bob'}, {'id': 3, 'name': 'charlie'}])
+    orders = ExtList([{'person_id': 3, 'item': 'cup'}, {'person_id': 1, 'item': 'pen'}, {'person_id': 1, 'item': 'ink'}, {'person_id': 9, 'item': 'box'}])
+
+    assert isinstance(people.join(orders, 'id', 'person_id'), ExtStream)
+    assert people.join(orders, 'id', 'person_id').collect() == [
+        (people[2], orders[0]), (people[0], orders[1]), (people[0], orders[2]),
+    ]
+    assert orders.join(people, 'person_id', 'id').collect() == [
+        (orders[0], people[2]), (orders[1], people[0]), (orders[2], people[0]),
+    ]
+    assert people.join(orders, 'id', 'person_id', how='left').collect() == [
+        (people[0], orders[1]), (people[0], orders[2]), (people[1], None), (people[2], orders[0]),
+    ]
+    assert people.join(orders, 'id', 'person_id', how='semi').collect() == [people[0], people[2]]
+    assert people.join(orders, 'id', 'person_id', how='anti').collect() == [people[1]]
+    assert people.join(orders, 'id', 'person_id', how='left', merge=True).collect()[2] == {'id': 2, 'name': 'bob'}
+    assert people.join(orders, 'id', 'person_id', merge=True).collect()[0] == {'id': 3, 'name': 'charlie', 'person_id': 3, 'item': 'cup'}
+
+
+def test_join_with_complex_keys():
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    rows = ExtList([{'name': 'bob', 'age': 25}, {'name': 'bob', 'age': 30}, {'name': 'alice', 'age': 20}])
+
+    assert ExtList([alice, bob]).join(rows, [Person.name, Person.age], ['name', 'age'], how='semi').collect() == [bob]
+    assert ExtList([alice, bob]).join(rows, [Person.name, Person.get_age_n_years_ago], ['name', 'age'], left_args=[(), (5,)]).collect() == [
+        (bob, rows[0]), (alice, rows[2]),
+    ]
+    assert ExtList([alice, bob]).join(ExtList([bob]), Person.name).collect() == [(bob, bob)]
+
+
+def test_join_with_empty_lists():
+    assert ExtList().join(ExtList([{'a': 1}]), 'a').collect() == []
+    assert ExtList([{'a': 1}]).join(ExtList(), 'a', how='left').collect() == [({'a': 1}, None)]
+    assert ExtList([{'a': 1}]).join([], 'a', how='anti').collect() == [{'a': 1}]
+
+
+def test_join_is_lazy():
+    left = ExtList([{'a': i % 3} for i in range(6)])
+    right = ExtList([{'a': 0}, {'a': 0}])
+    rows = iter(left.join(right, 'a', how='left'))
+
+    assert next(rows) == (left[0], right[0])
+    assert next(rows) == (left[0], right[1])
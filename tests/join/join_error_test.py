@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test_raise_value_error_by_specific_invalid_how():
+    with pytest.raises(ValueError):
+        ExtList([{'a': 1}]).join(ExtList([{'a': 1}]), 'a', how='outer')
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    with pytest.raises(KeyError):
+        ExtList([{'a': 1}]).join(ExtList([{'a': 1}]), 'a', 'b').collect()
+
+
+def test_raise_type_error_by_merging_objects():
+    alice = Person(name='alice', age=25)
+
+    with pytest.raises(TypeError):
+        ExtList([alice]).join(ExtList([alice]), Person.name, merge=True).collect()
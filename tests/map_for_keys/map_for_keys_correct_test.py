@@ -6,3 +6,29 @@ from ext_list import ExtList
 def test():
     ext_list = ExtList([{'name': 'alice', 'age': 25}, {'name': 'bob', 'age': 30}])
     assert ext_list.map_for_keys(['name'], str.capitalize) == [{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}]
+
+
+def test_inplace():
+    rows = [{'name': 'alice', 'age': 25}, {'name': 'bob', 'age': 30}]
+    ext_list = ExtList(rows)
+
+    assert ext_list.map_for_keys(['age'], lambda age, years: age + years, 1, inplace=True) is ext_list
+    assert rows == [{'name': 'alice', 'age': 26}, {'name': 'bob', 'age': 31}]
+
+
+def test_inplace_invalidates_index():
+    ext_list = ExtList([{'name': 'alice', 'age': 25}, {'name': 'bob', 'age': 30}])
+    ext_list.create_index('age')
+    ext_list.map_for_keys(['age'], lambda age: age + 1, inplace=True)
+
+    assert ext_list.equal('age', 26) == [{'name': 'alice', 'age': 26}]
+    assert ext_list.equal('age', 25) == []
+
+
+def test_view():
+    rows = [{'name': 'alice', 'age': 25}, {'name': 'bob', 'age': 30}]
+    ext_list = ExtList(rows).map_for_keys(['age'], lambda age, years: age + years, 1, view=True)
+
+    assert ext_list == [{'name': 'alice', 'age': 26}, {'name': 'bob', 'age': 31}]
+    assert ext_list.extract('age') == [26, 31]
+    assert rows == [{'name': 'alice', 'age': 25}, {'name': 'bob', 'age': 30}]
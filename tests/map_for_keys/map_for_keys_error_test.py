@@ -8,3 +8,13 @@ def test_raise_type_error_by_non_indexable_object():
 
     with pytest.raises(TypeError):
         ext_list.map_for_keys(['a'], str)
+
+
+def test_raise_key_error_by_viewing_missing_key():
+    ext_list_1 = ExtList([{'a': 1}, {'b': 2}])
+
+    with pytest.raises(KeyError):
+        ext_list_1.map_for_keys(['a'], str)
+
+    with pytest.raises(KeyError):
+        ext_list_1.map_for_keys(['a'], str, view=True)
@@ -34,3 +34,21 @@ def test_reference_method_descriptor():
     ext_list_1 = ExtList([1, 2, 3])
 
     assert ext_list_1.not_in_(int.bit_length, [2]) == [1]
+
+
+def test_fall_back_to_scan_for_unhashable_values():
+    ext_list_1 = ExtList([{'a': [1]}, {'a': [2]}, {'a': 3}])
+
+    assert ext_list_1.not_in_('a', [[1], 3]) == [{'a': [2]}]
+    assert ext_list_1.not_in_('a', (3,)) == [{'a': [1]}, {'a': [2]}]
+
+
+def test_call_key_once_per_element():
+    calls = []
+
+    def value(number):
+        calls.append(number)
+        return [number] if number % 2 else number
+
+    assert ExtList([1, 2, 3]).not_in_(value, [[1], 2]) == [3]
+    assert calls == [1, 2, 3]
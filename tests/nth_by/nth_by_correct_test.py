@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list import ExtStream
+from tests.conftest import Person
+
+
+def test():
+    rows = [{'a': (i * 7) % 11, 'b': i} for i in range(30)]
+    ext_list_1 = ExtList(rows)
+    expected = sorted(rows, key=lambda row: row['a'])
+
+    assert [ext_list_1.nth_by('a', n) for n in range(30)] == expected
+
+    ext_list_1.create_index('a', kind='sorted')
+    assert [ext_list_1.nth_by('a', n) for n in range(30)] == expected
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    assert ExtList([bob, alice]).nth_by(Person.get_age_n_years_ago, 1, 5) == bob
+
+
+def test_stream():
+    assert ExtStream({'a': 10 - i} for i in range(10)).nth_by('a', 3) == {'a': 4}
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+from ext_list import ExtStream
+
+
+def test_raise_index_error_by_specific_invalid_n():
+    with pytest.raises(IndexError):
+        ExtList([{'a': 1}]).nth_by('a', 1)
+
+    with pytest.raises(IndexError):
+        ExtList([{'a': 1}]).nth_by('a', -1)
+
+    with pytest.raises(IndexError):
+        ExtList().nth_by('a', 0)
+
+    with pytest.raises(IndexError):
+        ExtStream([{'a': 1}]).nth_by('a', 1)
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    with pytest.raises(KeyError):
+        ExtList([{'a': 1}]).nth_by('b', 0)
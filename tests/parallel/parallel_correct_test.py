@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ext_list import dispatch
+from ext_list import ExtList
+from ext_list import instrument
+from ext_list import parallel
+from ext_list.keys import CALLABLE
+from ext_list.keys import KeySpec
+from tests.conftest import Person
+
+
+def square(value: int, offset: int = 0) -> int:
+    return value * value + offset
+
+
+class Item:
+    def __init__(self, value: int):
+        self.value = value
+
+    def label(self) -> str:
+        return f'item{self.value}'
+
+
+class OtherItem(Item):
+    def label(self) -> str:
+        return f'other{self.value}'
+
+
+@pytest.fixture
+def no_threshold(monkeypatch):
+    monkeypatch.setattr(parallel, 'PARALLEL_THRESHOLD', 0)
+
+
+def test(no_threshold):
+    people = ExtList([Person(name=f'person{i}', age=i) for i in range(40)])
+
+    assert people.map(Person.get_age_n_years_ago, 5, workers=2) == people.map(Person.get_age_n_years_ago, 5)
+    assert people.extract('introduce', workers=2, executor='thread') == people.extract('introduce')
+    assert people.greater(Person.get_age_n_years_ago, 30, 1, workers=2) == people.greater(Person.get_age_n_years_ago, 30, 1)
+    assert people.in_('introduce', ['person3 is 3 years old.'], executor='thread') == [people[3]]
+    assert people.not_in_(Person.get_age_n_years_ago, [0, 1], 2, executor='thread') == people[:2] + people[4:]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        assert ExtList(list(range(100))).map(square, 1, executor=executor) == [square(i, 1) for i in range(100)]
+        assert people.equal(Person.introduce, 'person7 is 7 years old.', executor=executor) == [people[7]]
+
+
+def test_resolve_key_against_list(no_threshold):
+    items = ExtList([Item(0)] + [OtherItem(i) for i in range(1, 16)])
+
+    assert items.extract('label', workers=2) == items.extract('label')
+    assert items.extract('label', workers=2, executor='thread') == [f'item{i}' for i in range(16)]
+    assert items.equal('label', 'item5', workers=2) == [items[5]]
+
+
+def test_fall_back_to_serial_when_key_cannot_be_sent(no_threshold, instrumented):
+    spec = KeySpec(square, CALLABLE, square, 'square')
+    ext_list_1 = ExtList(list(range(20)))
+
+    assert ext_list_1.equal(spec, 16, workers=2) == [4]
+    assert ext_list_1.in_(spec, [1, 9], executor='thread') == [1, 3]
+    assert dispatch.last_decision().strategy == 'comprehension'
+    assert instrument.FAST_PATH_COUNTS['parallel'] == 0
+
+
+def test_counts_parallel_path(no_threshold, instrumented):
+    people = ExtList([Person(name='alice', age=25), Person(name='bob', age=30)])
+
+    people.equal(Person.introduce, 'bob is 30 years old.', executor='thread')
+    people.equal(Person.age, 30, executor='thread')
+
+    assert instrument.FAST_PATH_COUNTS['parallel'] == 1
+
+
+def test_stays_serial_below_threshold(instrumented):
+    people = ExtList([Person(name='alice', age=25), Person(name='bob', age=30)])
+
+    assert people.equal(Person.introduce, 'bob is 30 years old.', workers=2) == [people[1]]
+    assert ExtList([1, 2]).map(lambda value: value + 1, workers=2) == [2, 3]
+    assert instrument.FAST_PATH_COUNTS['parallel'] == 0
+
+
+def test_group_by_key_and_to_dict(no_threshold):
+    ext_list_1 = ExtList([{'a': i % 5, 'b': i} for i in range(103)])
+    people = ExtList([Person(name=f'person{i % 7}', age=i % 3) for i in range(50)])
+
+    assert list(ext_list_1.group_by_key('a', workers=3).items()) == list(ext_list_1.group_by_key('a').items())
+    assert list(ext_list_1.to_dict('a', workers=3).items()) == list(ext_list_1.to_dict('a').items())
+    assert list(people.group_by_key(Person.age, workers=2).items()) == list(people.group_by_key(Person.age).items())
+    assert list(people.to_dict('name', executor='thread').items()) == list(people.to_dict('name').items())
+    assert ExtList([[0, 'a'], [1, 'b'], [0, 'c']]).to_dict(0, executor='thread') == {1: [1, 'b']}
+    assert ExtList(list(range(40))).group_by_key(int.bit_length, executor='thread') == ExtList(list(range(40))).group_by_key(int.bit_length)
+
+
+def test_group_by_key_and_to_dict_resolve_key_against_list(no_threshold):
+    items = ExtList([Item(0)] + [OtherItem(i % 4) for i in range(1, 16)])
+
+    assert items.group_by_key('label', workers=2) == items.group_by_key('label')
+    assert items.to_dict('label', workers=2, executor='thread') == items.to_dict('label')
+    assert list(items.to_dict('label', workers=2)) == ['item0', 'item1', 'item2', 'item3']
+
+
+def test_merge_groups():
+    assert parallel.merge_groups([{'b': [0], 'a': [1]}, {'c': [2], 'a': [3]}, {'b': [4]}]) == {'b': [0, 4], 'a': [1, 3], 'c': [2]}
+    assert list(parallel.merge_last_positions([{'b': 0, 'a': 1}, {'c': 2, 'b': 3}])) == ['b', 'a', 'c']
+    assert parallel.merge_last_positions([{'b': 0, 'a': 1}, {'c': 2, 'b': 3}]) == {'b': 3, 'a': 1, 'c': 2}
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+
+
+def test_raise_value_error_by_specific_invalid_workers():
+    with pytest.raises(ValueError):
+        ExtList([1, 2]).map(str, workers=0)
+
+
+def test_raise_value_error_by_specific_invalid_executor():
+    with pytest.raises(ValueError):
+        ExtList([{'a': 1}]).equal('a', 1, executor='cluster')
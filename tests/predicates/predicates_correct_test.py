@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from ext_list.predicates import And
+from ext_list.predicates import and_
+from ext_list.predicates import between
+from ext_list.predicates import eq
+from ext_list.predicates import gt
+from ext_list.predicates import is_none
+from ext_list.predicates import Not
+from ext_list.predicates import Or
+from ext_list.predicates import or_
+
+
+def test():
+    predicate = and_(eq('a', 1), and_(gt('b', 2), is_none('c')))
+    assert isinstance(predicate, And)
+    assert len(predicate.operands) == 3
+
+    assert isinstance(eq('a', 1) | gt('b', 2) | is_none('c'), Or)
+    assert len((eq('a', 1) | gt('b', 2) | is_none('c')).operands) == 3
+    assert isinstance(~eq('a', 1), Not)
+
+    assert repr(or_(eq('a', 1), ~between('b', 1, 2, inclusive='left'))) == "or_(eq('a', 1), not_(between('b', 1, 2, inclusive='left')))"
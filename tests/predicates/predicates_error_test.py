@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from ext_list.predicates import and_
+from ext_list.predicates import between
+from ext_list.predicates import eq
+from ext_list.predicates import not_
+from ext_list.predicates import or_
+from ext_list.predicates import regex
+
+
+def test_raise_value_error_by_no_operands():
+    with pytest.raises(ValueError):
+        and_()
+
+    with pytest.raises(ValueError):
+        or_()
+
+
+def test_raise_type_error_by_non_predicate_operand():
+    with pytest.raises(TypeError):
+        and_(eq('a', 1), True)
+
+    with pytest.raises(TypeError):
+        not_('a')
+
+
+def test_raise_value_error_by_specific_invalid_inclusive():
+    with pytest.raises(ValueError):
+        between('a', 1, 2, inclusive='all')
+
+
+def test_raise_re_error_by_invalid_pattern():
+    with pytest.raises(re.error):
+        regex('a', '(')
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': i % 5, 'b': i, 'c': str(i)} for i in range(50)])
+
+    assert ext_list_1.query().equal('a', 2).greater('b', 10).not_in_('b', [12, 17]).collect() == \
+        ext_list_1.equal('a', 2).greater('b', 10).not_in_('b', [12, 17])
+    assert ext_list_1.query().between('b', 5, 20, inclusive='left').in_('a', (1, 3)).extract('c').collect() == \
+        ext_list_1.between('b', 5, 20, inclusive='left').in_('a', (1, 3)).extract('c')
+    assert ext_list_1.query().less('b', 20).extract('b').greater(int.bit_length, 4).collect() == [16, 17, 18, 19]
+    assert ext_list_1.query().less_or_equal('b', 8).to_dict('a') == ext_list_1.less_or_equal('b', 8).to_dict('a')
+    assert ext_list_1.query().not_equal('a', 0).group_by_key('a') == ext_list_1.not_equal('a', 0).group_by_key('a')
+    assert ext_list_1.query().equal('a', 4).to_dict_list(['b']) == ext_list_1.equal('a', 4).to_dict_list(['b'])
+    assert ext_list_1.query().startswith('c', '1').regex('c', '[05]$').collect() == ext_list_1.startswith('c', '1').regex('c', '[05]$')
+
+    ext_list_3 = ExtList([{'a': None, 'b': 1}, {'a': 1, 'b': 2}, {'a': None, 'b': 3}])
+    assert ext_list_3.query().is_none('a').greater('b', 1).collect() == [{'a': None, 'b': 3}]
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    charlie = Person(name='charlie', age=35)
+    ext_list_2 = ExtList([alice, bob, charlie])
+
+    assert ext_list_2.query().greater(Person.age, 25).not_equal('name', 'charlie').collect() == [bob]
+    assert ext_list_2.query().greater_or_equal(Person.get_age_n_years_ago, 25, 5).extract(Person.introduce).collect() == [
+        'bob is 30 years old.', 'charlie is 35 years old.',
+    ]
+    assert ext_list_2.query().extract(Person.age).map(float).collect() == [25.0, 30.0, 35.0]
+
+
+def test_use_index_for_leading_filter():
+    ext_list_1 = ExtList([{'a': i % 5, 'b': i} for i in range(20)])
+    ext_list_1.create_index('a')
+
+    assert ext_list_1.query().equal('a', 1).less('b', 10).collect() == [{'a': 1, 'b': 1}, {'a': 1, 'b': 6}]
+
+
+def test_return_new_list():
+    ext_list_1 = ExtList([1, 2, 3])
+    collected = ext_list_1.query().collect()
+
+    assert collected == ext_list_1
+    assert collected is not ext_list_1
+    assert ExtList().query().equal('a', 1).collect() == []
+
+
+def test_skip_keys_of_filters_no_element_reaches():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}])
+
+    assert ext_list_1.query().equal('a', 3).equal('missing', 1).collect() == []
+
+
+def test_call_keys_once_per_element():
+    calls = []
+
+    def value(number):
+        calls.append(number)
+        return [number] if number % 2 else number
+
+    assert ExtList([1, 2, 3, 4]).query().greater(int.real, 1).in_(value, [[3], 4]).collect() == [3, 4]
+    assert calls == [2, 3, 4]
+
+    calls.clear()
+    assert ExtList([1, 2, 3, 4]).query().not_in_(value, ([1], 2)).less(int.real, 4).collect() == [3]
+    assert calls == [1, 2, 3, 4]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    ext_list_1 = ExtList([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}])
+
+    with pytest.raises(KeyError):
+        ext_list_1.query().equal('a', 1).equal('c', 1).collect()
+
+
+def test_raise_attribute_error_by_specific_invalid_attribute():
+    ext_list_1 = ExtList([Person(name='alice', age=25)])
+
+    with pytest.raises(AttributeError):
+        ext_list_1.query().equal('hello', 'hello').collect()
+
+
+def test_raise_value_error_by_specific_invalid_inclusive():
+    ext_list_1 = ExtList([{'a': 1}])
+
+    with pytest.raises(ValueError):
+        ext_list_1.query().between('a', 1, 2, inclusive='all')
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import re
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': 'apple'}, {'a': 'Banana'}, {'a': 'cherry'}])
+    assert ext_list_1.regex('a', 'an') == [{'a': 'Banana'}]
+    assert ext_list_1.regex('a', '^b', flags=re.IGNORECASE) == [{'a': 'Banana'}]
+    assert ext_list_1.regex('a', re.compile('e$|rr')) == [{'a': 'apple'}, {'a': 'cherry'}]
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    ext_list_2 = ExtList([alice, bob])
+    assert ext_list_2.regex(Person.introduce, r'\b30\b') == [bob]
+    assert ExtList().regex('a', 'b') == []
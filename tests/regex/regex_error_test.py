@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from ext_list import ExtList
+
+
+def test_raise_re_error_by_invalid_pattern():
+    with pytest.raises(re.error):
+        ExtList([{'a': 'apple'}]).regex('a', '(')
+
+    with pytest.raises(re.error):
+        ExtList().regex('a', '(')
+
+
+def test_raise_type_error_by_non_str_value():
+    with pytest.raises(TypeError):
+        ExtList([{'a': 1}]).regex('a', '1')
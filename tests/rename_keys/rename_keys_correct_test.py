@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import UserDict
+
 from ext_list import ExtList
 
 
@@ -9,3 +11,62 @@ def test():
 
     ext_list_2 = ExtList([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
     assert ext_list_2.rename_keys({2: 0}) == [[3, 2], [6, 5], [9, 8]]
+
+
+def test_inplace():
+    rows = [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+    ext_list_1 = ExtList(rows)
+
+    assert ext_list_1.rename_keys({'a': 'c'}, inplace=True) is ext_list_1
+    assert ext_list_1 == [{'b': 2, 'c': 1}, {'b': 4, 'c': 3}]
+    assert ext_list_1[0] is rows[0]
+
+    ext_list_2 = ExtList([[1, 2, 3], [4, 5, 6]])
+    ext_list_2.rename_keys({2: 0}, inplace=True)
+    assert ext_list_2 == [[3, 2], [6, 5]]
+
+
+def test_inplace_empty():
+    ext_list_1 = ExtList()
+
+    assert ext_list_1.rename_keys({'a': 'c'}, inplace=True) is ext_list_1
+
+
+def test_view():
+    rows = [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+    ext_list_1 = ExtList(rows).rename_keys({'a': 'c'}, view=True)
+
+    assert ext_list_1 == [{'c': 1, 'b': 2}, {'c': 3, 'b': 4}]
+    assert list(ext_list_1[0]) == ['b', 'c']
+    assert 'a' not in ext_list_1[0]
+    assert rows == [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+
+
+def test_view_follows_renames_in_turn():
+    row = {'a': 1, 'b': 2, 'c': 3}
+
+    for rename_keys in ({'a': 'b'}, {'a': 'b', 'b': 'c'}, {'a': 'b', 'b': 'a'}, {'a': 'a'}):
+        assert ExtList([row]).rename_keys(rename_keys, view=True) == ExtList([row]).rename_keys(rename_keys)
+
+
+def test_view_matches_eager_key_order():
+    rows = [{'a': 1, 'b': 2, 'c': 3}, {'c': 4, 'a': 5}, {'b': 6, 'c': 7, 'd': 8}]
+
+    for rename_keys in ({'c': 'a'}, {'c': 'b', 'b': 'd'}, {'c': 'e', 'e': 'a'}, {'c': 'c'}):
+        viewed = ExtList(rows).rename_keys(rename_keys, view=True)
+        renamed = ExtList(rows).rename_keys(rename_keys)
+
+        assert [list(view.items()) for view in viewed] == [list(row.items()) for row in renamed]
+        assert [len(view) for view in viewed] == [len(row) for row in renamed]
+
+
+def test_shallow_copy():
+    nested = [1]
+    rows = [UserDict({'a': nested})]
+    ext_list_1 = ExtList(rows).rename_keys({'a': 'b'})
+
+    assert ext_list_1 == [{'b': [1]}]
+    assert ext_list_1[0]['b'] is nested
+    assert rows[0] == {'a': [1]}
+
+    assert ExtList(rows).rename_keys({'a': 'b'}, deep=True)[0]['b'] is not nested
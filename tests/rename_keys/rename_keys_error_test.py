@@ -13,6 +13,16 @@ def test_raise_key_error_by_specific_invalid_key():
         ext_list_1.rename_keys({'b': 'c'})
 
 
+def test_raise_key_error_by_viewing_missing_key():
+    ext_list_1 = ExtList([{'a': 1, 'b': 2}, {'b': 3}])
+
+    with pytest.raises(KeyError):
+        ext_list_1.rename_keys({'a': 'c'}, view=True)
+
+    with pytest.raises(KeyError):
+        ext_list_1.rename_keys({'b': 'c', 'a': 'd'}, view=True)
+
+
 def test_raise_index_error_by_specific_invalid_index():
     ext_list_1 = ExtList([[1, 2], [3, 4], [5, 6]])
 
@@ -26,3 +36,17 @@ def test_raise_type_error_by_not_indexable_object():
     ext_list_1 = ExtList([alice])
     with pytest.raises(TypeError):
         ext_list_1.rename_keys({})
+
+
+def test_raise_type_error_by_viewing_not_mapping_object():
+    ext_list_1 = ExtList([[1, 2], [3, 4]])
+
+    with pytest.raises(TypeError):
+        ext_list_1.rename_keys({0: 1}, view=True)
+
+
+def test_raise_value_error_by_inplace_view():
+    ext_list_1 = ExtList([{'a': 1}])
+
+    with pytest.raises(ValueError):
+        ext_list_1.rename_keys({'a': 'b'}, inplace=True, view=True)
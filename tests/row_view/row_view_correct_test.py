@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list import RowView
+
+
+def test():
+    row = {'a': 1, 'b': 2}
+    view = ExtList([row]).rename_keys({'a': 'c'}, view=True)[0]
+
+    assert isinstance(view, RowView)
+    assert len(view) == 2
+    assert view.get('a') is None
+    assert view['c'] == 1
+    assert repr(view) == "{'b': 2, 'c': 1}"
+
+
+def test_copy_on_write():
+    row = {'a': 1, 'b': 2}
+    view = ExtList([row]).map_for_keys(['a'], lambda value: value * 10, view=True)[0]
+
+    view['b'] = 3
+    del view['a']
+
+    assert view == {'b': 3}
+    assert row == {'a': 1, 'b': 2}
+
+    row['b'] = 4
+
+    assert view == {'b': 3}
+
+
+def test_read_through_before_write():
+    row = {'a': 1}
+    view = ExtList([row]).rename_keys({'a': 'b'}, view=True)[0]
+
+    row['a'] = 2
+
+    assert view == {'b': 2}
+
+
+def test_materialize():
+    row = {'a': 1}
+    view = ExtList([row]).rename_keys({'a': 'b'}, view=True)[0]
+    materialized = view.materialize()
+
+    assert materialized == {'b': 1}
+    assert view.materialize() is materialized
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list import instrument
+from ext_list.index import SORT_KEY_CACHE_SIZE
+from ext_list.index import SORT_KEYS
+from tests.conftest import Person
+
+
+def test():
+    bob = Person(name='bob', age=30)
+    alice = Person(name='alice', age=30)
+    charlie = Person(name='charlie', age=25)
+
+    ext_list_1 = ExtList([bob, alice, charlie])
+    ext_list_1.sort_by(Person.age)
+    assert ext_list_1 == [charlie, bob, alice]
+
+    ext_list_1.sort_by([Person.age, 'name'], reverse=[True, False])
+    assert ext_list_1 == [alice, bob, charlie]
+
+    ext_list_1.sort_by([Person.age, Person.name], reverse=True)
+    assert ext_list_1 == [bob, alice, charlie]
+
+    ext_list_1.sort_by(Person.get_age_n_years_ago, arg_tuples=[(5,)])
+    assert ext_list_1 == [charlie, bob, alice]
+
+    ext_list_2 = ExtList([[2, 'b'], [1, 'c'], [2, 'a']])
+    ext_list_2.sort_by([0, 1], reverse=[False, True])
+    assert ext_list_2 == [[1, 'c'], [2, 'b'], [2, 'a']]
+
+    rows = [{'a': i % 3, 'b': -i} for i in range(30)]
+    ext_list_3 = ExtList(rows)
+    ext_list_3.sort_by(['a', 'b'], reverse=[True, False])
+    assert ext_list_3 == sorted(rows, key=lambda row: (-row['a'], row['b']))
+
+
+def test_sort_keys_are_cached():
+    calls = []
+
+    def key(value):
+        calls.append(value)
+        return -value
+
+    ext_list_1 = ExtList([3, 1, 2])
+    ext_list_1.sort_by(key, cache=True)
+    assert ext_list_1 == [3, 2, 1]
+    assert len(calls) == 3
+
+    ext_list_1.sort_by(key, reverse=True, cache=True)
+    assert ext_list_1 == [1, 2, 3]
+    assert len(calls) == 3
+
+    ext_list_1.append(0)
+    ext_list_1.sort_by(key, cache=True)
+    assert ext_list_1 == [3, 2, 1, 0]
+    assert len(calls) == 4
+
+    ext_list_1.insert(0, 5)
+    ext_list_1.sort_by(key, cache=True)
+    assert ext_list_1 == [5, 3, 2, 1, 0]
+    assert len(calls) == 9
+
+
+def test_sort_keys_are_not_cached_by_default():
+    ext_list_1 = ExtList([{'a': 3}, {'a': 1}, {'a': 2}])
+    ext_list_1.sort_by('a')
+    ext_list_1[0]['a'] = 10
+    ext_list_1.sort_by('a')
+
+    assert ext_list_1 == [{'a': 2}, {'a': 3}, {'a': 10}]
+
+
+def test_sort_key_caches_are_bounded():
+    ext_list_1 = ExtList([3, 1, 2])
+    keys = [lambda value, offset=offset: value + offset for offset in range(SORT_KEY_CACHE_SIZE + 3)]
+
+    for key in keys:
+        ext_list_1.sort_by(key, cache=True)
+
+    ext_list_1.sort_by(keys[-SORT_KEY_CACHE_SIZE], cache=True)
+    ext_list_1.sort_by(keys[0], cache=True)
+    cached = [identity[0] for identity, index in ext_list_1._indexes.items() if index.kind == SORT_KEYS]
+
+    assert len(cached) == SORT_KEY_CACHE_SIZE
+    assert cached[-2:] == [(keys[-SORT_KEY_CACHE_SIZE],), (keys[0],)]
+    assert ext_list_1 == [1, 2, 3]
+
+
+def test_sort_by_updates_indexes():
+    ext_list_1 = ExtList([{'a': 3}, {'a': 1}, {'a': 2}])
+    ext_list_1.create_index('a')
+    ext_list_1.sort_by('a')
+
+    assert ext_list_1.equal('a', 3) == [{'a': 3}]
+    assert ext_list_1.to_dict('a') == {1: {'a': 1}, 2: {'a': 2}, 3: {'a': 3}}
+
+
+def test_sort_by_with_sorted_index(instrumented):
+    ext_list_1 = ExtList([{'a': 3, 'b': 0}, {'a': 1, 'b': 1}, {'a': 3, 'b': 2}])
+    ext_list_1.create_index('a', kind='sorted')
+
+    assert ext_list_1.sorted_by('a') == [{'a': 1, 'b': 1}, {'a': 3, 'b': 0}, {'a': 3, 'b': 2}]
+    assert instrument.FAST_PATH_COUNTS['sorted_index'] == 1
+
+
+def test_sort_by_empty():
+    ext_list_1 = ExtList()
+    ext_list_1.sort_by('a')
+
+    assert ext_list_1 == []
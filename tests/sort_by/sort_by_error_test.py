@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+
+
+def test_raise_value_error_by_specific_invalid_reverse():
+    with pytest.raises(ValueError):
+        ExtList([{'a': 1, 'b': 2}]).sort_by(['a', 'b'], reverse=[True])
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    with pytest.raises(KeyError):
+        ExtList([{'a': 1}]).sort_by('b')
+
+
+def test_raise_type_error_by_incomparable_values():
+    with pytest.raises(TypeError):
+        ExtList([{'a': 1}, {'a': 'x'}]).sort_by('a')
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    bob = Person(name='bob', age=30)
+    alice = Person(name='alice', age=30)
+    charlie = Person(name='charlie', age=25)
+    ext_list_1 = ExtList([bob, alice, charlie])
+
+    assert ext_list_1.sorted_by('age') == [charlie, bob, alice]
+    assert ext_list_1.sorted_by(['age', Person.name], reverse=[True, False]) == [alice, bob, charlie]
+    assert ext_list_1 == [bob, alice, charlie]
+    assert isinstance(ext_list_1.sorted_by('age'), ExtList)
+    assert ExtList().sorted_by('age') == []
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': 'apple'}, {'a': 'banana'}, {'a': 'apricot'}])
+    assert ext_list_1.startswith('a', 'ap') == [{'a': 'apple'}, {'a': 'apricot'}]
+    assert ext_list_1.startswith('a', ('b', 'apr')) == [{'a': 'banana'}, {'a': 'apricot'}]
+    assert ext_list_1.startswith('a', 'c') == []
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    ext_list_2 = ExtList([alice, bob])
+    assert ext_list_2.startswith(Person.name, 'b') == [bob]
+    assert ext_list_2.startswith(Person.introduce, 'alice') == [alice]
+    assert ExtList().startswith('a', 'b') == []
+
+
+def test_inplace():
+    ext_list_1 = ExtList([{'a': 'apple'}, {'a': 'banana'}])
+    assert ext_list_1.startswith('a', 'b', inplace=True) is ext_list_1
+    assert ext_list_1 == [{'a': 'banana'}]
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+
+
+def test_raise_attribute_error_by_non_str_value():
+    ext_list_1 = ExtList([{'a': 1}])
+
+    with pytest.raises(AttributeError):
+        ext_list_1.startswith('a', '1')
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    ext_list_1 = ExtList([{'a': 'apple'}])
+
+    with pytest.raises(KeyError):
+        ext_list_1.startswith('b', 'a')
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list import ExtStream
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': i % 4, 'b': i} for i in range(20)])
+
+    assert ext_list_1.stream().equal('a', 1).collect() == ext_list_1.equal('a', 1)
+    assert ext_list_1.stream().not_equal('a', 1).collect() == ext_list_1.not_equal('a', 1)
+    assert ext_list_1.stream().greater('b', 5).less('b', 9).collect() == ext_list_1.greater('b', 5).less('b', 9)
+    assert ext_list_1.stream().greater_or_equal('b', 5).less_or_equal('b', 9).collect() == ext_list_1.greater_or_equal('b', 5).less_or_equal('b', 9)
+    assert ext_list_1.stream().in_('a', [0, 3]).collect() == ext_list_1.in_('a', [0, 3])
+    assert ext_list_1.stream().not_in_('a', [0, 3]).collect() == ext_list_1.not_in_('a', [0, 3])
+    assert ext_list_1.stream().between('b', 3, 6, inclusive='right').extract('b').collect() == [4, 5, 6]
+    assert ext_list_1.stream().to_dict('a') == ext_list_1.to_dict('a')
+    assert ext_list_1.stream().group_by_key('a') == ext_list_1.group_by_key('a')
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    ext_list_2 = ExtList([alice, bob])
+    assert ext_list_2.stream().equal(Person.get_age_n_years_ago, 25, 5).extract('name').collect() == ['bob']
+    assert ext_list_2.stream().extract(Person.age).map(float).collect() == [25.0, 30.0]
+
+
+def test_stream_over_generator():
+    consumed: list[int] = []
+
+    def rows():
+        for i in range(10):
+            consumed.append(i)
+            yield {'a': i}
+
+    iterator = iter(ExtStream(rows()).greater('a', 2).extract('a'))
+
+    assert next(iterator) == 3
+    assert consumed == [0, 1, 2, 3]
+    assert list(iterator) == [4, 5, 6, 7, 8, 9]
+
+
+def test_empty_stream():
+    assert ExtStream([]).equal('missing', 1).collect() == []
+    assert ExtStream(iter([])).to_dict('missing') == {}
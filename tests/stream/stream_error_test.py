@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtStream
+from tests.conftest import Person
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    with pytest.raises(KeyError):
+        ExtStream([{'a': 1}]).equal('b', 1).collect()
+
+
+def test_raise_attribute_error_by_specific_invalid_attribute():
+    with pytest.raises(AttributeError):
+        ExtStream([Person(name='alice', age=25)]).equal('hello', 1).collect()
+
+
+def test_raise_value_error_by_specific_invalid_inclusive():
+    with pytest.raises(ValueError):
+        ExtStream([{'a': 1}]).between('a', 1, 2, inclusive='all')
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from array import array
+
+from ext_list import ColumnarExtList
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': i % 3, 'b': i * 0.5, 'c': str(i)} for i in range(10)])
+    columnar = ext_list_1.to_columnar()
+
+    assert len(columnar) == 10
+    assert columnar.column_names == ('a', 'b', 'c')
+    assert isinstance(columnar.column('a'), array)
+    assert isinstance(columnar.column('b'), array)
+    assert isinstance(columnar.column('c'), list)
+    assert list(columnar) == ext_list_1
+    assert columnar[3] == ext_list_1[3]
+    assert list(columnar[2:4]) == ext_list_1[2:4]
+
+    assert columnar.equal('a', 1).to_dict_list() == ext_list_1.equal('a', 1)
+    assert columnar.not_equal('a', 1).to_dict_list() == ext_list_1.not_equal('a', 1)
+    assert columnar.greater('b', 2).to_dict_list() == ext_list_1.greater('b', 2)
+    assert columnar.greater_or_equal('b', 2).to_dict_list() == ext_list_1.greater_or_equal('b', 2)
+    assert columnar.less('c', '3').to_dict_list() == ext_list_1.less('c', '3')
+    assert columnar.less_or_equal('c', '3').to_dict_list() == ext_list_1.less_or_equal('c', '3')
+    assert columnar.in_('a', [0, 2]).to_dict_list() == ext_list_1.in_('a', [0, 2])
+    assert columnar.not_in_('c', ['1', '2']).to_dict_list() == ext_list_1.not_in_('c', ['1', '2'])
+    assert columnar.greater('a', 0).less('b', 3).extract('c') == ['1', '2', '4', '5']
+    assert columnar.to_dict_list(['c', 'a'])[1] == {'c': '1', 'a': 1}
+
+    groups = columnar.group_by_key('a')
+    assert list(groups) == [0, 1, 2]
+    assert {key: group.to_dict_list() for key, group in groups.items()} == ext_list_1.group_by_key('a')
+    assert isinstance(groups[0].column('a'), array)
+
+
+def test_to_columnar_with_keys():
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    ext_list_1 = ExtList([alice, bob])
+
+    columnar = ext_list_1.to_columnar([Person.name, 'age', Person.get_age_n_years_ago], [(), (), (5,)])
+    assert columnar.column_names == ('name', 'age', 'get_age_n_years_ago')
+    assert columnar.equal(Person.age, 30).to_dict_list() == [{'name': 'bob', 'age': 30, 'get_age_n_years_ago': 25}]
+
+    assert ExtList([[1, 'x'], [2, 'y']]).to_columnar([0, 1]).extract(1) == ['x', 'y']
+
+
+def test_column_types():
+    assert isinstance(ColumnarExtList({'a': [True, False]}).column('a'), list)
+    assert isinstance(ColumnarExtList({'a': [1, 2.0]}).column('a'), list)
+    assert isinstance(ColumnarExtList({'a': [2 ** 70, 1]}).column('a'), list)
+    assert ColumnarExtList({'a': [2 ** 70, 1]}).greater('a', 1).extract('a') == [2 ** 70]
+
+
+def test_empty():
+    assert len(ExtList().to_columnar()) == 0
+    assert ExtList().to_columnar(['a']).column_names == ('a',)
+    assert ExtList([{'a': 1}]).to_columnar().equal('a', 2).to_dict_list() == []
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ColumnarExtList
+from ext_list import ExtList
+from tests.conftest import Person
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    with pytest.raises(KeyError):
+        ExtList([{'a': 1}]).to_columnar().equal('b', 1)
+
+
+def test_raise_key_error_by_specific_missing_key():
+    with pytest.raises(KeyError):
+        ExtList([{'a': 1}, {'b': 1}]).to_columnar()
+
+
+def test_raise_value_error_by_objects_without_keys():
+    with pytest.raises(ValueError):
+        ExtList([Person(name='alice', age=25)]).to_columnar()
+
+
+def test_raise_value_error_by_columns_of_different_lengths():
+    with pytest.raises(ValueError):
+        ColumnarExtList({'a': [1, 2], 'b': [1]})
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from ext_list import ExtList
+from ext_list import RowPlan
+from tests.conftest import Member
 from tests.conftest import Person
 
 
@@ -32,3 +34,46 @@ def test_reference_method_descriptor():
     ext_list_1 = ExtList([1, 2, 3])
 
     assert ext_list_1.to_dict_list([int.bit_length]) == [{'bit_length': 1}, {'bit_length': 2}, {'bit_length': 2}]
+
+
+def test_reuse_row_plan():
+    ext_list_1 = ExtList([{'a': 1, 'b': 4}, {'a': 2, 'b': 5}])
+    plan = RowPlan.compile(ext_list_1, ['b'])
+
+    assert plan.columns == ('b',)
+    assert ext_list_1.to_dict_list(plan) == [{'b': 4}, {'b': 5}]
+    assert ExtList([{'a': 3, 'b': 6}]).to_dict_list(plan) == [{'b': 6}]
+    assert RowPlan.compile(ext_list_1, ['b']) is plan
+
+
+def test_view():
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    ext_list_1 = ExtList([alice, bob]).to_dict_list([Person.name, Person.get_age_n_years_ago], [(), (5,)], view=True)
+
+    assert ext_list_1 == [{'name': 'alice', 'get_age_n_years_ago': 20}, {'name': 'bob', 'get_age_n_years_ago': 25}]
+    assert ext_list_1.equal('name', 'bob') == [{'name': 'bob', 'get_age_n_years_ago': 25}]
+
+
+def test_reference_dataclass_field_with_default():
+    ext_list_1 = ExtList([Member('alice'), Member('bob', team='t2', score=3)])
+
+    assert ext_list_1.to_dict_list(['name', 'team', 'score']) == [
+        {'name': 'alice', 'team': 't1', 'score': 0},
+        {'name': 'bob', 'team': 't2', 'score': 3},
+    ]
+
+
+def test_cache_row_plan_arguments_by_type():
+    class Labelled:
+        def __init__(self, name: str):
+            self.name = name
+
+        def label(self, suffix: object) -> str:
+            return f'{self.name}-{suffix}'
+
+    ext_list_1 = ExtList([Labelled('a'), Labelled('b')])
+
+    assert ext_list_1.to_dict_list([Labelled.label], [(1,)]) == [{'label': 'a-1'}, {'label': 'b-1'}]
+    assert ext_list_1.to_dict_list([Labelled.label], [(True,)]) == [{'label': 'a-True'}, {'label': 'b-True'}]
+    assert ext_list_1.sorted_by([Labelled.label], arg_tuples=[(1.0,)]).to_dict_list([Labelled.label], [(1.0,)]) == [{'label': 'a-1.0'}, {'label': 'b-1.0'}]
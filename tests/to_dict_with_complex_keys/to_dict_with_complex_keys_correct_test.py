@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from ext_list import ExtList
+from ext_list import RowPlan
+from tests.conftest import Member
 from tests.conftest import Person
 
 
@@ -59,3 +61,21 @@ def test_to_dict_with_complex_keys():
         ('bob', 'bob is 30 years old.', 25): bob,
         ('charlie', 'charlie is 35 years old.', 30): charlie,
     }
+
+
+def test_reuse_row_plan():
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    ext_list_1 = ExtList([alice, bob])
+    plan = RowPlan.compile(ext_list_1, [Person.name, Person.get_age_n_years_ago], [(), (5,)])
+
+    assert ext_list_1.to_dict_with_complex_keys(plan) == {('alice', 20): alice, ('bob', 25): bob}
+    assert ExtList([bob]).to_dict_with_complex_keys(plan) == {('bob', 25): bob}
+
+
+def test_reference_dataclass_field_with_default():
+    alice = Member('alice')
+    bob = Member('bob', team='t2', score=3)
+    ext_list_1 = ExtList([alice, bob])
+
+    assert ext_list_1.to_dict_with_complex_keys(['team', 'score']) == {('t1', 0): alice, ('t2', 3): bob}
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list import ExtStream
+from tests.conftest import Person
+
+
+def test():
+    rows = [{'a': i % 7, 'b': i} for i in range(50)]
+    ext_list_1 = ExtList(rows)
+
+    assert ext_list_1.top_k('a', 5) == sorted(rows, key=lambda row: row['a'], reverse=True)[:5]
+    assert ext_list_1.top_k('a', 100) == sorted(rows, key=lambda row: row['a'], reverse=True)
+    assert ext_list_1.top_k('a', 0) == []
+    assert ExtList().top_k('a', 3) == []
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    charlie = Person(name='charlie', age=35)
+    ext_list_2 = ExtList([bob, charlie, alice])
+    assert ext_list_2.top_k(Person.age, 2) == [charlie, bob]
+    assert ext_list_2.top_k(Person.get_age_n_years_ago, 1, 5) == [charlie]
+    assert ext_list_2.top_k('name', 1) == [charlie]
+
+
+def test_stream():
+    assert ExtStream({'a': i % 7, 'b': i} for i in range(50)).top_k('a', 3) == [{'a': 6, 'b': 6}, {'a': 6, 'b': 13}, {'a': 6, 'b': 20}]
+    assert ExtStream(iter([])).top_k('a', 3) == []
+    assert ExtStream([{'a': 1}]).top_k('a', 0) == []
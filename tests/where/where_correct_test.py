@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from ext_list import ExtList
+from ext_list import instrument
+from ext_list.predicates import and_
+from ext_list.predicates import between
+from ext_list.predicates import eq
+from ext_list.predicates import ge
+from ext_list.predicates import gt
+from ext_list.predicates import in_
+from ext_list.predicates import is_none
+from ext_list.predicates import le
+from ext_list.predicates import lt
+from ext_list.predicates import ne
+from ext_list.predicates import not_
+from ext_list.predicates import not_in_
+from ext_list.predicates import or_
+from ext_list.predicates import regex
+from ext_list.predicates import startswith
+from tests.conftest import Person
+
+
+def test():
+    ext_list_1 = ExtList([{'a': i % 5, 'b': i, 'c': str(i)} for i in range(50)])
+
+    assert ext_list_1.where(and_(eq('a', 2), gt('b', 10), not_in_('b', [12, 17]))) == ext_list_1.equal('a', 2).greater('b', 10).not_in_('b', [12, 17])
+    assert ext_list_1.where(and_(ge('b', 5), lt('b', 20), in_('a', (1, 3)))) == ext_list_1.between('b', 5, 20, inclusive='left').in_('a', (1, 3))
+    assert ext_list_1.where(or_(le('b', 2), eq('b', 49))) == [ext_list_1[0], ext_list_1[1], ext_list_1[2], ext_list_1[49]]
+    assert ext_list_1.where(not_(ne('a', 0))) == ext_list_1.equal('a', 0)
+    assert ext_list_1.where(and_(between('b', 10, 20, inclusive='neither'), startswith('c', '1'), regex('c', '[05]$'))) == [ext_list_1[15]]
+    assert ext_list_1.where(eq('a', 3) & ~(lt('b', 20) | gt('b', 30))) == ext_list_1.equal('a', 3).between('b', 20, 30)
+
+    alice = Person(name='alice', age=25)
+    bob = Person(name='bob', age=30)
+    charlie = Person(name='charlie', age=35)
+    ext_list_2 = ExtList([alice, bob, charlie])
+
+    assert ext_list_2.where(or_(eq(Person.name, 'alice'), gt(Person.get_age_n_years_ago, 28, 5))) == [alice, charlie]
+    assert ext_list_2.where(and_(ge(Person.age, 30), eq('introduce', 'bob is 30 years old.'))) == [bob]
+    assert ExtList([{'a': None}, {'a': 1}]).where(is_none('a')) == [{'a': None}]
+    assert ExtList().where(eq('a', 1)) == []
+
+
+def test_short_circuit():
+    calls = []
+
+    def record(value: int) -> int:
+        calls.append(value)
+        return value
+
+    ext_list_1 = ExtList([1, 2, 3])
+
+    assert ext_list_1.where(and_(eq(record, 3), gt(int.real, 1))) == [3]
+    assert calls == [2, 3]
+
+    calls.clear()
+    assert ext_list_1.where(or_(eq(record, 2), le(int.real, 1))) == [1, 2]
+    assert calls == [2, 3]
+
+
+def test_use_index(instrumented):
+    ext_list_1 = ExtList([{'a': i % 5, 'b': i} for i in range(50)])
+    ext_list_1.create_index('a')
+
+    assert ext_list_1.where(and_(gt('b', 40), eq('a', 2))) == [{'a': 2, 'b': 42}, {'a': 2, 'b': 47}]
+    assert ext_list_1.where(in_('a', [4, 0])) == ext_list_1.in_('a', [0, 4])
+    assert instrument.FAST_PATH_COUNTS['hash_index'] == 3
+
+    ext_list_1.create_index('b', kind='sorted')
+    assert ext_list_1.where(and_(ne('a', 2), between('b', 40, 43))) == [{'a': 0, 'b': 40}, {'a': 1, 'b': 41}, {'a': 3, 'b': 43}]
+    assert instrument.FAST_PATH_COUNTS['sorted_index'] == 1
+
+
+def test_use_probe_set_for_membership():
+    ext_list_1 = ExtList([{'a': [1]}, {'a': [2]}, {'a': 3}])
+
+    assert ext_list_1.where(in_('a', [[1], 3])) == [{'a': [1]}, {'a': 3}]
+    assert ext_list_1.where(not_in_('a', ([2],))) == [{'a': [1]}, {'a': 3}]
+
+
+def test_call_keys_once_per_element():
+    calls = []
+
+    def value(number):
+        calls.append(number)
+        return [number] if number % 2 else number
+
+    assert ExtList([1, 2, 3, 4]).where(and_(gt(int.real, 1), in_(value, [[3], 4]))) == [3, 4]
+    assert calls == [2, 3, 4]
+
+    calls.clear()
+    assert ExtList([1, 2, 3, 4]).where(not_in_(value, ([1], 2))) == [3, 4]
+    assert calls == [1, 2, 3, 4]
+
+
+def test_inplace():
+    ext_list_1 = ExtList([{'a': 1}, {'a': 2}, {'a': 3}])
+
+    assert ext_list_1.where(or_(eq('a', 1), eq('a', 3)), inplace=True) is ext_list_1
+    assert ext_list_1 == [{'a': 1}, {'a': 3}]
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+
+from ext_list import ExtList
+from ext_list.predicates import eq
+
+
+def test_raise_type_error_by_non_predicate():
+    with pytest.raises(TypeError):
+        ExtList([{'a': 1}]).where(lambda element: element['a'] == 1)
+
+    with pytest.raises(TypeError):
+        ExtList().where(True)
+
+
+def test_raise_key_error_by_specific_invalid_key():
+    with pytest.raises(KeyError):
+        ExtList([{'a': 1}]).where(eq('b', 1))